@@ -0,0 +1,97 @@
+"""Measures the parsing time of the html files in the test data folder.
+
+Run from the repository root:
+
+    python evaluation/benchmark.py --repeat 5
+    python evaluation/benchmark.py --profile all --profile triage --profile text
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import newspaper
+
+DATA_FOLDER = Path(__file__).parent.parent / "tests" / "data"
+
+# Article fields extracted by parse() (see Configuration.extract_fields)
+PROFILES = {
+    "all": None,
+    "triage": ["title", "publish_date", "canonical_link"],
+    "text": ["text"],
+    "metadata": ["title", "authors", "publish_date", "canonical_link", "meta_description", "meta_keywords"],
+}
+
+
+def load_documents(data_folder: Path, pattern: str):
+    documents = []
+    for html_file in sorted((data_folder / "html").glob(pattern)):
+        metadata_file = data_folder / "metadata" / f"{html_file.stem}.json"
+        metadata = json.loads(metadata_file.read_text(encoding="utf-8")) if metadata_file.exists() else {}
+        documents.append(
+            (
+                html_file.stem,
+                metadata.get("url", f"https://example.com/{html_file.stem}.html"),
+                metadata.get("language") or "en",
+                html_file.read_text(encoding="utf-8", errors="replace"),
+            )
+        )
+    return documents
+
+
+def time_parse(url: str, language: str, html: str, repeat: int, fields: list[str] | None = None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        article = newspaper.Article(url, language=language, fetch_images=False)
+        article.download(input_html=html)
+        start = time.perf_counter()
+        article.parse(fields=fields)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args):
+    documents = load_documents(Path(args.data_folder), args.pattern)
+    # warm up: language modules, stopwords, lazy imports
+    for _, url, language, html in documents:
+        time_parse(url, language, html, 1)
+
+    profiles = {name: PROFILES[name] for name in args.profile or ["all"]}
+    if args.fields:
+        profiles["custom"] = args.fields.split(",")
+
+    for profile, fields in profiles.items():
+        total = 0.0
+        for name, url, language, html in documents:
+            elapsed = time_parse(url, language, html, args.repeat, fields)
+            total += elapsed
+            if args.verbose:
+                print(f"{name:40} {elapsed * 1000:9.1f} ms")
+
+        print(
+            f"[{profile}] Parsed {len(documents)} documents in {total:.3f} s "
+            f"({len(documents) / total:.1f} documents/s, best of {args.repeat} runs)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Article.parse() on local html files")
+    parser.add_argument(
+        "--data-folder",
+        type=str,
+        default=str(DATA_FOLDER),
+        help="Folder with the html/ and metadata/ subfolders",
+    )
+    parser.add_argument("--pattern", type=str, default="*.html", help="Glob pattern of the html files")
+    parser.add_argument("--repeat", type=int, default=3, help="Parse every file this many times, keep the best")
+    parser.add_argument("--verbose", action="store_true", help="Print the time of every file")
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=list(PROFILES),
+        help="Fields extracted by parse(), can be repeated (default: all)",
+    )
+    parser.add_argument("--fields", type=str, help="Comma separated list of fields extracted by parse()")
+
+    main(parser.parse_args())
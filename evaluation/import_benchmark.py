@@ -0,0 +1,65 @@
+"""Measures the time of ``import newspaper`` in a fresh interpreter.
+
+Run from the repository root:
+
+    python evaluation/import_benchmark.py --repeat 10 --budget 0.6
+
+Exits with status 1 if the best time is over the budget (in seconds), or if
+one of the optional heavy dependencies is imported by ``import newspaper``.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# imported on first use only, never by ``import newspaper``
+LAZY_MODULES = ["nltk", "PIL", "bs4", "feedparser", "tldextract", "dateutil", "numpy"]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import newspaper
+elapsed = time.perf_counter() - start
+print(json.dumps({"time": elapsed, "modules": [m for m in %r if m in sys.modules]}))
+"""
+
+
+def time_import() -> tuple[float, list[str]]:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT % LAZY_MODULES],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output.splitlines()[-1])
+    return result["time"], result["modules"]
+
+
+def main(args):
+    times = []
+    modules: list[str] = []
+    for _ in range(args.repeat):
+        elapsed, modules = time_import()
+        times.append(elapsed)
+        if args.verbose:
+            print(f"{elapsed * 1000:8.1f} ms")
+
+    best = min(times)
+    print(f"import newspaper: best {best * 1000:.1f} ms, worst {max(times) * 1000:.1f} ms ({args.repeat} runs)")
+    failed = False
+    if modules:
+        print(f"imported eagerly: {', '.join(modules)}")
+        failed = True
+    if args.budget is not None and best > args.budget:
+        print(f"over the budget of {args.budget * 1000:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the import time of newspaper")
+    parser.add_argument("--repeat", type=int, default=5, help="Import this many times, keep the best")
+    parser.add_argument("--budget", type=float, default=None, help="Maximum import time in seconds")
+    parser.add_argument("--verbose", action="store_true", help="Print the time of every run")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,82 @@
+"""Measures the sentence scoring of the summarizer (nlp.scored_sentences),
+with the python and the numpy implementations, on the articles of the test
+data folder. Long articles are simulated by concatenating the articles.
+
+Run from the repository root:
+
+    python evaluation/nlp_benchmark.py --repeat 5
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+import newspaper
+from newspaper import nlp, text
+
+DATA_FOLDER = Path(__file__).parent.parent / "tests" / "data"
+
+
+def load_articles(data_folder: Path, pattern: str) -> list[tuple[str, str]]:
+    articles = []
+    for html_file in sorted((data_folder / "html").glob(pattern)):
+        article = newspaper.Article("https://example.com/article.html", language="en", fetch_images=False)
+        article.download(input_html=html_file.read_text(encoding="utf-8", errors="replace"))
+        article.parse()
+        if article.text:
+            articles.append((article.title, article.text))
+    return articles
+
+
+def split_sentences(body: str) -> list[str]:
+    # the nltk punkt model is not needed for timing the scorer
+    return [s.strip() for s in re.split(r"(?<=[.!?])\s+", body) if len(s.strip()) > 10]
+
+
+def time_scorer(sentences, title_words, keywords, stopwords, use_numpy: bool, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nlp.scored_sentences(sentences, title_words, keywords, stopwords, use_numpy=use_numpy)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args):
+    stopwords = text.get_stopwords("en")
+    articles = load_articles(Path(args.data_folder), args.pattern)
+    all_sentences = [s for _, body in articles for s in split_sentences(body)]
+    title_words = stopwords.tokenizer(articles[0][0])
+    # warm up: numpy import
+    nlp.scored_sentences(all_sentences[:2], title_words, {}, stopwords, use_numpy=True)
+
+    for count in args.sentences:
+        sentences = (all_sentences * (count // len(all_sentences) + 1))[:count]
+        keywords = nlp.keywords(" ".join(sentences), stopwords, 10)
+        python_time = time_scorer(sentences, title_words, keywords, stopwords, False, args.repeat)
+        numpy_time = time_scorer(sentences, title_words, keywords, stopwords, True, args.repeat)
+        print(
+            f"{count:6} sentences: python {python_time * 1000:8.2f} ms, numpy {numpy_time * 1000:8.2f} ms "
+            f"(x{python_time / numpy_time:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the sentence scoring of the summarizer")
+    parser.add_argument(
+        "--data-folder",
+        type=str,
+        default=str(DATA_FOLDER),
+        help="Folder with the html/ subfolder",
+    )
+    parser.add_argument("--pattern", type=str, default="*.html", help="Glob pattern of the html files")
+    parser.add_argument("--repeat", type=int, default=5, help="Score the sentences this many times, keep the best")
+    parser.add_argument(
+        "--sentences",
+        type=int,
+        nargs="+",
+        default=[10, 20, 50, 100, 500, 2000],
+        help="Number of sentences of the scored articles",
+    )
+    main(parser.parse_args())
@@ -0,0 +1,74 @@
+"""Measures the speed of the default tokenizer (tokens per second) on the
+node texts and sentences of the html files in the test data folder.
+
+Run from the repository root:
+
+    python evaluation/tokenizer_benchmark.py --repeat 5
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from newspaper import parsers, text
+
+DATA_FOLDER = Path(__file__).parent.parent / "tests" / "data"
+
+
+def load_texts(data_folder: Path, pattern: str) -> tuple[list[str], list[str]]:
+    """Returns the text parts of all the elements (the strings tokenized by
+    DocumentFeatures) and the sentences of the documents.
+    """
+    node_texts = []
+    sentences = []
+    for html_file in sorted((data_folder / "html").glob(pattern)):
+        doc = parsers.fromstring(html_file.read_text(encoding="utf-8", errors="replace"))
+        if doc is None:
+            continue
+        for node in doc.iter():
+            if not isinstance(node.tag, str):
+                continue
+            parts = [node.tail] if node.tag in parsers.TEXT_EXCLUDED_TAGS else [node.text, node.tail]
+            for part in parts:
+                if part and (part := text.inner_trim(part)):
+                    node_texts.append(part)
+        body_text = parsers.get_text(doc)
+        sentences.extend(s.strip() for s in re.split(r"(?<=[.!?])\s+", body_text) if s.strip())
+    return node_texts, sentences
+
+
+def time_tokenizer(tokenize, texts: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokenize(texts)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args):
+    node_texts, sentences = load_texts(Path(args.data_folder), args.pattern)
+    tokenizers = {
+        "default_tokenizer": lambda texts: [text.default_tokenizer(t) for t in texts],
+        "default_batch_tokenizer": text.default_batch_tokenizer,
+    }
+    for name, texts in [("node texts", node_texts), ("sentences", sentences)]:
+        tokens = sum(len(t) for t in text.default_batch_tokenizer(texts))
+        print(f"{name}: {len(texts)} texts, {tokens} tokens")
+        for tokenizer_name, tokenize in tokenizers.items():
+            elapsed = time_tokenizer(tokenize, texts, args.repeat)
+            print(f"  {tokenizer_name:25} {elapsed * 1000:8.1f} ms {tokens / elapsed / 1e6:6.2f} M tokens/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the default tokenizer")
+    parser.add_argument(
+        "--data-folder",
+        type=str,
+        default=str(DATA_FOLDER),
+        help="Folder with the html/ subfolder",
+    )
+    parser.add_argument("--pattern", type=str, default="*.html", help="Glob pattern of the html files")
+    parser.add_argument("--repeat", type=int, default=5, help="Tokenize the texts this many times, keep the best")
+    main(parser.parse_args())
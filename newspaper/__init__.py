@@ -17,7 +17,7 @@
 from .api import Configuration as Config
 from .api import build, build_article, fulltext, hot, languages, popular_urls
 from .article import Article
-from .exceptions import ArticleBinaryDataException, ArticleException
+from .exceptions import ArchiveMissException, ArticleBinaryDataException, ArticleException, CircuitOpenException
 from .languages import valid_languages
 from .source import Source
 from .version import __version__
@@ -67,6 +67,8 @@ def article(url: str, language: str | None = None, **kwargs) -> Article:
     "Article",
     "ArticleException",
     "ArticleBinaryDataException",
+    "ArchiveMissException",
+    "CircuitOpenException",
     "Source",
     "__version__",
 ]
@@ -4,8 +4,6 @@
 classes and functions into simple calls.
 """
 
-import feedparser
-
 import newspaper.parsers as parsers
 from newspaper.article import Article
 from newspaper.configuration import Configuration
@@ -80,6 +78,8 @@ def popular_urls() -> list[str]:
 
 def hot():
     """Returns a list of hit terms via google trends"""
+    import feedparser  # pylint: disable=import-outside-toplevel
+
     try:
         listing = feedparser.parse(TRENDING_URL)["entries"]
         trends = [item["title"] for item in listing]
@@ -111,5 +111,5 @@ def fulltext(html: str, language: str = "en") -> str:
 
     extractor.calculate_best_node(doc)
     top_node = extractor.top_node_complemented
-    text, _ = output_formatter.get_formatted(top_node)
+    text, _ = output_formatter.get_formatted(top_node, scores=extractor.scores)
     return text
@@ -7,6 +7,7 @@
 
 import json
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
 from typing import Any, Literal, overload
@@ -17,13 +18,11 @@
 
 import newspaper.parsers as parsers
 from newspaper.exceptions import ArticleException
-from newspaper.text import StopWords
+from newspaper.text import get_stopwords
 
 from . import network, nlp, settings, urls
-from .cleaners import DocumentCleaner
 from .configuration import Configuration
 from .extractors import ContentExtractor
-from .outputformatters import OutputFormatter
 from .utils import extract_meta_refresh, get_available_languages
 
 log = logging.getLogger(__name__)
@@ -39,6 +38,82 @@
     "cert",
 ]
 
+# The extraction step of Article.parse() that sets each attribute
+EXTRACTION_FIELDS: dict[str, str] = {
+    "title": "title",
+    "authors": "authors",
+    "meta_lang": "metadata",
+    "meta_site_name": "metadata",
+    "meta_description": "metadata",
+    "canonical_link": "metadata",
+    "meta_keywords": "metadata",
+    "tags": "metadata",
+    "meta_data": "metadata",
+    "publish_date": "publish_date",
+    "top_node": "body",
+    "movies": "videos",
+    "top_image": "images",
+    "meta_img": "images",
+    "images": "images",
+    "meta_favicon": "images",
+    "text": "text",
+    "article_html": "text",
+}
+
+# The order in which Article.parse() runs the extraction steps
+EXTRACTION_STEPS = ("title", "authors", "metadata", "publish_date", "body", "videos", "images", "text")
+
+
+def extraction_steps(fields: Iterable[str] | None, config: Configuration) -> set[str]:
+    """Returns the extraction steps that :any:`Article.parse` must run to
+    get the article attributes in `fields`, including the steps they depend
+    on (the text needs the title and the top node, the top node needs the
+    metadata language, etc.).
+
+    Args:
+        fields (Iterable[str] | None): names of :any:`Article` attributes,
+            see ``EXTRACTION_FIELDS``. None for all of them.
+        config (Configuration): the configuration of the article.
+
+    Raises:
+        ValueError: if a field is not in ``EXTRACTION_FIELDS``.
+
+    Returns:
+        set[str]: the names of the steps to run
+    """
+    if fields is None:
+        return set(EXTRACTION_FIELDS.values())
+    if isinstance(fields, str):
+        fields = [fields]
+
+    unknown = [field for field in fields if field not in EXTRACTION_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown article fields: {', '.join(unknown)}. Valid fields are: {', '.join(EXTRACTION_FIELDS)}"
+        )
+
+    return _with_dependencies({EXTRACTION_FIELDS[field] for field in fields}, config)
+
+
+def _with_dependencies(steps: Iterable[str], config: Configuration) -> set[str]:
+    """Adds to `steps` the extraction steps they depend on."""
+    dependencies = {
+        # the language found in the metadata is used for the body
+        "body": ["metadata"] if config.use_meta_language else [],
+        "videos": ["body"],
+        # the top image is chosen by its distance to the top node
+        "images": ["body"] if config.fetch_images else [],
+        "text": ["title", "body"],
+    }
+    result: set[str] = set()
+    pending = list(steps)
+    while pending:
+        step = pending.pop()
+        if step not in result:
+            result.add(step)
+            pending.extend(dependencies.get(step, []))
+    return result
+
 
 class ArticleDownloadState(Enum):
     """Download state for the Article object."""
@@ -108,6 +183,11 @@ class Article:
             successful, ArticleDownloadState.FAILED_RESPONSE if `download()` failed,
             `ArticleDownloadState.NOT_STARTED` if `download()` was not called.
         download_exception_msg (str): The exception message if download() failed.
+        downloaded_bytes (int): Number of bytes of html downloaded by
+            `download()` (including the read more page, if any).
+        is_truncated (bool): True if the download was stopped at
+            `config.max_content_bytes` bytes. The article is parsed from the
+            html received until then.
         history (list[str]): Redirection history from the ``requests``.``get`` call.
         meta_description (str): The description extracted from the meta data.
         meta_lang (str): The language extracted from the meta data.
@@ -130,6 +210,12 @@ class Article:
                 is now same as :any:`Article.doc`
     """
 
+    # The extraction steps postponed by a lazy parse(). The class default is
+    # never modified, parse() assigns a new set
+    _pending_steps: set[str] = set()
+    # The og:type of the page, used by is_valid_body()
+    _meta_type: str | None = None
+
     def __init__(
         self,
         url: str,
@@ -257,6 +343,11 @@ def __init__(
         self.download_state = ArticleDownloadState.NOT_STARTED
         self.download_exception_msg: str | None = None
 
+        # Number of bytes of html downloaded, and whether the download was
+        # cut at `config`.`max_content_bytes`
+        self.downloaded_bytes = 0
+        self.is_truncated = False
+
         # Redirection history from the ``requests``.``get`` call
         self.history: list[str] | None = []
 
@@ -312,21 +403,45 @@ def _parse_scheme_http(self, url: str | None = None):
         try:
             # We do not use get_html() here because we want to be able to
             # detect protection in the response regardless of the status code
-            html, status_code, history = network.get_html_status(url or self.url, self.config)
-            self.history = [r.url for r in history]
-            if status_code >= 400:
-                self.download_state = ArticleDownloadState.FAILED_RESPONSE
-                protection = self._detect_protection(html)
-                if protection:
-                    self.download_exception_msg = f"Website protected with {protection}, url: {url}"
-                else:
-                    self.download_exception_msg = f"Status code {status_code} for url {url}"
-                return None
+            response = network.do_request(url or self.url, self.config)
+            html, status_code, history = network.get_html_status_from_response(url or self.url, self.config, response)
+        except requests.exceptions.RequestException as e:
+            self.download_state = ArticleDownloadState.FAILED_RESPONSE
+            self.download_exception_msg = str(e)
+            return None
+
+        return self._check_http_html(url, html, status_code, history, response)
+
+    async def _aparse_scheme_http(self, url: str | None = None):
+        try:
+            response = await network.ado_request(url or self.url, self.config)
+            html, status_code, history = network.get_html_status_from_response(url or self.url, self.config, response)
         except requests.exceptions.RequestException as e:
             self.download_state = ArticleDownloadState.FAILED_RESPONSE
             self.download_exception_msg = str(e)
             return None
 
+        return self._check_http_html(url, html, status_code, history, response)
+
+    def _check_http_html(self, url, html, status_code, history, response):
+        self.history = [r.url for r in history]
+        self.downloaded_bytes += len(response.content or b"")
+        if network.is_truncated(response):
+            self.is_truncated = True
+            log.warning(
+                "Download of %s stopped after %s bytes (max_content_bytes)",
+                url or self.url,
+                self.config.max_content_bytes,
+            )
+        if status_code >= 400:
+            self.download_state = ArticleDownloadState.FAILED_RESPONSE
+            protection = self._detect_protection(html)
+            if protection:
+                self.download_exception_msg = f"Website protected with {protection}, url: {url}"
+            else:
+                self.download_exception_msg = f"Status code {status_code} for url {url}"
+            return None
+
         return html
 
     def _detect_protection(self, html):
@@ -371,6 +486,8 @@ def download(
             Article: self
         """
         if input_html is None:
+            self.downloaded_bytes = 0
+            self.is_truncated = False
             parsed_url = urlparse(self.url)
             if parsed_url.scheme == "file":
                 html = self._parse_scheme_file(parsed_url.path)
@@ -395,40 +512,112 @@ def download(
                 )
 
         if not ignore_read_more and self.read_more_link:
-            doc = parsers.fromstring(html)
-            for read_more_node in doc.xpath(self.read_more_link):
-                # TODO: add check for onclick redirections. need some examples
-                if read_more_node.get("href"):
-                    new_url = read_more_node.get("href")
-                    log.info(
-                        "After downloading %s, found read more link: %s",
-                        self.url,
-                        new_url,
-                    )
-                    new_url = urls.prepare_url(new_url, self.url)
-                    html_ = self._parse_scheme_http(new_url)
-                    if html_ is not None:
-                        html = html_
-                        self.url = new_url
-                        log.info(
-                            "Downloaded read more link: %s and updated url to %s",
-                            new_url,
-                            self.url,
-                        )
-                    else:
-                        log.info(
-                            "Failed to download read more link: %s, leaving original content in place",
-                            new_url,
-                        )
-                    break
+            new_url = self._get_read_more_url(html)
+            if new_url:
+                html = self._use_read_more_html(html, new_url, self._parse_scheme_http(new_url))
+
+        self._set_downloaded_html(html, title)
+
+        return self
+
+    async def adownload(
+        self,
+        input_html: str | None = None,
+        title: str | None = None,
+        recursion_counter: int = 0,
+        ignore_read_more: bool = False,
+    ) -> "Article":
+        """Asyncio version of :any:`Article.download()`. The article (as well
+        as meta refresh redirects and read more links) is downloaded with
+        ``aiohttp``; the resulting state of the article is the same as
+        for :any:`Article.download()`. Requires the ``aiohttp`` package.
+
+        Args:
+            input_html (str, optional): A cached version of the article to parse.
+                Defaults to None.
+            title (str, optional): Force an article title. Defaults to None.
+            recursion_counter (int, optional): Used to prevent infinite recursions
+            due to meta_refresh. Defaults to 0.
+            ignore_read_more (bool, optional): If true, the download process will
+            ignore any kind of "read_more" xpath set up in the constructor.
+            Defaults to False.
+
+        Returns:
+            Article: self
+        """
+        if input_html is None:
+            self.downloaded_bytes = 0
+            self.is_truncated = False
+            parsed_url = urlparse(self.url)
+            if parsed_url.scheme == "file":
+                html = self._parse_scheme_file(parsed_url.path)
+            else:
+                html = await self._aparse_scheme_http()
+            if html is None:
+                log.debug(
+                    "Download failed on URL %s because of %s",
+                    self.url,
+                    self.download_exception_msg,
+                )
+                return self
+        else:
+            html = input_html
+
+        if self.config.follow_meta_refresh:
+            meta_refresh_url = extract_meta_refresh(html)
+            if meta_refresh_url and recursion_counter < 1:
+                return await self.adownload(
+                    input_html=await network.aget_html(meta_refresh_url),
+                    recursion_counter=recursion_counter + 1,
+                )
+
+        if not ignore_read_more and self.read_more_link:
+            new_url = self._get_read_more_url(html)
+            if new_url:
+                html = self._use_read_more_html(html, new_url, await self._aparse_scheme_http(new_url))
+
+        self._set_downloaded_html(html, title)
+
+        return self
+
+    def _get_read_more_url(self, html: str) -> str | None:
+        """Returns the (absolute) url of the first read more link found in html"""
+        doc = parsers.fromstring(html)
+        for read_more_node in doc.xpath(self.read_more_link):
+            # TODO: add check for onclick redirections. need some examples
+            if read_more_node.get("href"):
+                new_url = read_more_node.get("href")
+                log.info(
+                    "After downloading %s, found read more link: %s",
+                    self.url,
+                    new_url,
+                )
+                return urls.prepare_url(new_url, self.url)
+        return None
+
+    def _use_read_more_html(self, html: str, new_url: str, read_more_html: str | None) -> str:
+        """Switches the article to the read more link if it was downloaded"""
+        if read_more_html is None:
+            log.info(
+                "Failed to download read more link: %s, leaving original content in place",
+                new_url,
+            )
+            return html
 
+        self.url = new_url
+        log.info(
+            "Downloaded read more link: %s and updated url to %s",
+            new_url,
+            self.url,
+        )
+        return read_more_html
+
+    def _set_downloaded_html(self, html: str, title: str | None):
         self.html = html
         if title is not None:
             self.title = title
 
-        return self
-
-    def parse(self) -> "Article":
+    def parse(self, fields: Iterable[str] | None = None, lazy: bool | None = None) -> "Article":
         """Parse the previously downloaded article.
         If `download()` wasn't called, it will raise
         a `ArticleException` exception.
@@ -436,10 +625,26 @@ def parse(self) -> "Article":
         ``title``, ``authors``, ``publish_date``,
         ``text``, ``top_image``, etc.
 
+        Args:
+            fields (Iterable[str] | None, optional): Only extract these
+                article attributes (e.g. ``["title", "publish_date",
+                "canonical_link"]``). The extraction steps that are not
+                needed for them are skipped, and the other attributes keep
+                their default values. Defaults to ``config.extract_fields``,
+                None extracts everything.
+            lazy (bool | None, optional): If True, only the DOM is built, and
+                each attribute is extracted the first time it is read.
+                Defaults to ``config.lazy_parse``.
+
         Returns:
             Article: self
         """
         self.throw_if_not_downloaded_verbose()
+        steps = extraction_steps(fields if fields is not None else self.config.extract_fields, self.config)
+        if lazy is None:
+            lazy = self.config.lazy_parse
+        self._restore_lazy_values()
+        self._pending_steps = set()
 
         self.doc = parsers.fromstring(self.html)
 
@@ -448,20 +653,40 @@ def parse(self) -> "Article":
             self.is_parsed = True
             return self
 
-        document_cleaner = DocumentCleaner(self.config)
-        output_formatter = OutputFormatter(self.config)
+        # one index of the tree, shared by all the extractors
+        self.extractor.index_document(self.doc)
+
+        if lazy:
+            # the attributes are removed from the instance, so that reading
+            # them goes through __getattr__, which runs their extraction step
+            self._pending_steps = steps
+            self._lazy_values = {
+                field: self.__dict__.pop(field)
+                for field, step in EXTRACTION_FIELDS.items()
+                if step in steps and field in self.__dict__
+            }
+        else:
+            for step in EXTRACTION_STEPS:
+                if step in steps:
+                    getattr(self, f"_extract_{step}")()
+
+        self.is_parsed = True
+        return self
 
-        title = self.extractor.get_title(self.doc)
-        self.title = title
+    def _extract_title(self):
+        self.title = self.extractor.get_title(self.doc)
 
+    def _extract_authors(self):
         authors = self.extractor.get_authors(self.doc)
         self.authors = authors[: self.config.max_authors]
 
+    def _extract_metadata(self):
         metadata = self.extractor.get_metadata(self.url, self.doc)
+        self._meta_type = metadata["type"]
         if metadata["language"] in get_available_languages():
             self.meta_lang = metadata["language"]
-            if self.config.use_meta_language:
-                self.config.language = metadata["language"]
+        else:
+            self.meta_lang = ""
 
         self.meta_site_name = metadata["site_name"]
         self.meta_description = metadata["description"]
@@ -470,25 +695,71 @@ def parse(self) -> "Article":
         self.tags = metadata["tags"]
         self.meta_data = metadata["data"]
 
+    def _extract_publish_date(self):
         self.publish_date = self.extractor.get_publishing_date(self.url, self.doc)
 
+    def _extract_body(self):
         # Top node in the original documentDOM
-        self.top_node = self.extractor.calculate_best_node(self.doc)
+        self.top_node = self.extractor.calculate_best_node(self.doc, self.language)
         # Off-tree Node containing the top node and any relevant siblings
         self._top_node_complemented = self.extractor.top_node_complemented
 
+    def _extract_videos(self):
         self.set_movies(self.extractor.get_videos(self.doc, self.top_node))
 
+    def _extract_images(self):
         self.fetch_images()
 
-        if self.top_node is not None:
-            self._top_node_complemented = document_cleaner.clean(self._top_node_complemented)
-            text, article_html = output_formatter.get_formatted(self._top_node_complemented, title)
-            self.article_html = article_html
-            self.text = text
+    def _extract_text(self):
+        if self.top_node is None:
+            self.text = ""
+            self.article_html = ""
+            return
+        pool = self.extractor.pool
+        self._top_node_complemented = pool.document_cleaner.clean(self._top_node_complemented)
+        text, article_html = pool.output_formatter.get_formatted(
+            self._top_node_complemented, self.title, scores=self.extractor.scores, language=self.language
+        )
+        self.article_html = article_html
+        self.text = text
+
+    def _extract_pending(self, field: str | None = None):
+        """Runs the extraction steps postponed by a lazy `parse()`: the ones
+        needed for `field`, or all of them if `field` is None.
+        """
+        pending = self._pending_steps
+        if not pending:
+            return
+        steps = pending if field is None else _with_dependencies([EXTRACTION_FIELDS[field]], self.config) & pending
+        for step in EXTRACTION_STEPS:
+            if step in steps:
+                # discarded first, the step can read the attributes it sets
+                pending.discard(step)
+                try:
+                    getattr(self, f"_extract_{step}")()
+                except Exception:
+                    # still pending: it runs again on the next read
+                    pending.add(step)
+                    for name, field_step in EXTRACTION_FIELDS.items():
+                        if field_step == step:
+                            self.__dict__.pop(name, None)
+                    raise
+
+    def _restore_lazy_values(self):
+        """Puts back the attributes removed by a previous lazy `parse()` whose
+        extraction never ran, with the values they had before that parse.
+        """
+        for field, value in self.__dict__.pop("_lazy_values", {}).items():
+            self.__dict__.setdefault(field, value)
 
-        self.is_parsed = True
-        return self
+    def __getattr__(self, name: str) -> Any:
+        """Called only for the attributes missing from the instance, i.e.
+        the ones whose extraction was postponed by a lazy `parse()`.
+        """
+        if name in EXTRACTION_FIELDS and EXTRACTION_FIELDS[name] in self._pending_steps:
+            self._extract_pending(name)
+            return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def fetch_images(self):
         """Fetch top image, meta image and image list from
@@ -500,12 +771,12 @@ def fetch_images(self):
             images are extracted from HTML but not downloaded for validation.
         """
         # TODO: rewrite set_reddit_top_img. I removed it for now
-        self.extractor.parse_images(self.url, self.doc, self.top_node)
+        images = self.extractor.parse_images(self.url, self.doc, self.top_node)
 
-        self.meta_img = self.extractor.image_extractor.meta_image
-        self.top_image = self.extractor.image_extractor.top_image
-        self.images = self.extractor.image_extractor.images
-        self.meta_favicon = self.extractor.image_extractor.favicon
+        self.meta_img = images.meta_image
+        self.top_image = images.top_image
+        self.images = images.images
+        self.meta_favicon = images.favicon
 
     def is_valid_url(self):
         """Performs a check on the url of this link to determine if article
@@ -521,7 +792,8 @@ def is_valid_body(self):
             raise ArticleException(
                 "must parse article before checking                                     if it's body is valid!"
             )
-        meta_type = self.extractor.metadata_extractor.meta_data["type"]
+        self._extract_pending("meta_data")
+        meta_type = self._meta_type
         wordcount = self.text.split(" ")
         sentcount = self.text.split(".")
 
@@ -576,21 +848,18 @@ def nlp(self):
         """
         self.throw_if_not_downloaded_verbose()
         self.throw_if_not_parsed_verbose()
+        # the language of the stopwords can come from the metadata
+        self._extract_pending("text")
 
-        stopwords = StopWords(self.config.language)
-        keywords = nlp.keywords(self.text, stopwords, self.config.max_keywords)
-        for k, v in nlp.keywords(self.title, stopwords, self.config.max_keywords).items():
-            if k in keywords:
-                keywords[k] += v
-                keywords[k] /= 2
-            else:
-                keywords[k] = v
-
-        keywords = sorted(keywords.items(), key=lambda x: x[1], reverse=True)
-        keywords = keywords[: self.config.max_keywords]
+        stopwords = get_stopwords(self.language)
+        keywords = nlp.combine_keywords(
+            nlp.keywords(self.text, stopwords, self.config.max_keywords),
+            nlp.keywords(self.title, stopwords, self.config.max_keywords),
+            self.config.max_keywords,
+        )
 
-        self.keywords = [x[0] for x in keywords]  # remove score
-        self.keyword_scores = dict(keywords)
+        self.keywords = list(keywords)  # remove score
+        self.keyword_scores = keywords
 
         max_sents = self.config.max_summary_sent
 
@@ -604,6 +873,8 @@ def title(self) -> str:
         Returns:
             str: The title of the article.
         """
+        if "title" in self._pending_steps:
+            self._extract_pending("title")
         return self._title
 
     @title.setter
@@ -615,6 +886,19 @@ def title(self, value: str):
         """
         self._title = value[: self.config.max_title] if value else ""
 
+    @property
+    def language(self) -> str:
+        """The language used to parse the article: the language found in
+        the metadata (:any:`meta_lang`) if `config.use_meta_language` is
+        True and it is supported, `config.language` otherwise.
+
+        Returns:
+            str: the two letter code of the language
+        """
+        if self.config.use_meta_language and self.meta_lang:
+            return self.meta_lang
+        return self.config.language
+
     @property
     def text(self) -> str:
         """Returns the text content of the article.
@@ -622,6 +906,8 @@ def text(self) -> str:
         Returns:
             The text content of the article.
         """
+        if "text" in self._pending_steps:
+            self._extract_pending("text")
         return self._text
 
     @text.setter
@@ -687,8 +973,7 @@ def clean_doc(self) -> HtmlElement:
             HtmlElement: The cleaned document.
         """
         if self._clean_doc is None:
-            document_cleaner = DocumentCleaner(self.config)
-            self._clean_doc = document_cleaner.clean(self.doc)
+            self._clean_doc = self.extractor.pool.document_cleaner.clean(self.doc)
         return self._clean_doc
 
     @property
@@ -759,6 +1044,7 @@ def to_json(self, as_string: bool | None = True) -> str | dict:
             str: the json string version of an parsed article.
         """
         self.throw_if_not_parsed_verbose()
+        self._extract_pending()
 
         article_dict: dict[str, Any] = {}
 
@@ -775,6 +1061,7 @@ def to_json(self, as_string: bool | None = True) -> str | dict:
 
     def __getstate__(self):
         """Return a pickable object for this article. This can be used for caching"""
+        self._extract_pending()
         state = self.__dict__.copy()
         # drop non pickable attributes
         if self.download_state == ArticleDownloadState.SUCCESS and self.top_node is not None:
@@ -786,6 +1073,7 @@ def __getstate__(self):
             state["__parsed_state"] = False
 
         state.pop("extractor", None)
+        state.pop("_lazy_values", None)
         state.pop("top_node", None)
         state.pop("_top_node_complemented", None)
         state.pop("doc", None)
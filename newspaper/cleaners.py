@@ -6,12 +6,54 @@
 """
 
 import re
+import string
+from operator import itemgetter
 
+from lxml import etree
 from lxml.html import HtmlElement
 
 import newspaper.parsers as parsers
 from newspaper.configuration import Configuration
 
+# The steps of DocumentCleaner.clean, in the order they are applied
+_CLEANING_STEPS = (
+    "em",
+    "drop_caps",
+    "script",
+    "style",
+    "comment",
+    "bad_id",
+    "bad_class",
+    "bad_name",
+    "bad_tag",
+    "caption_id",
+    "caption_class",
+    "figure",
+    "figcaption",
+    "itemprop_caption",
+    "instagram_media",
+    "image_caption",
+    "class_caption",
+    "google_id",
+    "google_class",
+    "entries_id",
+    "entries_class",
+    "facebook_id",
+    "facebook_class",
+    "twitter_id",
+    "twitter_class",
+    "facebook_broadcasting_id",
+    "facebook_broadcasting_class",
+    "related_id",
+    "related_class",
+    "para_span",
+)
+# Nodes that are gone before the bad ids and classes are checked
+_DROPPED_BEFORE_BAD_TAGS = ("em", "drop_caps", "script", "style")
+_BAD_TAGS = ("aside", "nav", "noscript", "menu")
+_CAPTION_TAGS = ("div", "span", "header")
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
 
 class DocumentCleaner:
     """A class that provides methods to clean and manipulate HTML documents."""
@@ -47,9 +89,45 @@ def __init__(self, config: Configuration):
         self.facebook_broadcasting_re = "facebook-broadcasting"
         self.twitter_re = "[^-]twitter|twitter-tweet"
         self.contains_article = './/article|.//*[@id="article"]|.//*[contains(@itemprop,"articleBody")]'
+        self._combined_re, self._attr_rules = self._regex_rules()
 
     def clean(self, doc_to_clean: HtmlElement) -> HtmlElement:
-        """Remove chunks of the DOM as specified"""
+        """Remove chunks of the DOM as specified.
+
+        The tree is walked only once: every element is matched against all
+        the cleaning rules (the id, class and name attributes against one
+        combined regex). The matched nodes are then removed in the same
+        order as :any:`clean_stepwise` would, so the result is the same.
+        """
+        plan = self._plan_cleaning(doc_to_clean)
+
+        for step, nodes in plan.items():
+            if step in ("em", "drop_caps"):
+                parsers.drop_tags(nodes)
+            elif step in ("figure", "figcaption"):
+                parsers.remove(nodes, keep_tags=["img"])
+            elif step == "para_span":
+                # the parent of a span can change after an <em> was dropped
+                # or an enclosing node was removed, check it now
+                spans = [
+                    node
+                    for node in nodes
+                    if node.getparent() is not None
+                    and node.getparent().tag == "p"
+                    and node.getparent() is not doc_to_clean
+                    and any(ancestor is doc_to_clean for ancestor in node.iterancestors())
+                ]
+                parsers.drop_tags(spans)
+            else:
+                parsers.remove(nodes)
+
+        return self.reduce_article(doc_to_clean)
+
+    def clean_stepwise(self, doc_to_clean: HtmlElement) -> HtmlElement:
+        """Remove chunks of the DOM as specified, one cleaning step after
+        the other. Every step searches the whole tree again: this gives the
+        same result as :any:`clean`, but it is slower.
+        """
         doc_to_clean = self.clean_body_classes(doc_to_clean)
         doc_to_clean = self.clean_article_tags(doc_to_clean)
         doc_to_clean = self.clean_em_tags(doc_to_clean)
@@ -78,6 +156,136 @@ def clean(self, doc_to_clean: HtmlElement) -> HtmlElement:
 
         return doc_to_clean
 
+    def _regex_rules(self) -> tuple[re.Pattern, dict[str, list[tuple[str, re.Pattern]]]]:
+        """The attribute regexes of the cleaning steps, by attribute name,
+        and one combined regex that matches if any of them matches.
+        They are compiled once, when the cleaner is created.
+        """
+        patterns = [
+            ("bad", self.remove_nodes_re),
+            ("caption", self.caption_re),
+            ("google", self.google_re),
+            ("entries", self.entries_re),
+            ("facebook", self.facebook_re),
+            ("twitter", self.twitter_re),
+            ("facebook_broadcasting", self.facebook_broadcasting_re),
+            ("related", self.remove_nodes_related_re),
+        ]
+        combined = re.compile("|".join(f"(?:{pattern})" for _, pattern in patterns), re.IGNORECASE)
+        rules = {
+            attr: [(f"{name}_{attr}", re.compile(pattern, re.IGNORECASE)) for name, pattern in patterns]
+            for attr in ("id", "class")
+        }
+        rules["name"] = [("bad_name", re.compile(self.remove_nodes_re, re.IGNORECASE))]
+        return combined, rules
+
+    def _plan_cleaning(self, doc: HtmlElement) -> dict[str, list[HtmlElement]]:
+        """Walks the tree once and returns the nodes handled by every
+        cleaning step, in the order of the steps and in document order.
+        The <body> and <article> attributes are removed on the way.
+        """
+        plan: dict[str, list[tuple[int, HtmlElement]]] = {step: [] for step in _CLEANING_STEPS}
+        comments = plan["comment"]
+        body_seen = False
+        # for every open element: [position, contains an <img>,
+        # contains an article before the bad ids are removed, and after]
+        stack: list[list] = []
+        position = 0
+
+        for event, node in etree.iterwalk(doc, events=("start", "end")):
+            if event == "start":
+                position += 1
+                stack.append([position, False, False, False])
+                comments.extend((position, child) for child in node if child.tag is etree.Comment)
+                if node is doc:
+                    continue
+                if node.tag == "article":
+                    for attr in ["id", "name", "class"]:
+                        node.attrib.pop(attr, None)
+                elif node.tag == "body" and not body_seen:
+                    body_seen = True
+                    node.attrib.pop("class", None)
+                continue
+
+            node_position, has_img, article_before, article_after = stack.pop()
+            if node is doc:
+                break
+
+            tag = node.tag
+            step = self._first_step(
+                node, tag, has_img, article_before, article_after, self._combined_re, self._attr_rules
+            )
+            if step is not None:
+                plan[step].append((node_position, node))
+
+            parent = stack[-1]
+            parent[1] = parent[1] or has_img or tag == "img"
+            is_article = step not in _DROPPED_BEFORE_BAD_TAGS and (
+                tag == "article" or node.get("id") == "article" or "articleBody" in node.get("itemprop", "")
+            )
+            parent[2] = parent[2] or article_before or is_article
+            parent[3] = parent[3] or (step != "bad_id" and (article_after or is_article))
+
+        if doc.getparent() is not None:
+            # like //comment(), remove the comments of the whole tree
+            comments[:] = enumerate(doc.xpath("//comment()"))
+
+        return {step: [node for _, node in sorted(nodes, key=itemgetter(0))] for step, nodes in plan.items()}
+
+    @staticmethod
+    def _first_step(
+        node: HtmlElement,
+        tag: str,
+        has_img: bool,
+        article_before: bool,
+        article_after: bool,
+        combined: re.Pattern,
+        rules: dict[str, list[tuple[str, re.Pattern]]],
+    ) -> str | None:
+        """The first cleaning step that drops or removes `node`, if any.
+        `article_before` and `article_after` tell if the node contains an
+        article before and after the bad ids are removed.
+        """
+        if tag == "em" and not has_img:
+            return "em"
+        if tag in ("script", "style"):
+            return tag
+
+        node_class = node.get("class")
+        lower_class = node_class.translate(_ASCII_LOWER) if node_class else ""
+        if tag == "span" and lower_class:
+            words = re.split("[ \t\r\n]+", lower_class)
+            if "dropcap" in words or "drop_cap" in words:
+                return "drop_caps"
+
+        matches: set[str] = set()
+        for attr, value in (("id", node.get("id")), ("class", node_class), ("name", node.get("name"))):
+            if value and combined.search(value):
+                matches.update(step for step, regex in rules[attr] if regex.search(value))
+        if tag in _BAD_TAGS:
+            matches.add("bad_tag")
+        if tag in ("figure", "figcaption"):
+            matches.add(tag)
+        if node.get("itemprop", "").translate(_ASCII_LOWER) == "caption":
+            matches.add("itemprop_caption")
+        if lower_class == "instagram-media":
+            matches.add("instagram_media")
+        if lower_class == "image-caption":
+            matches.add("image_caption")
+        if "caption" in lower_class and tag in _CAPTION_TAGS:
+            matches.add("class_caption")
+        if tag == "span":
+            matches.add("para_span")
+        if not matches:
+            return None
+
+        # nodes containing an article are kept by the bad id and class steps
+        if article_before:
+            matches.discard("bad_id")
+        if article_after:
+            matches.discard("bad_class")
+        return next((step for step in _CLEANING_STEPS if step in matches), None)
+
     def clean_whitespace(self, text: str) -> str:
         """Remove tabs, whitespace lines from text
         add double newlines to paragraphs
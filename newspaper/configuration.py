@@ -72,6 +72,67 @@ class Configuration:
         requests_params (dict): Any of the params for the
             `get call`_ from ``requests`` library
         number_threads (int): number of threads to use for multi-threaded downloads
+        async_max_connections (int): maximum number of simultaneous connections
+            opened by the asyncio download functions (e.g.
+            :any:`Article.adownload()`, :any:`Source.adownload_articles()`).
+            Requires the ``aiohttp`` package. Default 100.
+        max_connections_per_host (int | None): maximum number of simultaneous
+            requests to the same host during multi-threaded downloads. The free
+            worker threads are used for urls of other hosts. None (default)
+            means no limit.
+        requests_per_second_per_host (float | None): maximum number of requests
+            per second sent to the same host during multi-threaded downloads.
+            None (default) means no limit.
+        host_limits (dict): per-host overrides of the limits above, e.g.
+            ``{"www.cnn.com": {"max_connections": 2, "requests_per_second": 1.0}}``.
+            Accepted keys are ``max_connections``, ``requests_per_second`` and
+            ``burst`` (number of requests allowed at once before the rate
+            limit applies, default 1). Other keys raise a ValueError when
+            the host is downloaded.
+        retry_settings (dict): retry policy for the failed requests. You can
+            set the following:
+
+                * ``max_retries``: number of retries after the first attempt
+                    (default 0, no retries)
+                * ``status_codes``: the http status codes that are retried
+                    (default 429, 500, 502, 503 and 504). Connection errors
+                    and timeouts are always retried.
+                * ``backoff_factor``: the delay before retry ``n`` is a random
+                    value between 0 and ``backoff_factor * 2 ** n`` seconds
+                    (default 0.5)
+                * ``backoff_max``: maximum delay before a retry, in seconds
+                    (default 30). If the server sends a ``Retry-After``
+                    header, it is used instead of the backoff, up to this
+                    maximum.
+        circuit_breaker_settings (dict): per-domain circuit breaker. After
+            ``failure_threshold`` consecutive failures (connection errors,
+            timeouts or retryable status codes) for a domain, the requests
+            to that domain fail immediately with a
+            :any:`CircuitOpenException` for ``reset_timeout`` seconds
+            (default 60). ``failure_threshold`` defaults to None (disabled).
+        persist_host_cache (bool): if True, what is learned about the hosts
+            (Range support, binary urls, redirects, robots.txt) is saved
+            under the newspaper data directory and reused by the next runs.
+            Default False.
+        conditional_requests (bool): if True, the responses that provide an
+            ``ETag`` or ``Last-Modified`` header are cached on disk, and the
+            next requests for the same url are made conditional
+            (``If-None-Match`` / ``If-Modified-Since``). If the server answers
+            ``304 Not Modified``, the cached page is used. Useful when polling
+            the same homepages, category pages and feeds with
+            :any:`Source.build()`. Hits and misses are counted in
+            ``network.conditional_cache.stats()``. Default False.
+        http_archive_mode (str | None): record or replay the http responses
+            from an offline archive. With ``"record"``, every downloaded
+            response is appended to the archive. With ``"replay"``, the
+            responses are read from the archive and nothing is downloaded
+            (urls that were not recorded fail with an
+            :any:`ArchiveMissException`), so :any:`Article.download()` and
+            :any:`Source.build()` can be repeated without the network.
+            Default None (no archive).
+        http_archive_path (str | None): the directory of the http archive.
+            Default None, meaning ``http_archive`` in the newspaper data
+            directory.
         verbose (bool): if True, it will output debugging information
             **deprecated**: Use the standard python logging module instead
         thread_timeout_seconds (int): timeout for threads
@@ -80,6 +141,24 @@ class Configuration:
             this for Source building can lead to longer processing times
             and could hang the process due to huge binary files (such as movies)
             default False.
+        max_content_bytes (int | None): maximum number of bytes downloaded
+            for a page. The download is stopped when the limit is reached,
+            and what was received so far is parsed; the article is then marked
+            as truncated (:any:`Article.is_truncated`). Default None (no limit).
+        extract_fields (list[str] | None): the :any:`Article` attributes
+            that :any:`Article.parse()` extracts, for instance
+            ``["title", "publish_date", "canonical_link"]`` or ``["text"]``.
+            The extraction steps that are not needed for these attributes
+            are skipped (see ``newspaper.article.EXTRACTION_FIELDS``).
+            Default None (all attributes).
+        lazy_parse (bool): if True, :any:`Article.parse()` only builds the
+            DOM, and each article attribute is extracted the first time it
+            is read (e.g. ``article.publish_date`` runs only the publishing
+            date extraction). Default False.
+        max_ld_json_size (int | None): JSON-LD scripts (structured data used
+            for the authors, publishing date and videos) longer than this
+            number of characters are not parsed. Default 1000000, None for
+            no limit.
         ignored_content_types_defaults (dict): dictionary of content-types
             and a default stub content. These content type will not be downloaded.
             **Note:** If :any:`allow_binary_content` is False,
@@ -182,6 +261,36 @@ def __init__(self):
         # Number of threads to use for mthreaded downloads
         self.number_threads = 10
 
+        # Max number of simultaneous connections for asyncio downloads
+        self.async_max_connections = 100
+
+        # Per-host politeness limits for mthreaded downloads
+        self.max_connections_per_host = None
+        self.requests_per_second_per_host = None
+        self.host_limits = {}
+
+        # Retry policy and per-domain circuit breaker
+        self.retry_settings = {
+            "max_retries": 0,
+            "status_codes": [429, 500, 502, 503, 504],
+            "backoff_factor": 0.5,
+            "backoff_max": 30,
+        }
+        self.circuit_breaker_settings = {
+            "failure_threshold": None,
+            "reset_timeout": 60,
+        }
+
+        # Save the host capability cache on disk between runs
+        self.persist_host_cache = False
+
+        # Use conditional requests (ETag / Last-Modified) and cache the responses
+        self.conditional_requests = False
+
+        # Offline http archive: None, "record" or "replay"
+        self.http_archive_mode = None
+        self.http_archive_path = None
+
         # Deprecated, use standard python logging module instead (debug level)
         self.verbose = False  # for debugging
 
@@ -189,10 +298,26 @@ def __init__(self):
 
         self.allow_binary_content = False
 
+        # Stop downloading a page after this many bytes (None means no limit)
+        self.max_content_bytes = None
+
+        # The Article attributes extracted by parse() (None means all)
+        self.extract_fields = None
+
+        # Extract the Article attributes when they are first read
+        self.lazy_parse = False
+
+        # Do not parse JSON-LD scripts longer than this (None means no limit)
+        self.max_ld_json_size = 1_000_000
+
         self.ignored_content_types_defaults = {}
 
         self._honor_robotstxt = False
 
+        # The extractors shared by the articles using this configuration,
+        # see newspaper.extractors.ExtractorPool
+        self._extractor_pool = None
+
     def update(self, **kwargs):
         """Update the configuration object with the given keyword arguments.
 
@@ -456,6 +581,8 @@ def MAX_FILE_MEMO(self, value):
     def __getstate__(self):
         """Return state values to be pickled."""
         state = self.__dict__.copy()
+        # recreated on first use
+        state["_extractor_pool"] = None
         return state
 
     def __setstate__(self, state):
@@ -1,5 +1,7 @@
 """Common exceptions raised by the newspaper package"""
 
+from requests import RequestException
+
 
 class ArticleBinaryDataException(Exception):
     """Exception raised for binary data in urls.
@@ -13,3 +15,16 @@ class ArticleException(Exception):
 
 class RobotsException(Exception):
     """Robots.txt disallowed exception"""
+
+
+class ArchiveMissException(RequestException):
+    """Exception raised in http archive replay mode, when the requested url
+    was not recorded. See :any:`Configuration.http_archive_mode`.
+    """
+
+
+class CircuitOpenException(RequestException):
+    """Exception raised when a domain had too many consecutive failures, and
+    requests to it are not sent anymore for a while.
+    See :any:`Configuration.circuit_breaker_settings`.
+    """
@@ -4,6 +4,6 @@
 There are several classes specialized on certain parts of a news article.
 """
 
-from newspaper.extractors.content_extractor import ContentExtractor
+from newspaper.extractors.content_extractor import ContentExtractor, ExtractorPool
 
-__all__ = ["ContentExtractor"]
+__all__ = ["ContentExtractor", "ExtractorPool"]
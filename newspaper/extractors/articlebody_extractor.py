@@ -1,6 +1,5 @@
-import copy
 import re
-from functools import partial
+from dataclasses import dataclass
 from statistics import mean
 
 import lxml
@@ -9,7 +8,7 @@
 import newspaper.extractors.defines as defines
 import newspaper.parsers as parsers
 from newspaper.configuration import Configuration
-from newspaper.text import StopWords
+from newspaper.text import StopWords, get_stopwords
 
 score_weights = {
     "bottom_negativescore_nodes": 0.25,
@@ -23,26 +22,53 @@
     "boost_min_stopword_count": 5,
 }
 
-get_stop_words = partial(parsers.get_attribute, attr="stop_words", type_=int, default=0)
-get_word_count = partial(parsers.get_attribute, attr="word_count", type_=int, default=0)
+
+@dataclass
+class ArticleBody:
+    """The result of :any:`ArticleBodyExtractor.parse`"""
+
+    top_node: HtmlElement | None
+    top_node_complemented: HtmlElement | None
+    scores: parsers.ScoreTable
 
 
 class ArticleBodyExtractor:
-    def __init__(self, config: Configuration):
+    """Finds the node holding the article body. The scoring keeps
+    per-document state on the instance, so use one instance per document
+    (or at least per thread).
+    """
+
+    def __init__(self, config: Configuration, language: str | None = None):
         self.config = config
+        # the language of the document, if it differs from config.language
+        self.language = language or config.language
         self.top_node = None
         self.top_node_complemented = None
         self.stopwords: StopWords | None = None
+        self.features: parsers.DocumentFeatures | None = None
+        self.text_memo: dict[HtmlElement, str] = {}
+        self.scores = parsers.ScoreTable()
+        self.index: parsers.DocumentIndex | None = None
 
-    def parse(self, doc: HtmlElement):
+    def parse(self, doc: HtmlElement, index: parsers.DocumentIndex | None = None) -> ArticleBody:
         """_summary_
 
         Args:
             doc (HtmlElement): _description_
+            index (parsers.DocumentIndex, optional): index of `doc`, shared
+                with the other extractors. Created if not given.
+
+        Returns:
+            ArticleBody: the top node, the top node complemented with its
+            siblings and the gravity scores
         """
-        self.stopwords = StopWords(self.config.language)
+        self.stopwords = get_stopwords(self.language)
+        self.index = index if index is not None else parsers.DocumentIndex(doc)
+        self.text_memo = {}
+        self.scores = parsers.ScoreTable()
         self.top_node = self.calculate_best_node(doc)
         self.top_node_complemented = self.complement_with_siblings(self.top_node)
+        return ArticleBody(self.top_node, self.top_node_complemented, self.scores)
 
     def calculate_best_node(self, doc):
         top_node = None
@@ -52,15 +78,13 @@ def calculate_best_node(self, doc):
         nodes_with_text = self.compute_features(doc)
 
         # process the tree from bottom up. farthest nodes first
-        nodes_with_text.sort(
-            key=lambda node: parsers.get_attribute(node, "node_level", type_=int, default=0),
-            reverse=True,
-        )
+        nodes_with_text.sort(key=lambda node: self.scores.node(node).node_level, reverse=True)
 
         parent_nodes = self.compute_gravity_scores(nodes_with_text)
 
         if parent_nodes:
-            parent_nodes.sort(key=parsers.get_node_gravity_score, reverse=True)
+            # on equal scores, the node that comes first in the document wins
+            parent_nodes.sort(key=lambda node: (-self.scores.gravity_score(node), self.features[node].position))
             top_node = parent_nodes[0]
 
         return top_node
@@ -102,7 +126,7 @@ def compute_gravity_scores(self, nodes_with_text):
                     if negscore > score_weights["negative_score_threshold"]:
                         boost_score = score_weights["negative_score_boost"]
 
-            stop_word_count = get_stop_words(node)
+            stop_word_count = self.scores.stop_words(node)
 
             upscore = stop_word_count + boost_score
 
@@ -121,46 +145,61 @@ def compute_gravity_scores(self, nodes_with_text):
 
             parent_nodes.append(parent_parent_node)
 
-        parent_nodes = [x for x in set(parent_nodes) if x is not None]
+        # remove duplicates, keeping the first occurrence
+        parent_nodes = [x for x in dict.fromkeys(parent_nodes) if x is not None]
 
         return parent_nodes
 
     def compute_features(self, doc):
         candidates = []
+        self.features = parsers.DocumentFeatures(doc, self.stopwords)
         nodes_to_check = self.nodes_to_check(doc)
-        nodes_to_check.sort(key=parsers.get_level, reverse=True)
+        nodes_to_check.sort(key=lambda node: self.features[node].level, reverse=True)
+
+        # word stats of the nodes already processed, summed up for each of
+        # their ancestors. Deeper nodes are processed first.
+        children_word_stats = {}
 
         for node in nodes_to_check:
             # exclude nodes that are in this list
-
-            text_content = parsers.get_text(node)
-            if not text_content:
+            features = self.features[node]
+            if not features.text_length:
                 continue
 
-            word_stats = self.stopwords.get_stopword_count(text_content)
-            high_link_density = parsers.is_highlink_density(node, self.config.language)
-
-            children_word_stats = [
-                (get_stop_words(child), get_word_count(child)) for child in node.xpath(".//*[@stop_words>0]")
-            ]
-            children_word_stats = (
-                sum([x[0] for x in children_word_stats]),
-                sum([x[1] for x in children_word_stats]),
-            )
-            parsers.set_attribute(node, "stop_words", word_stats.stop_word_count - children_word_stats[0])
-            parsers.set_attribute(node, "word_count", word_stats.word_count - children_word_stats[1])
-            parsers.set_attribute(node, "is_highlink_density", 1 if high_link_density else 0)
-            parsers.set_attribute(node, "node_level", parsers.get_level(node))
-
-            if word_stats.stop_word_count > 2 and not high_link_density:
+            high_link_density = features.is_highlink_density
+
+            children_stop_words, children_words = children_word_stats.get(node, (0, 0))
+            stop_words = features.stop_word_count - children_stop_words
+            word_count = features.word_count - children_words
+            score = self.scores.node(node)
+            score.stop_words = stop_words
+            score.word_count = word_count
+            score.node_level = features.level
+
+            if stop_words > 0:
+                for parent in node.iterancestors():
+                    parent_stop_words, parent_words = children_word_stats.get(parent, (0, 0))
+                    children_word_stats[parent] = (parent_stop_words + stop_words, parent_words + word_count)
+
+            if features.stop_word_count > 2 and not high_link_density:
                 candidates.append(node)
 
         return candidates
 
+    def is_highlink_density(self, node: HtmlElement) -> bool:
+        """Checks the link density of `node` using the precomputed features
+        (or computes it, if the node is not part of the document).
+        """
+        features = self.features.get(node) if self.features is not None else None
+        if features is None:
+            return parsers.is_highlink_density(node, self.language)
+        return features.is_highlink_density
+
     def nodes_to_check(self, doc):
         """Returns a list of nodes we want to search
         on like paragraphs and tables
         """
+        index = self._get_index(doc)
         nodes_to_check = []
         for tag in ["p", "pre", "td", "article", "div"]:
             if tag == "div":
@@ -170,27 +209,25 @@ def nodes_to_check(self, doc):
                     "article",
                     "story",
                 ]:
-                    items += parsers.get_tags(
-                        doc,
+                    items += index.get_tags(
                         tag=tag,
                         attribs={"id": attr},
                         attribs_match="word",
                         ignore_dashes=True,
                     )
-                    items += parsers.get_tags(
-                        doc,
+                    items += index.get_tags(
                         tag=tag,
                         attribs={"class": attr},
                         attribs_match="word",
                         ignore_dashes=True,
                     )
                 for class_ in ["paragraph"]:
-                    items += parsers.get_tags_regex(doc, tag=tag, attribs={"class": class_})
+                    items += index.get_tags_regex(tag=tag, attribs={"class": class_})
                 if len(items) == 0 and len(nodes_to_check) < 5:
-                    items = parsers.get_tags(doc, tag=tag)
+                    items = index.get_tags(tag=tag)
                 items = set(items)  # remove duplicates
             else:
-                items = parsers.get_tags(doc, tag=tag)
+                items = index.get_tags(tag=tag)
             nodes_to_check += items
 
         # Do not miss some Article Bodies or Article Sections
@@ -203,6 +240,11 @@ def nodes_to_check(self, doc):
 
         return nodes_to_check
 
+    def _get_index(self, doc: HtmlElement) -> parsers.DocumentIndex:
+        if self.index is not None and self.index.doc is doc:
+            return self.index
+        return parsers.DocumentIndex(doc)
+
     def is_boostable(self, node):
         """A lot of times the first paragraph might be the caption under an image
         so we'll want to make sure if we're going to boost a parent node that
@@ -216,8 +258,7 @@ def is_boostable(self, node):
         for current_node in nodes[:max_stepsaway_from_node]:
             if current_node.tag != node.tag:
                 continue
-            stop_word_count = parsers.get_attribute(current_node, "stop_words", type_=int, default=0)
-            if stop_word_count > score_weights["boost_min_stopword_count"]:
+            if self.scores.stop_words(current_node) > score_weights["boost_min_stopword_count"]:
                 return True
         return False
 
@@ -229,9 +270,10 @@ def boost_highly_likely_nodes(self, doc: HtmlElement):
         Args:
             doc (HtmlElement): Document to be checked
         """
+        index = self._get_index(doc)
         candidates = []
         for tag in ["p", "pre", "td", "article", "div"]:
-            candidates.extend(parsers.get_tags(doc, tag=tag))
+            candidates.extend(index.tags(tag))
 
         for e in candidates:
             boost = self.is_highly_likely(e)
@@ -279,24 +321,22 @@ def is_tag_match(node, tag_dict):
         return 0
 
     def update_score(self, node, add_to_score):
-        """Adds a score to the gravityScore Attribute we put on divs
+        """Adds a score to the gravity score of the node in the score table
         we'll get the current score then add the score we're passing
         in to the current.
         """
         if node is None:
             return
-        new_score = parsers.get_node_gravity_score(node) + add_to_score
-        parsers.set_attribute(node, "gravityScore", str(new_score))
+        self.scores.node(node).gravity_score = self.scores.gravity_score(node) + add_to_score
 
     def update_node_count(self, node, add_to_count):
         """Stores how many decent nodes are under a parent node"""
         if node is None:
             return
-        new_count = float(node.get("gravityNodes", 0)) + add_to_count
-        parsers.set_attribute(node, "gravityNodes", str(new_count))
+        self.scores.node(node).gravity_nodes += add_to_count
 
     def add_siblings(self, top_node):
-        res_node = copy.deepcopy(top_node)
+        res_node = self.scores.copy(top_node)
         baseline_score = self.get_normalized_score(top_node)
         results = self.walk_siblings(top_node)
         for current_node in results:
@@ -316,8 +356,8 @@ def get_plausible_content(self, node, baseline_score, score_weight=0.3):
         if isinstance(node, lxml.etree.CommentBase | lxml.etree.EntityBase | lxml.etree.PIBase):
             return []
 
-        if node.tag == "p" and node.text and not parsers.is_highlink_density(node, self.config.language):
-            element = copy.deepcopy(node)
+        if node.tag == "p" and node.text and not self.is_highlink_density(node):
+            element = self.scores.copy(node)
             element.tail = ""
             return [element]
 
@@ -327,14 +367,14 @@ def get_plausible_content(self, node, baseline_score, score_weight=0.3):
             return result
 
         for paragraph in paragraphs:
-            stop_word_count = parsers.get_attribute(paragraph, "stop_words", type_=int, default=0)
+            stop_word_count = self.scores.stop_words(paragraph)
             if stop_word_count <= 0:
                 continue
-            if parsers.is_highlink_density(paragraph, self.config.language):
+            if self.is_highlink_density(paragraph):
                 continue
 
             if stop_word_count > baseline_score * score_weight:
-                text = parsers.get_text(paragraph)
+                text = parsers.get_text(paragraph, memo=self.text_memo)
                 element = parsers.create_element(tag="p", text=text)
                 result.append(element)
 
@@ -351,7 +391,7 @@ def get_normalized_score(self, top_node):
         """
         nodes_to_check = parsers.get_tags(top_node, tag="p")
 
-        scores = [parsers.get_node_gravity_score(node) for node in nodes_to_check]
+        scores = [self.scores.gravity_score(node) for node in nodes_to_check]
         scores = [score for score in scores if score > 0]  # filter out 0 scores
 
         return mean(scores) if scores else float("inf")
@@ -389,7 +429,7 @@ def add_same_level_candidates(self, node):
 
         node_level = parsers.get_level(node)
         # base_score = self.get_normalized_score(node)
-        base_score = parsers.get_node_gravity_score(node)
+        base_score = self.scores.gravity_score(node)
 
         candidates = parsers.get_nodes_at_level(tree.getroot(), node_level)
 
@@ -402,17 +442,17 @@ def add_same_level_candidates(self, node):
 
         for n in candidates:
             if n == node:
-                new_node.append(copy.deepcopy(node))
+                new_node.append(self.scores.copy(node))
                 continue
 
             # avoid adding nodes that do not resemble the top node
             if n.tag != node.tag:
                 continue
 
-            score = parsers.get_node_gravity_score(n)
+            score = self.scores.gravity_score(n)
 
-            if score > base_score * 0.3 and not parsers.is_highlink_density(n, self.config.language):
-                new_node.append(copy.deepcopy(n))
+            if score > base_score * 0.3 and not self.is_highlink_density(n):
+                new_node.append(self.scores.copy(n))
                 continue
 
             # content_items = self.get_plausible_content(n, base_score)
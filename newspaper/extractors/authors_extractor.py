@@ -1,6 +1,5 @@
 import re
 from collections import OrderedDict
-from copy import deepcopy
 from typing import Any
 
 from lxml.html import HtmlElement
@@ -13,12 +12,18 @@
 class AuthorsExtractor:
     def __init__(self, config: Configuration) -> None:
         self.config = config
-        self.authors: list[str] = []
 
-    def parse(self, doc: HtmlElement) -> list[str]:
+    def parse(self, doc: HtmlElement, index: parsers.DocumentIndex | None = None) -> list[str]:
         """Fetch the authors of the article, return as a list
         Only works for english articles
+
+        Args:
+            doc (HtmlElement): The DOM for the whole article page
+            index (parsers.DocumentIndex, optional): index of `doc`, shared
+                with the other extractors. Created if not given.
         """
+        if index is None:
+            index = parsers.DocumentIndex(doc, self.config.max_ld_json_size)
         _digits = re.compile(r"\d")
         author_stopwords_patt = [re.escape(x) for x in AUTHOR_STOP_WORDS]
         author_stopwords = re.compile(r"\b(" + "|".join(author_stopwords_patt) + r")\b", flags=re.IGNORECASE)
@@ -77,7 +82,7 @@ def parse_byline(search_str):
         matches = []
         authors = []
 
-        json_ld_scripts = parsers.get_ld_json_object(doc)
+        json_ld_scripts = index.get_ld_json_object()
 
         def get_authors(vals):
             if isinstance(vals, dict):
@@ -113,6 +118,9 @@ def get_authors(vals):
                 if "author" in script_tag:
                     get_authors(script_tag["author"])
 
+        text_memo: dict[HtmlElement, str] = {}
+        author_excluded_tags = (*parsers.TEXT_EXCLUDED_TAGS, "time")
+
         def get_text_from_element(node: HtmlElement) -> str:
             """Return the text from an element, including the text from its children
             Args:
@@ -125,12 +133,7 @@ def get_text_from_element(node: HtmlElement) -> str:
             if node.tag in ["script", "style", "time"]:
                 return ""
 
-            node = deepcopy(node)
-            for tag in ["script", "style", "time"]:
-                for el in node.xpath(f".//{tag}"):
-                    el.getparent().remove(el)
-            text = parsers.get_text(node)
-            return text
+            return parsers.get_text(node, memo=text_memo, exclude=author_excluded_tags)
 
         authors = [re.sub("[\n\t\r\xa0]", " ", x) for x in authors if x]
         doc_root = doc.getroottree()
@@ -143,7 +146,7 @@ def getpath(node):
         for attr in AUTHOR_ATTRS:
             for val in AUTHOR_VALS:
                 # found = doc.xpath('//*[@%s="%s"]' % (attr, val))
-                found = parsers.get_elements_by_attribs(doc, attribs={attr: val})
+                found = index.get_elements_by_attribs(attribs={attr: val})
                 matches.extend([(found, getpath(found)) for found in found])
 
         matches.sort(key=lambda x: x[1], reverse=True)  # sort by xpath. we want the most specific match
@@ -170,6 +173,4 @@ def getpath(node):
 
         # Clean up authors of stopwords such as Reporter, Senior Reporter
         authors = [re.sub(author_stopwords, "", x).strip(" .,-/") for x in authors]
-        self.authors = uniqify_list(authors)
-
-        return self.authors
+        return uniqify_list(authors)
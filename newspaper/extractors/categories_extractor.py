@@ -2,7 +2,6 @@
 from collections.abc import Iterator
 from typing import Any
 
-import tldextract
 from lxml.html import HtmlElement
 
 import newspaper.parsers as parsers
@@ -14,17 +13,21 @@
 class CategoryExtractor:
     def __init__(self, config: Configuration) -> None:
         self.config = config
-        self.categories: list[str] = []
 
-    def parse(self, source_url: str, doc: HtmlElement) -> list[str]:
+    def parse(self, source_url: str, doc: HtmlElement, index: parsers.DocumentIndex | None = None) -> list[str]:
         """Inputs source lxml root and source url, extracts domain and
         finds all of the top level urls, we are assuming that these are
         the category urls.
         cnn.com --> [cnn.com/latest, world.cnn.com, cnn.com/asia]
+
+        `index` is the index of `doc` shared with the other extractors,
+        it is created if not given.
         """
-        domain_tld = tldextract.extract(source_url)
+        if index is None:
+            index = parsers.DocumentIndex(doc)
+        domain_tld = urls.extract_tld(source_url)
 
-        links_in_doc = {a.get("href") for a in parsers.get_tags(doc, tag="a")}
+        links_in_doc = {a.get("href") for a in index.tags("a")}
 
         category_candidates: list[Any] = []
 
@@ -72,8 +75,7 @@ def parse(self, source_url: str, doc: HtmlElement) -> list[str]:
 
         category_urls = [urls.prepare_url(p_url, source_url) for p_url in _valid_categories if p_url is not None]
 
-        self.categories = sorted(category_urls)
-        return self.categories
+        return sorted(category_urls)
 
     def _get_other_links(self, doc: HtmlElement, source_domain: str | None = None) -> Iterator[str]:
         """Return all links that are not as <a> tags. These can be
@@ -87,7 +89,7 @@ def _get_other_links(self, doc: HtmlElement, source_domain: str | None = None) -
 
         def _filter(candidate):
             if source_domain is not None:
-                candidate_tld = tldextract.extract(candidate)
+                candidate_tld = urls.extract_tld(candidate)
                 if candidate_tld.domain != source_domain:
                     return False
             if re.search(r"\.(css|js|json|xml|rss|jpg|jpeg|png|)$", candidate, re.I):
@@ -140,7 +142,7 @@ def is_valid_link(self, url: str, source_domain: str, source_url: str) -> tuple[
             path_chunks.remove("index.html")
 
         if parsed_url["domain"]:
-            child_tld = tldextract.extract(url)
+            child_tld = urls.extract_tld(url)
             parsed_url["tld"] = child_tld
             child_subdomain_parts = child_tld.subdomain.split(".")
 
@@ -1,4 +1,5 @@
 import logging
+import threading
 from datetime import datetime
 from typing import Any
 
@@ -6,19 +7,61 @@
 
 import newspaper.parsers as parsers
 from newspaper import urls
+from newspaper.cleaners import DocumentCleaner
 from newspaper.configuration import Configuration
-from newspaper.extractors.articlebody_extractor import ArticleBodyExtractor
+from newspaper.extractors.articlebody_extractor import ArticleBody, ArticleBodyExtractor
 from newspaper.extractors.authors_extractor import AuthorsExtractor
 from newspaper.extractors.categories_extractor import CategoryExtractor
-from newspaper.extractors.image_extractor import ImageExtractor
+from newspaper.extractors.image_extractor import ArticleImages, ImageExtractor
 from newspaper.extractors.metadata_extractor import MetadataExtractor
 from newspaper.extractors.pubdate_extractor import PubdateExtractor
 from newspaper.extractors.title_extractor import TitleExtractor
 from newspaper.extractors.videos_extractor import VideoExtractor
+from newspaper.outputformatters import OutputFormatter
 from newspaper.utils import Video
 
 log = logging.getLogger(__name__)
 
+_pool_lock = threading.Lock()
+
+
+class ExtractorPool:
+    """The extractors, document cleaner and output formatter for one
+    configuration. They return their results instead of keeping them, so
+    one pool is shared by all the articles (and threads) that use the same
+    configuration. Get it with :any:`ExtractorPool.get`.
+
+    The article body extractor is not part of the pool: it keeps the
+    scores of the document it parses, a new one is used for each document.
+    """
+
+    def __init__(self, config: Configuration):
+        self.config = config
+        self.title_extractor = TitleExtractor(config)
+        self.author_extractor = AuthorsExtractor(config)
+        self.pubdate_extractor = PubdateExtractor(config)
+        self.metadata_extractor = MetadataExtractor(config)
+        self.categories_extractor = CategoryExtractor(config)
+        self.image_extractor = ImageExtractor(config)
+        self.video_extractor = VideoExtractor(config)
+        self.document_cleaner = DocumentCleaner(config)
+        self.output_formatter = OutputFormatter(config)
+
+    @classmethod
+    def get(cls, config: Configuration) -> "ExtractorPool":
+        """Returns the pool of `config`, created on first use. It is kept on
+        the configuration object, so it lives as long as the configuration.
+        """
+        pool = config.__dict__.get("_extractor_pool")
+        # a shallow copy of the configuration gets its own pool
+        if pool is None or pool.config is not config:
+            with _pool_lock:
+                pool = config.__dict__.get("_extractor_pool")
+                if pool is None or pool.config is not config:
+                    pool = cls(config)
+                    config._extractor_pool = pool
+        return pool
+
 
 class ContentExtractor:
     """Extracts various content from an article page.
@@ -27,38 +70,72 @@ class ContentExtractor:
     such as authors, publishing date, title, feed URLs, metadata, images, category URLs,
     and videos.
 
+    The extractors come from the :any:`ExtractorPool` of the configuration,
+    so creating a ContentExtractor is cheap. It only keeps the state of the
+    document being parsed (its index and article body), use one per article.
+
     Args:
         config (Configuration): The configuration object for the content extraction.
 
     Attributes:
         config (Configuration): The configuration object for the content extraction.
+        pool (ExtractorPool): The extractors shared with the other articles
+            using the same configuration.
         title_extractor (TitleExtractor): The title extractor object.
         author_extractor (AuthorsExtractor): The authors extractor object.
         pubdate_extractor (PubdateExtractor): The publishing date extractor object.
-        article_body_extractor (ArticleBodyExtractor): The article body
-            extractor object.
+        article_body_extractor (ArticleBodyExtractor | None): The article body
+            extractor used by the last :any:`calculate_best_node` call.
         metadata_extractor (MetadataExtractor): The metadata extractor object.
         categories_extractor (CategoryExtractor): The category extractor object.
         image_extractor (ImageExtractor): The image extractor object.
         video_extractor (VideoExtractor): The video extractor object.
+        document_index (parsers.DocumentIndex | None): The index of the
+            document being parsed, shared by all the extractors. Set by
+            :any:`index_document`.
+        body (ArticleBody | None): The result of the last
+            :any:`calculate_best_node` call.
     """
 
     def __init__(self, config: Configuration):
         self.config = config
-        self.title_extractor = TitleExtractor(config)
-        self.author_extractor = AuthorsExtractor(config)
-        self.pubdate_extractor = PubdateExtractor(config)
-        self.article_body_extractor = ArticleBodyExtractor(config)
-        self.metadata_extractor = MetadataExtractor(config)
-        self.categories_extractor = CategoryExtractor(config)
-        self.image_extractor = ImageExtractor(config)
-        self.video_extractor = VideoExtractor(config)
+        self.pool = ExtractorPool.get(config)
+        self.title_extractor = self.pool.title_extractor
+        self.author_extractor = self.pool.author_extractor
+        self.pubdate_extractor = self.pool.pubdate_extractor
+        self.metadata_extractor = self.pool.metadata_extractor
+        self.categories_extractor = self.pool.categories_extractor
+        self.image_extractor = self.pool.image_extractor
+        self.video_extractor = self.pool.video_extractor
+        self.article_body_extractor: ArticleBodyExtractor | None = None
+        self.document_index: parsers.DocumentIndex | None = None
+        self.body: ArticleBody | None = None
+
+    def index_document(self, doc: HtmlElement) -> parsers.DocumentIndex:
+        """Creates the index of `doc` used by all the extractors, so the
+        tree is searched only once. Call it again for every new document.
+        The index itself is built on first use.
+
+        Args:
+            doc (HtmlElement): The DOM for the whole page
+
+        Returns:
+            parsers.DocumentIndex: the index of `doc`
+        """
+        self.document_index = parsers.DocumentIndex(doc, self.config.max_ld_json_size)
+        return self.document_index
+
+    def _get_index(self, doc: HtmlElement) -> parsers.DocumentIndex:
+        """The shared index if it belongs to `doc`, otherwise a new one."""
+        if self.document_index is not None and self.document_index.doc is doc:
+            return self.document_index
+        return parsers.DocumentIndex(doc, self.config.max_ld_json_size)
 
     def get_authors(self, doc: HtmlElement) -> list[str]:
         """Fetch the authors of the article, return as a list
         Only works for english articles
         """
-        return self.author_extractor.parse(doc)
+        return self.author_extractor.parse(doc, index=self._get_index(doc))
 
     def get_publishing_date(self, url: str, doc: HtmlElement) -> datetime | None:
         """Return the article publishing date as datetime object. If no valid
@@ -74,7 +151,7 @@ def get_publishing_date(self, url: str, doc: HtmlElement) -> datetime | None:
         Returns:
             datetime | None: a datetime object or None
         """
-        return self.pubdate_extractor.parse(url, doc)
+        return self.pubdate_extractor.parse(url, doc, index=self._get_index(doc))
 
     def get_title(self, doc):
         """Fetch the article title and analyze it
@@ -93,7 +170,7 @@ def get_title(self, doc):
         4. title starts with og:title, use og:title
         5. use title, after splitting
         """
-        return self.title_extractor.parse(doc)
+        return self.title_extractor.parse(doc, index=self._get_index(doc))
 
     def get_feed_urls(self, source_url, categories):
         """Takes a source url and a list of category objects and returns
@@ -114,11 +191,11 @@ def get_feed_urls(self, source_url, categories):
 
     def get_metadata(self, article_url: str, doc: HtmlElement) -> dict[str, Any]:
         """Parse the article's HTML for any known metadata attributes"""
-        return self.metadata_extractor.parse(article_url, doc)
+        return self.metadata_extractor.parse(article_url, doc, index=self._get_index(doc))
 
-    def parse_images(self, article_url: str, doc: HtmlElement, top_node: HtmlElement):
+    def parse_images(self, article_url: str, doc: HtmlElement, top_node: HtmlElement) -> ArticleImages:
         """Parse images in an article"""
-        self.image_extractor.parse(doc, top_node, article_url)
+        return self.image_extractor.parse(doc, top_node, article_url, index=self._get_index(doc))
 
     def get_category_urls(self, source_url, doc):
         """Inputs source lxml root and source url, extracts domain and
@@ -126,7 +203,7 @@ def get_category_urls(self, source_url, doc):
         the category urls.
         cnn.com --> [cnn.com/latest, world.cnn.com, cnn.com/asia]
         """
-        return self.categories_extractor.parse(source_url, doc)
+        return self.categories_extractor.parse(source_url, doc, index=self._get_index(doc))
 
     @property
     def top_node(self) -> HtmlElement:
@@ -136,7 +213,7 @@ def top_node(self) -> HtmlElement:
         Returns:
             HtmlElement: The top node containing the article text
         """
-        return self.article_body_extractor.top_node
+        return self.body.top_node if self.body is not None else None
 
     @property
     def top_node_complemented(self) -> HtmlElement:
@@ -145,9 +222,19 @@ def top_node_complemented(self) -> HtmlElement:
         Returns:
             HtmlElement: deepcopy version of the top node, cleaned
         """
-        return self.article_body_extractor.top_node_complemented
+        return self.body.top_node_complemented if self.body is not None else None
+
+    @property
+    def scores(self) -> parsers.ScoreTable:
+        """The gravity scores computed by the last :any:`calculate_best_node`
+        call, for the document nodes and the top node complemented.
+
+        Returns:
+            ScoreTable: the scores, keyed by element
+        """
+        return self.body.scores if self.body is not None else parsers.ScoreTable()
 
-    def calculate_best_node(self, doc: HtmlElement) -> HtmlElement | None:
+    def calculate_best_node(self, doc: HtmlElement, language: str | None = None) -> HtmlElement | None:
         """Extracts the most probable top node for the article text
         based on a variety of heuristics
 
@@ -155,14 +242,17 @@ def calculate_best_node(self, doc: HtmlElement) -> HtmlElement | None:
             doc (HtmlElement): Root node of the document.
               The search starts from here.
               usually it's the html tag of the web page
+            language (str | None): The language of the document.
+              Defaults to `config.language`.
 
         Returns:
             HtmlElement: the article top element
             (most probable container of the article text), or None
         """
-        self.article_body_extractor.parse(doc)
+        self.article_body_extractor = ArticleBodyExtractor(self.config, language)
+        self.body = self.article_body_extractor.parse(doc, index=self._get_index(doc))
 
-        return self.article_body_extractor.top_node
+        return self.body.top_node
 
     def get_videos(self, doc: HtmlElement, top_node: HtmlElement) -> list[Video]:
         """Gets video links from article
@@ -174,4 +264,4 @@ def get_videos(self, doc: HtmlElement, top_node: HtmlElement) -> list[Video]:
         Returns:
             list[str]: list of video urls
         """
-        return self.video_extractor.parse(doc, top_node)
+        return self.video_extractor.parse(doc, top_node, index=self._get_index(doc) if doc is not None else None)
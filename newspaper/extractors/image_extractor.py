@@ -1,22 +1,39 @@
 import logging
 import re
 import urllib.parse
+from collections.abc import Iterator
 from copy import copy
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import requests
 from lxml.html import HtmlElement
-from PIL import Image, ImageFile
+from requests.structures import CaseInsensitiveDict
 
 import newspaper.extractors.defines as defines
 import newspaper.parsers as parsers
 from newspaper import urls
 from newspaper.configuration import Configuration
-from newspaper.network import session
+from newspaper.network import session_pool
+from newspaper.network_archive import IMAGE_PROBE, REPLAY, get_archive
 from newspaper.urls import urljoin_if_valid
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class ArticleImages:
+    """The images found by :any:`ImageExtractor.parse`"""
+
+    top_image: str = ""
+    meta_image: str = ""
+    images: list[str] = field(default_factory=list)
+    favicon: str = ""
+
+
 class ImageExtractor:
     """Extractor class for images in articles. Getting top image,
     image list, favicon, etc.
@@ -24,51 +41,60 @@ class ImageExtractor:
 
     def __init__(self, config: Configuration) -> None:
         self.config = config
-        self.top_image: str | None = None
-        self.meta_image: str | None = None
-        self.images: list[str] = []
-        self.favicon: str | None = None
         self._chunksize = 1024
 
-    def parse(self, doc: HtmlElement, top_node: HtmlElement, article_url: str) -> None:
+    def parse(
+        self,
+        doc: HtmlElement,
+        top_node: HtmlElement,
+        article_url: str,
+        index: parsers.DocumentIndex | None = None,
+    ) -> ArticleImages:
         """Main method to extract images from a document
 
         Args:
             doc (HtmlElement): _description_
-        """
-        self.favicon = self._get_favicon(doc)
+            index (parsers.DocumentIndex, optional): index of `doc`, shared
+                with the other extractors. Created if not given.
 
-        self.meta_image = self._get_meta_image(doc)
-        if self.meta_image:
-            self.meta_image = urljoin_if_valid(article_url, self.meta_image)
-        self.images = [
+        Returns:
+            ArticleImages: the favicon, meta image, top image and image list
+        """
+        if index is None:
+            index = parsers.DocumentIndex(doc)
+        favicon = self._get_favicon(index)
+
+        meta_image = self._get_meta_image(index)
+        if meta_image:
+            meta_image = urljoin_if_valid(article_url, meta_image)
+        images = [
             urljoin_if_valid(article_url, u)
-            for u in self._get_images(doc)  # Tried to use top_node, but images
+            for u in self._get_images(index)  # Tried to use top_node, but images
             # were not found in some cases (times_001.html)
             if u and u.strip()
         ]
-        self.top_image = self._get_top_image(doc, top_node, article_url)
+        top_image = self._get_top_image(index, top_node, article_url, meta_image)
+        return ArticleImages(top_image=top_image, meta_image=meta_image, images=images, favicon=favicon)
 
-    def _get_favicon(self, doc: HtmlElement) -> str:
+    def _get_favicon(self, index: parsers.DocumentIndex) -> str:
         """Extract the favicon from a website http://en.wikipedia.org/wiki/Favicon
         <link rel="shortcut icon" type="image/png" href="favicon.png" />
         <link rel="icon" type="image/png" href="favicon.png" />
         """
-        meta = parsers.get_tags(doc, tag="link", attribs={"rel": "icon"}, attribs_match="substring")
+        meta = index.get_tags(tag="link", attribs={"rel": "icon"}, attribs_match="substring")
         if meta:
             favicon = parsers.get_attribute(meta[0], "href")
             return favicon or ""
         return ""
 
-    def _get_meta_image(self, doc: HtmlElement) -> str:
+    def _get_meta_image(self, index: parsers.DocumentIndex) -> str:
         """Extract image from the meta tags of the document."""
         candidates: list[tuple[str, int]] = []
         for elem in defines.META_IMAGE_TAGS:
             if "|" in elem["value"]:
-                items = parsers.get_tags_regex(doc, tag=elem["tag"], attribs={elem["attr"]: elem["value"]})
+                items = index.get_tags_regex(tag=elem["tag"], attribs={elem["attr"]: elem["value"]})
             else:
-                items = parsers.get_tags(
-                    doc,
+                items = index.get_tags(
                     tag=elem["tag"],
                     attribs={elem["attr"]: elem["value"]},
                     attribs_match="exact",
@@ -82,7 +108,7 @@ def _get_meta_image(self, doc: HtmlElement) -> str:
 
         return candidates[0][0] if candidates else ""
 
-    def _get_images(self, doc: HtmlElement) -> list[str]:
+    def _get_images(self, index: parsers.DocumentIndex) -> list[str]:
         def get_src(image):
             # account for src, data-src and other attributes
             srcs = [image.attrib.get(x) for x in image.attrib if "src" in x]
@@ -92,12 +118,14 @@ def get_src(image):
 
             return srcs[0] if srcs else None
 
-        images = [get_src(x) for x in parsers.get_tags(doc, tag="img")]
+        images = [get_src(x) for x in index.tags("img")]
         images = [x for x in images if x]
 
         return images
 
-    def _get_top_image(self, doc: HtmlElement, top_node: HtmlElement, article_url: str) -> str:
+    def _get_top_image(
+        self, index: parsers.DocumentIndex, top_node: HtmlElement, article_url: str, meta_image: str
+    ) -> str:
         def node_distance(node1, node2):
             path1 = node1.getroottree().getpath(node1).split("/")
             path2 = node2.getroottree().getpath(node2).split("/")
@@ -109,15 +137,15 @@ def node_distance(node1, node2):
 
         # If fetch_images is False, return meta_image without downloading for validation
         if not self.config.fetch_images:
-            return self.meta_image if self.meta_image else ""
+            return meta_image if meta_image else ""
 
         # If fetch_images is True, validate image sizes by downloading
-        if self.meta_image:
-            if self._check_image_size(self.meta_image, article_url):
-                return self.meta_image
+        if meta_image:
+            if self._check_image_size(meta_image, article_url):
+                return meta_image
 
         img_cand = []
-        for img in parsers.get_tags(doc, tag="img"):
+        for img in index.tags("img"):
             if not img.get("src"):
                 continue
             if img.get("src").startswith("data:"):
@@ -163,7 +191,50 @@ def _check_image_size(self, url: str, referer: str | None) -> bool:
 
         return True
 
-    def _fetch_image(self, url: str, referer: str | None) -> Image.Image | None:
+    def _parse_image(self, url: str, headers, chunks: Iterator[bytes], referer: str | None) -> "Image.Image | None":
+        """Feeds the chunks of an image download to the PIL parser, until
+        the image header (and size) is known.
+        """
+        content_type = headers.get("Content-Type")
+
+        if not content_type or "image" not in content_type.lower():
+            return None
+
+        # PIL is slow to import, it is only needed when images are fetched
+        from PIL import ImageFile  # pylint: disable=import-outside-toplevel
+
+        p = ImageFile.Parser()
+        for new_data in chunks:
+            try:
+                p.feed(new_data)
+            except (OSError, ValueError) as e:
+                log.warning(
+                    "error %s while fetching: %s refer: %s",
+                    str(e),
+                    url,
+                    referer,
+                )
+                return None
+            except Exception as e:
+                # For some favicon.ico images, the image is so small
+                # that our PIL feed() method fails a length test.
+                is_favicon = urls.url_to_filetype(url) == "ico"
+                if not is_favicon:
+                    raise e
+                return None
+            if p.image:
+                break
+        return p.image
+
+    def _read_chunks(self, raw, received: bytearray) -> Iterator[bytes]:
+        """Reads a streamed response, keeping a copy of what was read in `received`"""
+        data = raw.read(self._chunksize)
+        while data:
+            received.extend(data)
+            yield data
+            data = raw.read(self._chunksize)
+
+    def _fetch_image(self, url: str, referer: str | None) -> "Image.Image | None":
         def clean_url(url):
             """Url quotes unicode data out of urls"""
             if not isinstance(url, str):
@@ -174,7 +245,7 @@ def clean_url(url):
             return url
 
         requests_params = copy(self.config.requests_params)
-        requests_params["headers"]["Referer"] = referer
+        requests_params["headers"] = {**requests_params.get("headers", {}), "Referer": referer}
         max_retries = self.config.top_image_settings["max_retries"]
 
         cur_try = 0
@@ -182,42 +253,32 @@ def clean_url(url):
         if not url or not url.startswith(("http://", "https://")):
             return None
 
+        archive = get_archive(self.config)
+        if archive is not None and self.config.http_archive_mode == REPLAY:
+            record = archive.load(url, method=IMAGE_PROBE)
+            if record is None:
+                return None
+            body = record["body"]
+            chunks: Iterator[bytes] = (body[i : i + self._chunksize] for i in range(0, len(body), self._chunksize))
+            return self._parse_image(url, CaseInsensitiveDict(record["headers"]), chunks, referer)
+
         response = None
         while True:
             try:
-                response = session.get(
+                response = session_pool.get(self.config).get(
                     url,
                     stream=True,
                     **requests_params,
                 )
 
-                content_type = response.headers.get("Content-Type")
-
-                if not content_type or "image" not in content_type.lower():
-                    return None
-
-                p = ImageFile.Parser()
-                new_data = response.raw.read(self._chunksize)
-                while not p.image and new_data:
-                    try:
-                        p.feed(new_data)
-                    except (OSError, ValueError) as e:
-                        log.warning(
-                            "error %s while fetching: %s refer: %s",
-                            str(e),
-                            url,
-                            requests_params["headers"].get("Referer"),
-                        )
-                        return None
-                    except Exception as e:
-                        # For some favicon.ico images, the image is so small
-                        # that our PIL feed() method fails a length test.
-                        is_favicon = urls.url_to_filetype(url) == "ico"
-                        if not is_favicon:
-                            raise e
-                        return None
-                    new_data = response.raw.read(self._chunksize)
-                return p.image
+                received = bytearray()
+                chunks = self._read_chunks(response.raw, received)
+                image = self._parse_image(url, response.headers, chunks, referer)
+                if archive is not None:
+                    # Only the bytes needed to get the image size are kept
+                    response._content = bytes(received)  # pylint: disable=protected-access
+                    archive.record(url, response, method=IMAGE_PROBE)
+                return image
             except requests.exceptions.RequestException:
                 cur_try += 1
                 if cur_try >= max_retries:
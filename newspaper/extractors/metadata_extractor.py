@@ -13,30 +13,30 @@
 class MetadataExtractor:
     def __init__(self, config: Configuration) -> None:
         self.config = config
-        self.meta_data: dict[str, Any] = {
-            "language": None,
-            "type": None,
-            "canonical_link": None,
-            "site_name": None,
-            "description": None,
-            "keywords": None,
-            "tags": None,
-            "data": None,
-        }
 
-    def parse(self, article_url: str, doc: HtmlElement) -> dict[str, Any]:
-        """Parse the article's HTML for any known metadata attributes"""
-        self.meta_data["language"] = self._get_meta_language(doc)
-        self.meta_data["type"] = self._get_meta_field(doc, "og:type")
-        self.meta_data["canonical_link"] = self._get_canonical_link(article_url, doc)
-        self.meta_data["site_name"] = self._get_meta_field(doc, "og:site_name")
-        self.meta_data["description"] = self._get_meta_field(doc, ["description", "og:description"])
-        self.meta_data["keywords"] = [k.strip() for k in self._get_meta_field(doc, "keywords").split(",")]
-        self.meta_data["data"] = self._get_metadata(doc)
+    def parse(self, article_url: str, doc: HtmlElement, index: parsers.DocumentIndex | None = None) -> dict[str, Any]:
+        """Parse the article's HTML for any known metadata attributes
 
-        return self.meta_data
+        Args:
+            article_url (str): The article url
+            doc (HtmlElement): The DOM for the whole article page
+            index (parsers.DocumentIndex, optional): index of `doc`, shared
+                with the other extractors. Created if not given.
+        """
+        if index is None:
+            index = parsers.DocumentIndex(doc)
+        return {
+            "language": self._get_meta_language(doc, index),
+            "type": self._get_meta_field(index, "og:type"),
+            "canonical_link": self._get_canonical_link(article_url, index),
+            "site_name": self._get_meta_field(index, "og:site_name"),
+            "description": self._get_meta_field(index, ["description", "og:description"]),
+            "keywords": [k.strip() for k in self._get_meta_field(index, "keywords").split(",")],
+            "tags": None,
+            "data": self._get_metadata(index),
+        }
 
-    def _get_meta_language(self, doc: HtmlElement) -> str | None:
+    def _get_meta_language(self, doc: HtmlElement, index: parsers.DocumentIndex) -> str | None:
         """Return the language string of the article, or None if it cannot be
         determined.
         """
@@ -61,7 +61,7 @@ def get_if_valid(s: str | None) -> str | None:
             return attr
 
         for elem in META_LANGUAGE_TAGS:
-            meta_tag = parsers.get_tags(doc, tag=elem["tag"], attribs={elem["attr"]: elem["value"]})
+            meta_tag = index.get_tags(tag=elem["tag"], attribs={elem["attr"]: elem["value"]})
 
             if meta_tag:
                 attr = get_if_valid(meta_tag[0])
@@ -70,16 +70,16 @@ def get_if_valid(s: str | None) -> str | None:
 
         return None
 
-    def _get_canonical_link(self, article_url: str, doc: HtmlElement) -> str | None:
+    def _get_canonical_link(self, article_url: str, index: parsers.DocumentIndex) -> str | None:
         """Return the article's canonical URL
 
         Gets the first available value of:
         1. The rel=canonical tag
         2. The og:url tag
         """
-        candidates = [node.get("href") for node in parsers.get_tags(doc, tag="link", attribs={"rel": "canonical"})]
+        candidates = [node.get("href") for node in index.get_tags(tag="link", attribs={"rel": "canonical"})]
 
-        candidates.append(self._get_meta_field(doc, "og:url"))
+        candidates.append(self._get_meta_field(index, "og:url"))
         candidates = [c.strip() for c in candidates if c and c.strip()]
 
         if candidates:
@@ -114,10 +114,10 @@ def _get_canonical_link(self, article_url: str, doc: HtmlElement) -> str | None:
 
         return None
 
-    def _get_metadata(self, doc: HtmlElement) -> dict[str, Any]:
+    def _get_metadata(self, index: parsers.DocumentIndex) -> dict[str, Any]:
         """Extracts metadata from the article's HTML"""
         data: dict[str, Any] = {}
-        properties = parsers.get_tags(doc, "meta")
+        properties = index.get_tags("meta")
         for prop in properties:
             key = prop.attrib.get("property") or prop.attrib.get("name")
             value = prop.attrib.get("content") or prop.attrib.get("value")
@@ -162,15 +162,15 @@ def _get_tags(self, doc: HtmlElement) -> set[str]:
         if not elements:
             return set()
 
-        tags = [parsers.get_text(el) for el in elements if parsers.get_text(el)]
-        return set(tags)
+        tags = [parsers.get_text(el) for el in elements]
+        return {tag for tag in tags if tag}
 
-    def _get_meta_field(self, doc: HtmlElement, fields: str | list[str]) -> str:
+    def _get_meta_field(self, index: parsers.DocumentIndex, fields: str | list[str]) -> str:
         """Extract a given meta field from document."""
         if isinstance(fields, str):
             fields = [fields]
         for f in fields:
-            meta_fields = parsers.get_metatags(doc, value=f)
+            meta_fields = index.get_metatags(value=f)
             for meta_field in meta_fields:
                 val = meta_field.get("content", "").strip()
                 if val:
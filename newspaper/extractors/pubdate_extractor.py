@@ -1,7 +1,6 @@
 import re
 from datetime import datetime
 
-from dateutil.parser import parse as date_parser
 from lxml.html import HtmlElement
 
 import newspaper.parsers as parsers
@@ -13,9 +12,8 @@
 class PubdateExtractor:
     def __init__(self, config: Configuration) -> None:
         self.config = config
-        self.pubdate: datetime | None = None
 
-    def parse(self, article_url: str, doc: HtmlElement) -> datetime | None:
+    def parse(self, article_url: str, doc: HtmlElement, index: parsers.DocumentIndex | None = None) -> datetime | None:
         """3 strategies for publishing date extraction. The strategies
         are descending in accuracy and the next strategy is only
         attempted if a preferred one fails.
@@ -23,13 +21,21 @@ def parse(self, article_url: str, doc: HtmlElement) -> datetime | None:
         1. Pubdate from URL
         2. Pubdate from metadata
         3. Raw regex searches in the HTML + added heuristics
+
+        Args:
+            article_url (str): The article url
+            doc (HtmlElement): The DOM for the whole article page
+            index (parsers.DocumentIndex, optional): index of `doc`, shared
+                with the other extractors. Created if not given.
         """
+        if index is None:
+            index = parsers.DocumentIndex(doc, self.config.max_ld_json_size)
+        from dateutil.parser import parse as date_parser  # pylint: disable=import-outside-toplevel
 
         def parse_date_str(date_str):
             if date_str:
                 try:
-                    self.pubdate = date_parser(date_str)
-                    return self.pubdate
+                    return date_parser(date_str)
                 except (ValueError, OverflowError, AttributeError, TypeError):
                     # near all parse failures are due to URL dates without a day
                     # specifier, e.g. /2014/04/
@@ -44,7 +50,7 @@ def parse_date_str(date_str):
                 date_matches.append((datetime_obj, 10))  # date and matchscore
 
         # yoast seo structured data or json-ld
-        json_ld_scripts = parsers.get_ld_json_object(doc)
+        json_ld_scripts = index.get_ld_json_object()
 
         for script_tag in json_ld_scripts:
             if "@graph" in script_tag:
@@ -72,7 +78,7 @@ def parse_date_str(date_str):
                             date_matches.append((datetime_obj, 7))
 
         # get <time> tags
-        for item in parsers.get_tags(doc, tag="time"):
+        for item in index.get_tags(tag="time"):
             if item.get("datetime"):
                 date_str = item.get("datetime")
                 datetime_obj = parse_date_str(date_str)
@@ -84,7 +90,7 @@ def parse_date_str(date_str):
         candidates = []
 
         for known_meta_info in PUBLISH_DATE_META_INFO:
-            candidates.extend(parsers.get_metatags(doc, value=known_meta_info))
+            candidates.extend(index.get_metatags(value=known_meta_info))
         candidates = [(x, "content") for x in candidates]  # property that contains
         # the date
         # is always 'content'
@@ -92,8 +98,7 @@ def parse_date_str(date_str):
             candidates.extend(
                 [
                     (x, known_meta_tag["content"])
-                    for x in parsers.get_elements_by_attribs(
-                        doc,
+                    for x in index.get_elements_by_attribs(
                         attribs={known_meta_tag["attribute"]: known_meta_tag["value"]},
                     )
                 ]
@@ -114,5 +119,4 @@ def parse_date_str(date_str):
                 date_matches.append((datetime_obj, score))
 
         date_matches.sort(key=lambda x: x[1], reverse=True)
-        self.pubdate = date_matches[0][0] if date_matches else None
-        return self.pubdate
+        return date_matches[0][0] if date_matches else None
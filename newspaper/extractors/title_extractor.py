@@ -11,9 +11,8 @@
 class TitleExtractor:
     def __init__(self, config: Configuration) -> None:
         self.config = config
-        self.title: str = ""
 
-    def parse(self, doc: HtmlElement) -> str:
+    def parse(self, doc: HtmlElement, index: parsers.DocumentIndex | None = None) -> str:
         """Fetch the article title and analyze it
 
         Assumptions:
@@ -29,12 +28,18 @@ def parse(self, doc: HtmlElement) -> str:
         3. title contains h1, title contains og:title, len(h1) > len(og:title), use h1
         4. title starts with og:title, use og:title
         5. use title, after splitting
+
+        Args:
+            doc (HtmlElement): The DOM for the whole article page
+            index (parsers.DocumentIndex, optional): index of `doc`, shared
+                with the other extractors. Created if not given.
         """
-        self.title = ""
-        title_element = parsers.get_tags(doc, tag="title")
+        if index is None:
+            index = parsers.DocumentIndex(doc)
+        title_element = index.get_tags(tag="title")
         # no title found
         if title_element is None or len(title_element) == 0:
-            return self.title
+            return ""
 
         # title elem found
         title_text = parsers.get_text(title_element[0])
@@ -45,7 +50,7 @@ def parse(self, doc: HtmlElement) -> str:
         # - too short texts (fewer than 2 words) are discarded
         # - clean double spaces
         title_text_h1 = ""
-        title_element_h1_list = parsers.get_tags(doc, tag="h1") or []
+        title_element_h1_list = index.get_tags(tag="h1") or []
         title_text_h1_list = [parsers.get_text(tag) for tag in title_element_h1_list]
         if title_text_h1_list:
             # sort by len and set the longest
@@ -60,7 +65,7 @@ def parse(self, doc: HtmlElement) -> str:
         # title from og:title
         def get_fb_title():
             for known_meta_tag in TITLE_META_INFO:
-                meta_tags = parsers.get_metatags(doc, value=known_meta_tag)
+                meta_tags = index.get_metatags(value=known_meta_tag)
                 for meta_tag in meta_tags:
                     title_text_fb = meta_tag.get("content", "").strip()
                     if title_text_fb:
@@ -116,9 +121,7 @@ def get_fb_title():
         if filter_title_text_h1 == filter_title:
             title = title_text_h1
 
-        self.title = title.strip()
-
-        return self.title
+        return title.strip()
 
     def _split_title(self, title: str, delimiter: str, hint: str | None = None):
         """Split the title to best part possible"""
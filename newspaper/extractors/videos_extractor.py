@@ -17,19 +17,25 @@ class VideoExtractor:
 
     def __init__(self, config: Configuration):
         self.config = config
-        self.movies: list[Video] = []
 
-    def parse(self, doc: HtmlElement, top_node: HtmlElement) -> list[Video]:
+    def parse(
+        self,
+        doc: HtmlElement,
+        top_node: HtmlElement,
+        index: parsers.DocumentIndex | None = None,
+    ) -> list[Video]:
         """Extracts video information from the top node
 
         Args:
             doc (HtmlElement): document root
             top_node (HtmlElement): Top article node
+            index (parsers.DocumentIndex, optional): index of `doc`, shared
+                with the other extractors. Created if not given.
 
         Returns:
             list[Video]: List of video objects
         """
-        self.movies = []
+        movies: list[Video] = []
 
         if top_node is not None:
             candidates = parsers.get_elements_by_tagslist(top_node, VIDEOS_TAGS)
@@ -39,9 +45,11 @@ def parse(self, doc: HtmlElement, top_node: HtmlElement) -> list[Video]:
                 if parser_func:
                     video = parser_func(candidate)
                     if video:
-                        self.movies.append(video)
+                        movies.append(video)
         if doc is not None:
-            json_ld_scripts = parsers.get_ld_json_object(doc)
+            if index is None:
+                index = parsers.DocumentIndex(doc, self.config.max_ld_json_size)
+            json_ld_scripts = index.get_ld_json_object()
 
             for script_tag in json_ld_scripts:
                 if "@graph" in script_tag:
@@ -59,9 +67,9 @@ def parse(self, doc: HtmlElement, top_node: HtmlElement) -> list[Video]:
                         m.embed_code = item.get("embedUrl")
                         m.provider = self._get_provider(m.src)
 
-                        self.movies.append(m)
+                        movies.append(m)
 
-        return self.movies
+        return movies
 
     def parse_iframe(self, node: HtmlElement):
         """Parse function for the iframe tag
@@ -1,21 +1,51 @@
 """Helper functions for http requests and remote data fetching."""
 
+import asyncio
 import logging
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+import ssl
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+from urllib.parse import urlparse
+from warnings import warn
 
 import requests
-import tldextract
 from requests import RequestException, Response
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from w3lib.encoding import html_to_unicode
 
 from newspaper import parsers
 from newspaper.configuration import Configuration
-from newspaper.exceptions import ArticleBinaryDataException, ArticleException, RobotsException
-from newspaper.network_hooks import hookable_func
+from newspaper.exceptions import (
+    ArchiveMissException,
+    ArticleBinaryDataException,
+    ArticleException,
+    RobotsException,
+)
+from newspaper.network_archive import REPLAY, HttpArchive, get_archive
+from newspaper.network_cache import HostCapabilityCache, conditional_cache, get_host_key, host_cache
+from newspaper.network_hooks import ahookable_func, hookable_func
+from newspaper.network_retry import RetryPolicy, circuit_breaker
+from newspaper.network_scheduler import HostScheduler
 
 DEFAULT_ENCODING = "utf-8"
 
+# Number of bytes from the beginning of a response checked for binary content
+BINARY_SNIFF_SIZE = 1000
+
+# Request errors that are retried, a connection reset in the middle of the
+# body surfaces as a ChunkedEncodingError
+RETRIED_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
 log = logging.getLogger(__name__)
 
 
@@ -51,26 +81,101 @@ def get_session() -> requests.Session:
     return sess
 
 
-session = get_session()
+class SessionPool:
+    """Thread-safe pool of http sessions, shared by the configurations that
+    need the same connection pool sizes. The sessions are created with
+    `factory` (default :any:`get_session`).
+
+    The connection pools of a session scale with `config`.`number_threads`,
+    so that every worker thread can keep a connection open to the same host
+    (up to `config`.`max_connections_per_host`), instead of the connections
+    being discarded when the default pool of 10 is full.
+    The session headers are never changed: the headers of the configuration
+    are sent with each request.
+    """
+
+    def __init__(self, factory: Callable[[], requests.Session] = get_session):
+        self.factory = factory
+        self._sessions: dict[tuple[int, int], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def pool_sizes(config: Configuration | None = None) -> tuple[int, int]:
+        """Returns the number of host pools to keep and the number of
+        connections kept per host for `config`.
+        """
+        if config is None:
+            return DEFAULT_POOLSIZE, DEFAULT_POOLSIZE
+        threads = max(config.number_threads, DEFAULT_POOLSIZE)
+        per_host = threads
+        if config.max_connections_per_host:
+            per_host = min(per_host, config.max_connections_per_host)
+        return threads, per_host
+
+    def get(self, config: Configuration | None = None) -> requests.Session:
+        """Returns the session to use for `config`."""
+        key = self.pool_sizes(config)
+        with self._lock:
+            sess = self._sessions.get(key)
+            if sess is None:
+                sess = self.factory()
+                _resize_pools(sess, *key)
+                self._sessions[key] = sess
+            return sess
+
+    def clear(self):
+        """Closes and forgets all the sessions."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for sess in sessions:
+            sess.close()
+
+
+def _resize_pools(sess: requests.Session, pool_connections: int, pool_maxsize: int):
+    """Resizes the connection pools of the adapters already mounted on the
+    session (keeping custom adapters, e.g. the ones from cloudscraper).
+    """
+    for adapter in sess.adapters.values():
+        if isinstance(adapter, HTTPAdapter) and (
+            adapter._pool_connections,  # pylint: disable=protected-access
+            adapter._pool_maxsize,  # pylint: disable=protected-access
+        ) != (pool_connections, pool_maxsize):
+            adapter._pool_connections = pool_connections  # pylint: disable=protected-access
+            adapter._pool_maxsize = pool_maxsize  # pylint: disable=protected-access
+            adapter.init_poolmanager(
+                pool_connections,
+                pool_maxsize,
+                block=adapter._pool_block,  # pylint: disable=protected-access
+            )
+
+
+session_pool = SessionPool()
+session = session_pool.get()
 
 
 def reset_session() -> requests.Session:
-    """Resets the session variable to a new requests.Session object. Destroys any
-    cookies and other session data that may have been stored in the previous
-    object.
+    """Resets the http sessions. Destroys any cookies and other session data
+    that may have been stored in the previous sessions.
 
     Returns:
-        requests.Session: The newly created session object.
+        requests.Session: The newly created default session object.
     """
     global session  # pylint: disable=global-statement
-    session = get_session()
+    session_pool.clear()
+    session = session_pool.get()
     return session
 
 
 def do_cache(func: Callable):
     """A decorator that caches the result of a function based on its arguments.
     expects url as one argument and caches the result based on the domain
-    of the url.
+    of the url. The results are kept in the :any:`host_cache`, under the
+    name of the decorated function.
+
+    .. deprecated:: 0.9.5
+        Use :any:`HostCapabilityCache.get_or_set` on the :any:`host_cache`
+        instead.
 
     Args:
         func (Callable): The function to be cached.
@@ -78,35 +183,42 @@ def do_cache(func: Callable):
     Returns:
         Callable: The wrapped function that caches the result.
     """
+    warn(
+        "`do_cache` is deprecated, use `host_cache.get_or_set` instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
 
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        if not hasattr(func, "cache"):
-            func.cache = {}
         if kwargs.get("url"):
             url = kwargs["url"]
         else:
             url = args[0] if len(args) > 0 else None
-        if url:
-            tld = tldextract.extract(url).domain + "." + tldextract.extract(url).suffix
-        else:
+        if not url:
             return func(*args, **kwargs)
 
-        if tld not in func.cache:
-            func.cache[tld] = func(*args, **kwargs)
-        return func.cache[tld]
+        return host_cache.get_or_set(func.__name__, get_host_key(url), lambda: func(*args, **kwargs))
 
     return wrapper
 
 
-@do_cache
 def has_get_ranges(url: str) -> bool:
-    """Does this url support HTTP Range requests?"""
+    """Does this url support HTTP Range requests? The result is cached
+    per domain in the :any:`host_cache`.
+    """
+    return host_cache.get_or_set(HostCapabilityCache.RANGES, get_host_key(url), lambda: _probe_get_ranges(url))
+
+
+def _probe_get_ranges(url: str) -> bool:
+    url = host_cache.get(HostCapabilityCache.REDIRECT, url, url)
     try:
         resp = session.head(url, timeout=3, allow_redirects=False)
         if resp.status_code in [301, 302, 303, 307, 308]:
             new_url = resp.headers.get("Location")
             if new_url:
                 resp = session.head(url, timeout=3, allow_redirects=True)
+                host_cache.set(HostCapabilityCache.REDIRECT, url, resp.url)
                 url = new_url
 
         if "Accept-Ranges" in resp.headers:
@@ -121,24 +233,64 @@ def has_get_ranges(url: str) -> bool:
     return False
 
 
+def _is_binary_headers(headers) -> bool:
+    """Do the response headers announce a binary payload?"""
+    content_type = headers.get("Content-Type")
+    if content_type:
+        if content_type.startswith("application"):
+            if "json" not in content_type and "xml" not in content_type:
+                return True
+        if content_type.startswith(("image", "video", "audio", "font")):
+            return True
+
+    if "Content-Disposition" in headers:
+        return True
+
+    return False
+
+
+def _is_binary_content(content: str | bytes | None) -> bool:
+    """Does the first KB of a response body look like binary data?"""
+    if content is None:
+        return False
+
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+
+    content = content[:BINARY_SNIFF_SIZE]
+
+    if len(content) == 0:
+        return False
+
+    if "<html" in content:
+        return False
+
+    chars = len(
+        [
+            char
+            for char in [ord(c) if isinstance(c, str) else c for c in content]
+            if 31 < char < 128 or char in [9, 10, 13]
+        ]
+    )
+    return chars / len(content) < 0.6  # 40% of the content is binary
+
+
 def is_binary_url(url: str) -> bool:
-    """Does this url point to a binary file?"""
+    """Does this url point to a binary file? Positive results are cached
+    in the :any:`host_cache`.
+    """
+    if host_cache.get(HostCapabilityCache.BINARY, url):
+        return True
+    if _probe_binary_url(url):
+        host_cache.set(HostCapabilityCache.BINARY, url, True)
+        return True
+    return False
+
+
+def _probe_binary_url(url: str) -> bool:
     try:
         resp = session.head(url, timeout=3, allow_redirects=True)
-        if "Content-Type" in resp.headers:
-            if resp.headers["Content-Type"].startswith("application"):
-                if "json" not in resp.headers["Content-Type"] and "xml" not in resp.headers["Content-Type"]:
-                    return True
-            if resp.headers["Content-Type"].startswith("image"):
-                return True
-            if resp.headers["Content-Type"].startswith("video"):
-                return True
-            if resp.headers["Content-Type"].startswith("audio"):
-                return True
-            if resp.headers["Content-Type"].startswith("font"):
-                return True
-
-        if "Content-Disposition" in resp.headers:
+        if _is_binary_headers(resp.headers):
             return True
 
         headers = dict(session.headers).copy()
@@ -164,28 +316,7 @@ def is_binary_url(url: str) -> bool:
         if resp.status_code > 399 or content is None:
             return False  # We cannot test if we get an error
 
-        if isinstance(content, bytes):
-            content = content.decode("utf-8", errors="replace")
-
-        content = content[:1000]
-
-        if len(content) == 0:
-            return False
-
-        if "<html" in content:
-            return False
-
-        chars = len(
-            [
-                char
-                for char in [ord(c) if isinstance(c, str) else c for c in content]
-                if 31 < char < 128 or char in [9, 10, 13]
-            ]
-        )
-        if chars / len(content) < 0.6:  # 40% of the content is binary
-            return True
-
-        return False
+        return _is_binary_content(content)
 
     except RequestException as e:
         log.debug("is_binary_url() error. %s on URL: %s", e, url)
@@ -195,6 +326,14 @@ def is_binary_url(url: str) -> bool:
 @hookable_func
 def do_request(url: str, config: Configuration, method: str = "get", data: str | None = None) -> Response:
     """Perform a HTTP GET request to the specified URL using the provided configuration.
+    If `config`.`allow_binary_content` is False, the response is streamed and
+    the Content-Type headers and the first KB of the body are checked before
+    the rest of the body is read, so binary files are detected (and aborted)
+    in the same round trip. If `config`.`max_content_bytes` is set, the
+    download stops after that many bytes and ``response.truncated`` is True.
+    If `config`.`http_archive_mode` is ``"record"``, the response is also
+    appended to the http archive, with ``"replay"`` it is read from the
+    archive instead of being downloaded.
 
     Args:
         url (str): The URL to send the request to.
@@ -205,32 +344,212 @@ def do_request(url: str, config: Configuration, method: str = "get", data: str |
     Returns:
         requests.Response: The response object containing the server's response
             to the request.
+
+    Raises:
+        ArticleBinaryDataException: if the url points to binary content and
+            `config`.`allow_binary_content` is False.
+        ArchiveMissException: in replay mode, if the url is not in the archive.
     """
-    if "headers" in config.requests_params:
-        session.headers.update(config.requests_params["headers"])
+    archive = get_archive(config)
+    if archive is not None and config.http_archive_mode == REPLAY:
+        return _replay_response(archive, url, method, data)
 
-    if not config.allow_binary_content:
-        if is_binary_url(url):
-            raise ArticleBinaryDataException(f"Article is binary data: {url}")
+    if config.persist_host_cache:
+        host_cache.enable_persistence()
 
-    if method == "get":
-        response = session.get(
-            url=url,
-            **config.requests_params,
-            data=data,
-        )
-    elif method == "post":
-        response = session.post(
-            url=url,
-            **config.requests_params,
-            data=data,
-        )
+    if not config.allow_binary_content and host_cache.get(HostCapabilityCache.BINARY, url):
+        raise ArticleBinaryDataException(f"Article is binary data: {url}")
+
+    params = dict(config.requests_params)
+    stream = not config.allow_binary_content or config.max_content_bytes is not None
+    if stream:
+        params["stream"] = True
+
+    cache_entry = None
+    use_cache = config.conditional_requests and method == "get"
+    if use_cache:
+        cache_entry = conditional_cache.load(url)
+        if cache_entry is not None:
+            params["headers"] = {**(params.get("headers") or {}), **conditional_cache.validators(cache_entry)}
+
+    try:
+        response = _send_with_retries(url, config, method, params, data, stream)
+    except ArticleBinaryDataException:
+        host_cache.set(HostCapabilityCache.BINARY, url, True)
+        raise
+
+    if cache_entry is not None and response.status_code == 304:
+        response.close()
+        response = _get_cached_response(cache_entry)
     else:
+        _remember_redirect(url, response)
+        if use_cache:
+            _store_in_cache(url, response)
+
+    if archive is not None:
+        archive.record(url, response, method, data)
+
+    return response
+
+
+def _send_with_retries(
+    url: str, config: Configuration, method: str, params: dict, data: str | None, stream: bool = False
+) -> Response:
+    """Sends the request, retrying connection errors, timeouts and the status
+    codes allowed by `config`.`retry_settings`. The outcome of every attempt
+    is reported to the :any:`circuit_breaker`. If `stream` is True, the body
+    is read (see :any:`_read_body`) as part of the attempt, so a connection
+    dropped in the middle of the body is retried as well.
+
+    Raises:
+        CircuitOpenException: if the domain had too many consecutive failures.
+    """
+    if method not in ("get", "post"):
         raise NotImplementedError(f"Method {method} not implemented")
+    sess = session_pool.get(config)
+    send: Callable[..., Response] = sess.post if method == "post" else sess.get
+
+    policy = RetryPolicy.from_config(config)
+    domain = get_host_key(url)
+    attempt = 0
+    while True:
+        trial = circuit_breaker.check(domain, config)
+        try:
+            response = send(url=url, **params, data=data)
+            retry = policy.should_retry(attempt, response.status_code)
+            if stream and not retry:
+                _read_body(response, url, config)
+        except RETRIED_EXCEPTIONS:
+            circuit_breaker.record_failure(domain, config)
+            if not policy.should_retry(attempt):
+                raise
+            delay = policy.delay(attempt)
+        except RequestException:
+            circuit_breaker.record_failure(domain, config)
+            raise
+        else:
+            if response.status_code not in policy.status_codes:
+                circuit_breaker.record_success(domain)
+                return response
+            circuit_breaker.record_failure(domain, config)
+            if not retry:
+                return response
+            delay = policy.delay(attempt, response.headers.get("Retry-After"))
+            response.close()
+        finally:
+            if trial:
+                circuit_breaker.release_trial(domain)
+
+        log.debug("Retrying %s in %.2f seconds (attempt %s)", url, delay, attempt + 1)
+        time.sleep(delay)
+        attempt += 1
+
+
+def _replay_response(archive: HttpArchive, url: str, method: str, data: str | None) -> Response:
+    """Builds the response for a request from the http archive
+
+    Raises:
+        ArchiveMissException: if the request was not recorded.
+    """
+    record = archive.load(url, method, data)
+    if record is None:
+        raise ArchiveMissException(f"{method.upper()} {url} is not in the http archive {archive.path}")
 
+    response = _build_response(
+        record["final_url"], record["status"], record["reason"], record["headers"], record["body"]
+    )
+    response.history = [
+        _build_response(h["url"], h["status"], h["reason"], h["headers"], b"") for h in record["history"]
+    ]
+    _set_truncated(response, record.get("truncated", False))
     return response
 
 
+def _get_cached_response(cache_entry: dict) -> Response:
+    """Builds the response for a ``304 Not Modified`` answer from the cached entry"""
+    conditional_cache.record_hit(cache_entry)
+    return _build_response(cache_entry["url"], 200, "OK", cache_entry["headers"], cache_entry["content"])
+
+
+def _store_in_cache(url: str, response: Response):
+    """Counts a conditional cache miss and stores the response, if possible"""
+    conditional_cache.record_miss()
+    if response.status_code == 200 and not is_truncated(response):
+        conditional_cache.store(url, response.url, response.headers, response.content)
+
+
+def is_truncated(response: Response) -> bool:
+    """True if the download of `response` was stopped at
+    `config`.`max_content_bytes`, see :any:`do_request`.
+    """
+    return bool(getattr(response, "truncated", False))
+
+
+def _set_truncated(response: Response, truncated: bool):
+    """Sets the ``truncated`` flag of `response`, read by :any:`is_truncated`"""
+    vars(response)["truncated"] = truncated
+
+
+def _remember_redirect(url: str, response: Response):
+    """Keeps track of the redirect target of `url` in the :any:`host_cache`"""
+    if response.history and response.url != url:
+        host_cache.set(HostCapabilityCache.REDIRECT, url, response.url)
+
+
+def _read_body(response: Response, url: str, config: Configuration):
+    """Reads the body of a streamed response. The body is buffered in the
+    response, as for a non-streamed request.
+    If `config`.`allow_binary_content` is False, the download is aborted as
+    soon as the headers or the first KB of the body reveal binary content, and
+    bodies with a content type listed in `config`.`ignored_content_types_defaults`
+    are not downloaded at all.
+    At most `config`.`max_content_bytes` bytes are read. If the body was cut,
+    ``response.truncated`` is set to True.
+
+    Raises:
+        ArticleBinaryDataException: if the response is binary content.
+    """
+    _set_truncated(response, False)
+    if not config.allow_binary_content:
+        if _is_binary_headers(response.headers):
+            response.close()
+            raise ArticleBinaryDataException(f"Article is binary data: {url}")
+
+        if response.headers.get("content-type") in config.ignored_content_types_defaults:
+            response.close()
+            response._content = b""  # pylint: disable=protected-access
+            return
+
+    sniff = not config.allow_binary_content and response.status_code < 400
+    limit = config.max_content_bytes
+    body = bytearray()
+    try:
+        for chunk in response.iter_content(chunk_size=BINARY_SNIFF_SIZE):
+            body += chunk
+            if sniff and len(body) >= BINARY_SNIFF_SIZE:
+                sniff = False
+                _check_binary_content(response, url, body)
+            if limit is not None and len(body) > limit:
+                del body[limit:]
+                _set_truncated(response, True)
+                response.close()
+                break
+        if sniff:
+            _check_binary_content(response, url, body)
+    except RequestException:
+        response.close()
+        raise
+
+    response._content = bytes(body)  # pylint: disable=protected-access
+
+
+def _check_binary_content(response: Response, url: str, body: bytearray):
+    """Closes the response and raises if the beginning of the body is binary"""
+    if _is_binary_content(bytes(body[:BINARY_SNIFF_SIZE])):
+        response.close()
+        raise ArticleBinaryDataException(f"Article is binary data: {url}")
+
+
 def get_html(
     url: str,
     config: Configuration | None = None,
@@ -248,17 +567,26 @@ def get_html(
     config = config or Configuration()
     try:
         html, status_code, _ = get_html_status(url, config, response)
-        if status_code >= 400:
-            log.warning("get_html() bad status code %s on URL: %s", status_code, url)
-            if config.http_success_only:
-                raise ArticleException(f"Http error when downloading {url}. Status code: {status_code}")
-            return ""
+        html = _check_html_status(url, config, html, status_code)
     except RequestException as e:
         log.debug("get_html() error. %s on URL: %s", e, url)
 
     return html
 
 
+def _check_html_status(url: str, config: Configuration, html: str, status_code: int) -> str:
+    """Returns the html if the status code is a success, an empty string
+    otherwise. Raises an :any:`ArticleException` for http errors if
+    `config`.`http_success_only` is True.
+    """
+    if status_code >= 400:
+        log.warning("get_html() bad status code %s on URL: %s", status_code, url)
+        if config.http_success_only:
+            raise ArticleException(f"Http error when downloading {url}. Status code: {status_code}")
+        return ""
+    return html
+
+
 def get_html_status(
     url: str,
     config: Configuration | None = None,
@@ -280,6 +608,15 @@ def get_html_status(
 
     response = do_request(url, config)
 
+    return get_html_status_from_response(url, config, response)
+
+
+def get_html_status_from_response(
+    url: str, config: Configuration, response: Response
+) -> tuple[str, int, list[Response]]:
+    """Decodes a freshly downloaded response (see :any:`do_request`) into the
+    tuple returned by :any:`get_html_status`, logging unsuccessful status codes.
+    """
     if response.status_code != 200:
         log.warning(
             "get_html_status(): bad status code %s on URL: %s, html: %s",
@@ -319,6 +656,8 @@ def _get_html_from_response(response: Response, config: Configuration) -> str:
 def multithread_request(urls: list[str], config: Configuration | None = None) -> list[Response | None]:
     """Request multiple urls via mthreading, order of urls & requests is stable
     returns same requests but with response variables filled.
+    The urls are dispatched by a :any:`HostScheduler`, which enforces the
+    per-host politeness limits set in the configuration.
     """
     config = config or Configuration()
 
@@ -333,21 +672,388 @@ def multithread_request(urls: list[str], config: Configuration | None = None) ->
             timeout,
             requests_timeout,
         )
+    results: list[Response | None] = [None] * len(urls)
+    scheduler = HostScheduler(config)
+    for idx, future in scheduler.run(lambda url: do_request(url=url, config=config), urls):
+        url = urls[idx]
+        try:
+            results[idx] = future.result()
+        except TimeoutError:
+            log.error("multithread_request(): Thread timeout for URL: %s", url)
+        except RequestException as e:
+            log.warning("multithread_request(): Http download error %s on URL: %s", e, url)
+        except RobotsException as e:
+            log.warning("multithread_request(): Robots.txt blocked URL: %s. %s", url, e)
+
+    return results
+
+
+def multithread_request_iter(
+    urls: list[str], config: Configuration | None = None, max_in_flight: int | None = None
+) -> Iterator[tuple[str, Response | Exception]]:
+    """Completion order version of :any:`multithread_request`. Yields
+    ``(url, response)`` tuples as soon as each request completes, so a slow
+    url does not hold back the processing of the others. If a request failed,
+    the exception is yielded instead of the response.
+    At most `max_in_flight` requests (default `config`.`number_threads`) are
+    running or waiting to be consumed, which bounds the number of responses
+    kept in memory.
+    """
+    config = config or Configuration()
+    scheduler = HostScheduler(config)
+    for idx, future in scheduler.run(lambda url: do_request(url=url, config=config), urls, max_in_flight):
+        error = future.exception()
+        # BaseExceptions (KeyboardInterrupt, ...) are raised by result()
+        yield urls[idx], error if isinstance(error, Exception) else future.result()
+
+
+# ---------------------------------------------------------------------------
+# asyncio download engine
+# ---------------------------------------------------------------------------
+
+# aiohttp session shared by all the async requests issued inside
+# an ``async_session()`` context (also visible in tasks spawned from it)
+_async_session: ContextVar[Any] = ContextVar("newspaper_async_session", default=None)
+
+
+def _import_aiohttp():
+    """Import the optional aiohttp dependency, or fail with a hint on how to install it."""
+    try:
+        import aiohttp  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError(
+            "You must install aiohttp before using the asyncio download functions. \n"
+            "Try pip install aiohttp\n"
+            "or pip install newspaper4k[async]\n"
+            "or pip install newspaper4k[all]\n"
+        ) from e
+    return aiohttp
+
+
+@asynccontextmanager
+async def async_session(config: Configuration | None = None) -> AsyncIterator[Any]:
+    """Async context manager that opens an ``aiohttp.ClientSession`` shared
+    by every :any:`ado_request` awaited inside the context. The number of
+    simultaneous connections is bounded by
+    :any:`Configuration.async_max_connections`. If a session is already
+    active in the current context, it is reused.
+
+    Args:
+        config (Configuration, optional): The configuration object. Defaults to None.
+
+    Yields:
+        aiohttp.ClientSession: the active session.
+    """
+    current = _async_session.get()
+    if current is not None:
+        yield current
+        return
+
+    aiohttp = _import_aiohttp()
+    config = config or Configuration()
+    connector = aiohttp.TCPConnector(limit=config.async_max_connections)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers={"Accept-Encoding": "gzip, deflate, br"},
+    ) as sess:
+        token = _async_session.set(sess)
+        try:
+            yield sess
+        finally:
+            _async_session.reset(token)
+
+
+def _aiohttp_request_kwargs(aiohttp, url: str, config: Configuration) -> dict[str, Any]:
+    """Translate the ``requests`` parameters in `config`.`requests_params`
+    to their ``aiohttp`` equivalents.
+    """
+    params = config.requests_params
+    kwargs: dict[str, Any] = {"max_redirects": 10}
+
+    if params.get("headers"):
+        kwargs["headers"] = dict(params["headers"])
+
+    timeout = params.get("timeout")
+    if isinstance(timeout, (tuple, list)):
+        kwargs["timeout"] = aiohttp.ClientTimeout(total=None, sock_connect=timeout[0], sock_read=timeout[1])
+    elif timeout is not None:
+        kwargs["timeout"] = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    proxies = params.get("proxies") or {}
+    proxy = proxies.get(urlparse(url).scheme) or proxies.get("all")
+    if proxy:
+        kwargs["proxy"] = proxy
+
+    if params.get("cookies"):
+        kwargs["cookies"] = params["cookies"]
+
+    auth = params.get("auth")
+    if isinstance(auth, tuple):
+        kwargs["auth"] = aiohttp.BasicAuth(*auth)
+
+    if "allow_redirects" in params:
+        kwargs["allow_redirects"] = params["allow_redirects"]
+
+    verify = params.get("verify", True)
+    cert = params.get("cert")
+    if verify is False:
+        kwargs["ssl"] = False
+    elif isinstance(verify, str) or cert:
+        ssl_context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else None)
+        if cert:
+            ssl_context.load_cert_chain(*(cert if isinstance(cert, tuple) else (cert,)))
+        kwargs["ssl"] = ssl_context
+
+    return kwargs
+
+
+def _build_response(url: str, status: int, reason: str | None, headers, body: bytes) -> Response:
+    """Create a ``requests.Response`` from the parts of an async response,
+    so that the rest of the pipeline does not care which engine downloaded it.
+    """
+    merged: dict[str, str] = {}
+    for key, value in headers.items():
+        merged[key] = f"{merged[key]}, {value}" if key in merged else value
+
+    response = Response()
+    response.url = url
+    response.status_code = status
+    response.reason = reason or ""
+    response.headers = CaseInsensitiveDict(merged)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = body  # pylint: disable=protected-access
+    return response
+
+
+async def _aread_prefix(resp, size: int) -> bytes:
+    """Read (up to) the first `size` bytes of an aiohttp response body."""
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = await resp.content.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+async def _async_fetch(sess, url: str, config: Configuration, method: str, data: str | None) -> Response:
+    """Download `url` with the aiohttp session `sess` and convert the result
+    to a ``requests.Response``. ``aiohttp`` errors are mapped to the
+    equivalent ``requests`` exceptions.
+    """
+    aiohttp = _import_aiohttp()
+    if method not in ("get", "post"):
+        raise NotImplementedError(f"Method {method} not implemented")
+
+    archive = get_archive(config)
+    if archive is not None and config.http_archive_mode == REPLAY:
+        return _replay_response(archive, url, method, data)
+
+    if config.persist_host_cache:
+        host_cache.enable_persistence()
+
+    if not config.allow_binary_content and host_cache.get(HostCapabilityCache.BINARY, url):
+        raise ArticleBinaryDataException(f"Article is binary data: {url}")
+
+    kwargs = _aiohttp_request_kwargs(aiohttp, url, config)
+
+    cache_entry = None
+    use_cache = config.conditional_requests and method == "get"
+    if use_cache:
+        cache_entry = conditional_cache.load(url)
+        if cache_entry is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **conditional_cache.validators(cache_entry)}
+
+    try:
+        response = await _async_send_with_retries(aiohttp, sess, url, config, method, data, kwargs)
+    except ArticleBinaryDataException:
+        host_cache.set(HostCapabilityCache.BINARY, url, True)
+        raise
+    except aiohttp.TooManyRedirects as e:
+        raise requests.exceptions.TooManyRedirects(str(e)) from e
+    except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+        raise requests.exceptions.Timeout(str(e) or f"Timeout on URL: {url}") from e
+    except aiohttp.ClientConnectionError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+    except aiohttp.ClientPayloadError as e:
+        raise requests.exceptions.ChunkedEncodingError(str(e)) from e
+    except aiohttp.ClientError as e:
+        raise RequestException(str(e)) from e
+
+    if cache_entry is not None and response.status_code == 304:
+        response = _get_cached_response(cache_entry)
+        if archive is not None:
+            archive.record(url, response, method, data)
+        return response
+
+    _remember_redirect(url, response)
+    if use_cache:
+        _store_in_cache(url, response)
+    if archive is not None:
+        archive.record(url, response, method, data)
+
+    return response
+
+
+async def _async_send_with_retries(
+    aiohttp, sess, url: str, config: Configuration, method: str, data, kwargs: dict
+) -> Response:
+    """Asyncio version of :any:`_send_with_retries`. The body is read as part
+    of the attempt (see :any:`_aread_body`) and the result is converted to a
+    ``requests.Response``.
+    """
+    policy = RetryPolicy.from_config(config)
+    domain = get_host_key(url)
+    attempt = 0
+    while True:
+        trial = circuit_breaker.check(domain, config)
+        try:
+            resp = await sess.request(method.upper(), url, data=data, **kwargs)
+            async with resp:
+                retry = policy.should_retry(attempt, resp.status)
+                if not retry:
+                    response = await _aread_body(resp, url, config)
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+            circuit_breaker.record_failure(domain, config)
+            if not policy.should_retry(attempt):
+                raise
+            delay = policy.delay(attempt)
+        except aiohttp.ClientError:
+            circuit_breaker.record_failure(domain, config)
+            raise
+        else:
+            if resp.status not in policy.status_codes:
+                circuit_breaker.record_success(domain)
+                return response
+            circuit_breaker.record_failure(domain, config)
+            if not retry:
+                return response
+            delay = policy.delay(attempt, resp.headers.get("Retry-After"))
+        finally:
+            if trial:
+                circuit_breaker.release_trial(domain)
+
+        log.debug("Retrying %s in %.2f seconds (attempt %s)", url, delay, attempt + 1)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _aread_body(resp, url: str, config: Configuration) -> Response:
+    """Asyncio version of :any:`_read_body`. Reads the body of the aiohttp
+    response `resp` and converts it to a ``requests.Response``.
+
+    Raises:
+        ArticleBinaryDataException: if the response is binary content.
+    """
+    body = b""
+    read_body = True
+    truncated = False
+    if not config.allow_binary_content:
+        # Sniff the payload on the same connection instead of probing it first
+        if _is_binary_headers(resp.headers):
+            raise ArticleBinaryDataException(f"Article is binary data: {url}")
+        read_body = resp.headers.get("content-type") not in config.ignored_content_types_defaults
+        if read_body and resp.status < 400:
+            body = await _aread_prefix(resp, BINARY_SNIFF_SIZE)
+            if _is_binary_content(body):
+                raise ArticleBinaryDataException(f"Article is binary data: {url}")
+    if read_body:
+        if config.max_content_bytes is None:
+            body += await resp.read()
+        else:
+            body += await _aread_prefix(resp, config.max_content_bytes + 1 - len(body))
+            truncated = len(body) > config.max_content_bytes
+            body = body[: config.max_content_bytes]
+
+    response = _build_response(str(resp.url), resp.status, resp.reason, resp.headers, body)
+    _set_truncated(response, truncated)
+    response.history = [_build_response(str(h.url), h.status, h.reason, h.headers, b"") for h in resp.history]
+    return response
+
+
+@ahookable_func
+async def ado_request(url: str, config: Configuration, method: str = "get", data: str | None = None) -> Response:
+    """Asyncio version of :any:`do_request`. Performs the HTTP request using
+    ``aiohttp`` and returns the result as a ``requests.Response``, so the same
+    network hooks are fired and the same response processing applies.
+    If it runs inside an :any:`async_session` context, the shared session
+    (and connection pool) is used, otherwise a session is opened for this
+    request only.
+
+    Args:
+        url (str): The URL to send the request to.
+        config (Configuration): The configuration object containing request parameters.
+        method (str): The HTTP method to use for the request. Defaults to 'get'.
+        data (str): The data to send in the body of the request. Defaults to None.
+
+    Returns:
+        requests.Response: The response object containing the server's response
+            to the request.
+    """
+    async with async_session(config) as sess:
+        return await _async_fetch(sess, url, config, method, data)
+
+
+async def aget_html_status(
+    url: str,
+    config: Configuration | None = None,
+    response: Response | None = None,
+) -> tuple[str, int, list[Response]]:
+    """Asyncio version of :any:`get_html_status`."""
+    config = config or Configuration()
+
+    if response is not None:
+        return get_html_status(url, config, response)
+
+    response = await ado_request(url, config)
+
+    return get_html_status_from_response(url, config, response)
+
+
+async def aget_html(
+    url: str,
+    config: Configuration | None = None,
+    response: Response | None = None,
+) -> str:
+    """Asyncio version of :any:`get_html`."""
+    html = ""
+    config = config or Configuration()
+    try:
+        html, status_code, _ = await aget_html_status(url, config, response)
+        html = _check_html_status(url, config, html, status_code)
+    except RequestException as e:
+        log.debug("aget_html() error. %s on URL: %s", e, url)
+
+    return html
+
+
+async def amultithread_request(urls: list[str], config: Configuration | None = None) -> list[Response | None]:
+    """Asyncio version of :any:`multithread_request`. All urls are requested
+    concurrently on a single event loop, the number of simultaneous connections
+    is bounded by :any:`Configuration.async_max_connections`. The order of
+    the results is the same as the order of `urls`.
+    """
+    config = config or Configuration()
+
+    async with async_session(config):
+        outcomes = await asyncio.gather(
+            *[ado_request(url, config) for url in urls],
+            return_exceptions=True,
+        )
+
     results: list[Response | None] = []
-    with ThreadPoolExecutor(max_workers=config.number_threads) as tpe:
-        result_futures = [tpe.submit(do_request, url=url, config=config) for url in urls]
-        for idx, future in enumerate(result_futures):
-            url = urls[idx]
-            try:
-                results.append(future.result())
-            except TimeoutError:
-                results.append(None)
-                log.error("multithread_request(): Thread timeout for URL: %s", url)
-            except RequestException as e:
-                results.append(None)
-                log.warning("multithread_request(): Http download error %s on URL: %s", e, url)
-            except RobotsException as e:
-                results.append(None)
-                log.warning("multithread_request(): Robots.txt blocked URL: %s. %s", url, e)
+    for url, outcome in zip(urls, outcomes):
+        if isinstance(outcome, RequestException):
+            results.append(None)
+            log.warning("amultithread_request(): Http download error %s on URL: %s", outcome, url)
+        elif isinstance(outcome, RobotsException):
+            results.append(None)
+            log.warning("amultithread_request(): Robots.txt blocked URL: %s. %s", url, outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results.append(outcome)
 
     return results
@@ -0,0 +1,195 @@
+"""Offline record / replay archive of http responses.
+
+With :any:`Configuration.http_archive_mode` set to ``"record"``, every
+response downloaded by :any:`network.do_request` is appended to an archive.
+With ``"replay"``, the responses are served from the archive and the network
+is not used at all, so a corpus can be parsed again (e.g. after changing the
+extraction settings) without downloading it again, and tests are repeatable.
+
+An archive is a directory with two append-only files:
+
+- ``responses.data``: the records, each one compressed as an independent gzip
+  member (like a ``.warc.gz`` file). A record is a json header line (request,
+  final url, status, headers, redirect history) followed by the raw body.
+- ``responses.index``: one json line per record, with its key, offset and
+  length in the data file. If the same request is recorded several times,
+  the last record wins.
+
+Only one process should record into an archive at a time. Any number of
+threads and processes can replay from it.
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from newspaper import settings
+from newspaper.configuration import Configuration
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Method under which the image size probes of the image extractor are
+# archived (only the first bytes of the image are kept)
+IMAGE_PROBE = "image"
+
+# The bodies are stored decoded, so these headers do not apply anymore
+SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class HttpArchive:
+    """Indexed, append-only archive of http responses, stored in `path`.
+
+    Args:
+        path (Path | str): the directory of the archive. It is created
+            when the first response is recorded.
+    """
+
+    DATA_FILE = "responses.data"
+    INDEX_FILE = "responses.index"
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._index: dict[str, tuple[int, int]] = {}
+        self._data_writer: BinaryIO | None = None
+        self._index_writer: TextIO | None = None
+        self._reader: BinaryIO | None = None
+        self._load_index()
+
+    @staticmethod
+    def make_key(url: str, method: str = "get", data: str | None = None) -> str:
+        """The key identifying a request in the archive."""
+        key = f"{method.upper()} {url}"
+        if data:
+            data_bytes = data.encode("utf-8") if isinstance(data, str) else data
+            key += " " + hashlib.sha1(data_bytes).hexdigest()
+        return key
+
+    def _load_index(self):
+        index_file = self.path / self.INDEX_FILE
+        if not index_file.exists():
+            return
+        with open(index_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # an interrupted write, the record is not indexed
+                    continue
+                self._index[entry["key"]] = (entry["offset"], entry["length"])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._index
+
+    def record(
+        self,
+        url: str,
+        response,
+        method: str = "get",
+        data: str | None = None,
+    ):
+        """Appends a ``requests.Response`` to the archive. The body must already
+        be downloaded (``response.content``).
+        """
+        header = {
+            "url": url,
+            "method": method,
+            "final_url": response.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": _strip_headers(response.headers),
+            "history": [
+                {
+                    "url": r.url,
+                    "status": r.status_code,
+                    "reason": r.reason,
+                    "headers": _strip_headers(r.headers),
+                }
+                for r in response.history
+            ],
+            "truncated": getattr(response, "truncated", False),
+            "date": time.time(),
+        }
+        payload = gzip.compress(json.dumps(header).encode("utf-8") + b"\n" + (response.content or b""))
+        key = self.make_key(url, method, data)
+
+        with self._lock:
+            if self._data_writer is None or self._index_writer is None:
+                self.path.mkdir(parents=True, exist_ok=True)
+                self._data_writer = open(self.path / self.DATA_FILE, "ab")
+                self._index_writer = open(self.path / self.INDEX_FILE, "a", encoding="utf-8")
+                atexit.register(self.close)
+            offset = self._data_writer.tell()
+            self._data_writer.write(payload)
+            self._data_writer.flush()
+            self._index_writer.write(json.dumps({"key": key, "offset": offset, "length": len(payload)}) + "\n")
+            self._index_writer.flush()
+            self._index[key] = (offset, len(payload))
+
+    def load(self, url: str, method: str = "get", data: str | None = None) -> dict[str, Any] | None:
+        """Returns the archived record for a request, or None if it was not
+        recorded. The record is the json header (see :any:`record`) with the
+        body added under the ``"body"`` key.
+        """
+        key = self.make_key(url, method, data)
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            offset, length = location
+            if self._reader is None:
+                self._reader = open(self.path / self.DATA_FILE, "rb")
+            self._reader.seek(offset)
+            payload = self._reader.read(length)
+
+        header, _, body = gzip.decompress(payload).partition(b"\n")
+        record = json.loads(header)
+        record["body"] = body
+        return record
+
+    def close(self):
+        """Closes the archive files."""
+        with self._lock:
+            for f in (self._data_writer, self._index_writer, self._reader):
+                if f is not None:
+                    f.close()
+            self._data_writer = self._index_writer = self._reader = None
+
+
+def _strip_headers(headers) -> dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in SKIP_HEADERS}
+
+
+_archives: dict[Path, HttpArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_archive(config: Configuration) -> HttpArchive | None:
+    """Returns the archive used by `config`, or None if
+    :any:`Configuration.http_archive_mode` is not set. Archives are opened
+    once per path and shared by all configurations.
+
+    Raises:
+        ValueError: if the archive mode is not ``"record"`` or ``"replay"``.
+    """
+    if not config.http_archive_mode:
+        return None
+    if config.http_archive_mode not in (RECORD, REPLAY):
+        raise ValueError(f"Unknown http archive mode: {config.http_archive_mode}. Use 'record' or 'replay'")
+
+    path = Path(config.http_archive_path or settings.HTTP_ARCHIVE_DIRECTORY).resolve()
+    with _archives_lock:
+        if path not in _archives:
+            _archives[path] = HttpArchive(path)
+        return _archives[path]
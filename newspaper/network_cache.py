@@ -0,0 +1,302 @@
+"""Caches for the information gathered by the network functions.
+
+:any:`HostCapabilityCache` remembers what we learned about hosts and urls
+(Range support, binary urls, redirect targets, robots.txt contents), so we
+do not have to probe them again on every request. It is bounded (LRU),
+each entry expires after a TTL, it is safe to use from multiple threads
+and it can optionally be persisted on disk, so that worker restarts do not
+re-probe every host.
+
+:any:`ConditionalRequestCache` keeps the responses that carry HTTP validators
+(``ETag``, ``Last-Modified``) on disk, so that unchanged pages can be
+re-validated with a conditional request instead of being downloaded again.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from newspaper import settings, urls
+
+log = logging.getLogger(__name__)
+
+
+def get_host_key(url: str) -> str:
+    """Returns the registered domain of the url (e.g. ``cnn.com`` for
+    ``https://edition.cnn.com/world``), used as key for host capabilities.
+    """
+    extracted = urls.extract_tld(url)
+    return extracted.domain + "." + extracted.suffix
+
+
+class HostCapabilityCache:
+    """Bounded, thread-safe cache with a per-entry time to live.
+
+    Entries are grouped by `kind` (e.g. ``"ranges"``, ``"binary"``,
+    ``"redirect"``, ``"robots"``) and identified by a `key` (a host or an url).
+    When the cache holds more than `max_entries` entries, the least recently
+    used ones are evicted.
+
+    Args:
+        max_entries (int): maximum number of entries kept in memory.
+        ttl (float): default number of seconds an entry is valid.
+        path (Path | str, optional): json file used to persist the cache. If
+            None, the cache lives in memory only. See :any:`enable_persistence`.
+    """
+
+    RANGES = "ranges"
+    BINARY = "binary"
+    REDIRECT = "redirect"
+    ROBOTS = "robots"
+
+    def __init__(
+        self,
+        max_entries: int = settings.HOST_CACHE_MAX_ENTRIES,
+        ttl: float = settings.HOST_CACHE_TTL,
+        path: Path | str | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._path: Path | None = None
+        self._dirty = False
+        self._last_save = time.time()
+        if path is not None:
+            self.enable_persistence(path)
+
+    @staticmethod
+    def _make_key(kind: str, key: str) -> str:
+        return f"{kind}|{key}"
+
+    @property
+    def persistent(self) -> bool:
+        """bool: True if the cache is saved on disk."""
+        return self._path is not None
+
+    def get(self, kind: str, key: str, default: Any = None) -> Any:
+        """Returns the cached value, or `default` if it is missing or expired."""
+        cache_key = self._make_key(kind, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return default
+            value, expires = entry
+            if expires < time.time():
+                del self._entries[cache_key]
+                self._dirty = True
+                return default
+            self._entries.move_to_end(cache_key)
+            return value
+
+    def set(self, kind: str, key: str, value: Any, ttl: float | None = None):
+        """Stores a value, valid for `ttl` seconds (default: the cache ttl)."""
+        cache_key = self._make_key(kind, key)
+        with self._lock:
+            self._entries[cache_key] = (value, time.time() + (self.ttl if ttl is None else ttl))
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+            need_save = self._path is not None and time.time() - self._last_save > settings.HOST_CACHE_SAVE_INTERVAL
+        if need_save:
+            self.save()
+
+    def get_or_set(self, kind: str, key: str, func, ttl: float | None = None) -> Any:
+        """Returns the cached value, or computes it with ``func()`` and caches it.
+        `func` is called outside of the lock, so slow probes do not block other
+        threads (the same value may be computed twice by concurrent threads).
+        """
+        sentinel = object()
+        value = self.get(kind, key, sentinel)
+        if value is sentinel:
+            value = func()
+            self.set(kind, key, value, ttl)
+        return value
+
+    def delete(self, kind: str, key: str):
+        """Removes an entry from the cache."""
+        with self._lock:
+            if self._entries.pop(self._make_key(kind, key), None) is not None:
+                self._dirty = True
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def enable_persistence(self, path: Path | str | None = None):
+        """Loads the cache from `path` (default ``settings.HOST_CACHE_FILE``)
+        and saves it back periodically and when the interpreter exits.
+        """
+        path = Path(path or settings.HOST_CACHE_FILE)
+        with self._lock:
+            if self._path == path:
+                return
+            first_time = self._path is None
+            self._path = path
+            self.load()
+        if first_time:
+            atexit.register(self.save)
+
+    def load(self):
+        """Loads the non-expired entries from the cache file."""
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning("Could not load the host capability cache %s: %s", self._path, e)
+            return
+
+        now = time.time()
+        with self._lock:
+            for cache_key, (value, expires) in data.items():
+                if expires > now and cache_key not in self._entries:
+                    self._entries[cache_key] = (value, expires)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def save(self):
+        """Writes the cache file (atomically, so concurrent workers can share it)."""
+        with self._lock:
+            if self._path is None or not self._dirty:
+                return
+            now = time.time()
+            data = {k: v for k, v in self._entries.items() if v[1] > now}
+            self._dirty = False
+            self._last_save = now
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+        except (OSError, TypeError) as e:
+            log.warning("Could not save the host capability cache %s: %s", self._path, e)
+
+
+host_cache = HostCapabilityCache()
+
+
+class ConditionalRequestCache:
+    """On-disk cache of HTTP responses and their validators (``ETag`` and
+    ``Last-Modified`` headers). Before requesting a cached url, the validators
+    are sent as ``If-None-Match`` / ``If-Modified-Since`` headers; if the server
+    answers with ``304 Not Modified``, the cached response is used instead.
+    Each url is stored as a pickle file named after the hash of the url.
+
+    The number of cache hits, misses and the number of body bytes that did not
+    need to be downloaded are available through :any:`stats`.
+
+    Args:
+        directory (Path | str): the folder where responses are stored.
+    """
+
+    def __init__(self, directory: Path | str = settings.HTTP_CACHE_DIRECTORY):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "bytes_saved": 0}
+
+    def get_cache_file(self, url: str) -> Path:
+        """The file in which the response for `url` is stored."""
+        return self.directory / hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def load(self, url: str) -> dict | None:
+        """Returns the cached entry for `url` (a dict with the keys ``url``,
+        ``headers``, ``content``, ``etag`` and ``last_modified``), or None.
+        """
+        filepath = self.get_cache_file(url)
+        if not filepath.exists():
+            return None
+        try:
+            with open(filepath, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            log.debug("Could not read the http cache for %s: %s", url, e)
+            return None
+        if entry.get("request_url") != url:
+            return None
+        return entry
+
+    def validators(self, entry: dict | None) -> dict[str, str]:
+        """Returns the conditional request headers for a cached entry."""
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, final_url: str, headers, content: bytes):
+        """Caches a successful response, if it has any validators."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        # the stored content is already decoded
+        skip_headers = {"content-encoding", "content-length", "transfer-encoding"}
+        entry = {
+            "request_url": url,
+            "url": final_url,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in skip_headers},
+            "content": content,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        filepath = self.get_cache_file(url)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(entry, f)
+            os.replace(tmp_path, filepath)
+        except OSError as e:
+            log.debug("Could not write the http cache for %s: %s", url, e)
+
+    def record_hit(self, entry: dict):
+        """Counts a ``304 Not Modified`` answer for a cached entry."""
+        with self._lock:
+            self._stats["hits"] += 1
+            self._stats["bytes_saved"] += len(entry["content"])
+
+    def record_miss(self):
+        """Counts a request that had to download the full body."""
+        with self._lock:
+            self._stats["misses"] += 1
+
+    def stats(self) -> dict[str, int]:
+        """Returns the ``hits``, ``misses`` and ``bytes_saved`` counters."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self):
+        """Sets all the counters back to zero."""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def clear(self):
+        """Removes all the cached responses."""
+        if self.directory.exists():
+            for filepath in self.directory.iterdir():
+                filepath.unlink(missing_ok=True)
+
+
+conditional_cache = ConditionalRequestCache()
@@ -19,7 +19,7 @@ class StrEnum(str, Enum):
 from typing import Any, Literal, Protocol
 
 _lock = threading.RLock()
-_hooks = defaultdict(list)  # keys: 'before_request','after_response','on_error'
+_hooks = defaultdict(list)  # keys: 'before_request','after_response','on_error','host_queue'
 
 
 class HookableEvent(StrEnum):
@@ -29,14 +29,18 @@ class HookableEvent(StrEnum):
         BEFORE_REQUEST: Emitted before a request is made.
         AFTER_RESPONSE: Emitted after a successful response.
         ON_ERROR: Emitted when an exception occurs during the request.
+        HOST_QUEUE: Emitted by the multi-threaded downloader when the queue
+            of pending urls of a host changes. Besides url and config, the hook
+            receives the keyword arguments ``host``, ``queue_depth`` and ``in_flight``.
     """
 
     BEFORE_REQUEST = "before_request"
     AFTER_RESPONSE = "after_response"
     ON_ERROR = "on_error"
+    HOST_QUEUE = "host_queue"
 
 
-HookableEventType = Literal["before_request", "after_response", "on_error"]
+HookableEventType = Literal["before_request", "after_response", "on_error", "host_queue"]
 
 
 class HookCallable(Protocol):
@@ -142,6 +146,20 @@ def get_hooks(event: HookableEventType) -> list[HookCallable]:
         return list(_hooks.get(event, []))
 
 
+def call_hooks(event: HookableEventType, *args, **kwargs) -> list[Any]:
+    """Call all the hooks registered for an event.
+
+    Args:
+        event: The event name whose hooks to call.
+        *args: Positional arguments passed to every hook.
+        **kwargs: Keyword arguments passed to every hook.
+
+    Returns:
+        The list of values returned by the hooks.
+    """
+    return [hook(*args, **kwargs) for hook in get_hooks(event)]
+
+
 @contextmanager
 def local_hook(event: HookableEventType, fn: HookCallable):
     """Temporarily register a hook for the given event for the lifetime of the context.
@@ -196,3 +214,38 @@ def wrapper(*args, **kwargs):
         return result
 
     return wrapper
+
+
+def ahookable_func(func):
+    """
+    Async counterpart of :func:`hookable_func`. Wraps a coroutine function so
+    registered hooks are called with the same signature (*args, **kwargs) as
+    the wrapped coroutine. Hooks themselves are plain (synchronous) callables,
+    the same ones registered for the synchronous request functions.
+    Events called: 'before_request' (before), 'on_error' (if exception),
+    'after_response' (after success).
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        continue_request = True
+        for hook in get_hooks(HookableEvent.BEFORE_REQUEST):
+            continue_request = hook(*args, **kwargs) and continue_request
+
+        if not continue_request:
+            # If any before_request hook returns False, we skip the request and return None.
+            return None
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            for hook in get_hooks(HookableEvent.ON_ERROR):
+                hook(*args, **kwargs)
+            raise
+
+        for hook in get_hooks(HookableEvent.AFTER_RESPONSE):
+            hook(*args, **kwargs)
+
+        return result
+
+    return wrapper
@@ -0,0 +1,166 @@
+"""Retry policy and per-domain circuit breaker for the network functions.
+
+:any:`RetryPolicy` decides if a failed request is retried, and how long to
+wait before the next attempt (exponential backoff with full jitter, or the
+``Retry-After`` header sent by the server).
+
+The :any:`CircuitBreaker` counts the consecutive failures of every domain.
+Once a domain reaches the failure threshold, the requests to that domain fail
+immediately with a :any:`CircuitOpenException` (instead of each one waiting
+for the full timeout), until the reset timeout has passed. Then one trial
+request is let through: if it succeeds the domain is closed again, otherwise
+it stays open for another reset timeout.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from newspaper.configuration import Configuration
+from newspaper.exceptions import CircuitOpenException
+
+
+@dataclass
+class RetryPolicy:
+    """When and how to retry a request.
+
+    Attributes:
+        max_retries (int): number of retries after the first attempt.
+        status_codes (set[int]): http status codes that are retried.
+        backoff_factor (float): the delay before retry ``n`` (0 based) is a
+            random value between 0 and ``backoff_factor * 2 ** n`` seconds.
+        backoff_max (float): maximum delay before a retry, also applied
+            to the ``Retry-After`` header.
+    """
+
+    max_retries: int = 0
+    status_codes: set[int] = field(default_factory=lambda: {429, 500, 502, 503, 504})
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+
+    @classmethod
+    def from_config(cls, config: Configuration) -> "RetryPolicy":
+        """Creates the policy from `config`.`retry_settings`."""
+        settings = config.retry_settings
+        policy = cls()
+        policy.max_retries = settings.get("max_retries", policy.max_retries)
+        policy.status_codes = set(settings.get("status_codes", policy.status_codes))
+        policy.backoff_factor = settings.get("backoff_factor", policy.backoff_factor)
+        policy.backoff_max = settings.get("backoff_max", policy.backoff_max)
+        return policy
+
+    def should_retry(self, attempt: int, status_code: int | None = None) -> bool:
+        """Should the request be tried again after `attempt` (0 based) failed?
+        `status_code` is None for connection errors and timeouts.
+        """
+        if attempt >= self.max_retries:
+            return False
+        return status_code is None or status_code in self.status_codes
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before the retry following `attempt` (0 based)."""
+        seconds = parse_retry_after(retry_after)
+        if seconds is None:
+            seconds = random.uniform(0, self.backoff_factor * 2**attempt)
+        return min(seconds, self.backoff_max)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a ``Retry-After`` header (a number of seconds or a http date).
+    Returns None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class CircuitBreaker:
+    """Thread-safe, per-domain circuit breaker. The thresholds are read from
+    `config`.`circuit_breaker_settings` on every call, so different
+    configurations can share the same breaker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._opened: dict[str, float] = {}
+        self._trial: set[str] = set()
+
+    @staticmethod
+    def _settings(config: Configuration) -> tuple[int | None, float]:
+        settings = config.circuit_breaker_settings
+        return settings.get("failure_threshold"), settings.get("reset_timeout", 60)
+
+    def check(self, domain: str, config: Configuration) -> bool:
+        """Raises :any:`CircuitOpenException` if requests to `domain`
+        must not be made right now. Returns True if the request is the
+        trial of a half open circuit, the caller must then call
+        :any:`release_trial` once the request is done.
+        """
+        threshold, reset_timeout = self._settings(config)
+        if not threshold:
+            return False
+        with self._lock:
+            opened = self._opened.get(domain)
+            if opened is None:
+                return False
+            if time.monotonic() - opened >= reset_timeout and domain not in self._trial:
+                # half open: let one request through
+                self._trial.add(domain)
+                return True
+        raise CircuitOpenException(f"Too many consecutive failures for {domain}, requests are not sent")
+
+    def record_success(self, domain: str):
+        """A request to `domain` got a response: close the circuit."""
+        with self._lock:
+            self._failures.pop(domain, None)
+            self._opened.pop(domain, None)
+            self._trial.discard(domain)
+
+    def record_failure(self, domain: str, config: Configuration):
+        """A request to `domain` failed: open the circuit if the threshold
+        is reached (or if the trial request failed).
+        """
+        threshold, _ = self._settings(config)
+        if not threshold:
+            return
+        with self._lock:
+            self._failures[domain] = self._failures.get(domain, 0) + 1
+            if self._failures[domain] >= threshold or domain in self._trial:
+                self._opened[domain] = time.monotonic()
+                self._trial.discard(domain)
+
+    def release_trial(self, domain: str):
+        """The trial request to `domain` is over. If neither a success nor a
+        failure was recorded, the circuit stays open and the next request
+        is the new trial.
+        """
+        with self._lock:
+            self._trial.discard(domain)
+
+    def is_open(self, domain: str) -> bool:
+        """True if the circuit of `domain` is open."""
+        with self._lock:
+            return domain in self._opened
+
+    def reset(self):
+        """Closes all circuits."""
+        with self._lock:
+            self._failures.clear()
+            self._opened.clear()
+            self._trial.clear()
+
+
+circuit_breaker = CircuitBreaker()
@@ -0,0 +1,237 @@
+"""Per-host politeness scheduling for multi-threaded downloads.
+
+The :any:`HostScheduler` groups urls by host and dispatches them on a shared
+thread pool, making sure that no host gets more simultaneous connections or
+requests per second than allowed by the :any:`Configuration`, while the idle
+workers keep getting urls from the other hosts.
+The per-host bookkeeping lives in a process-wide :any:`HostLimiter`, so
+concurrent downloads (e.g. several sources in ``fetch_news``) share the same
+limits.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, fields, replace
+from functools import partial
+from typing import Any
+from urllib.parse import urlparse
+
+from newspaper.configuration import Configuration
+from newspaper.network_hooks import HookableEvent, call_hooks
+
+# How long to wait before retrying a host that is blocked by requests
+# made from another scheduler (we do not get notified about those)
+POLL_INTERVAL = 0.05
+
+
+@dataclass
+class HostLimits:
+    """Politeness limits for one host.
+
+    Attributes:
+        max_connections (int | None): maximum number of simultaneous requests.
+            None means unlimited.
+        requests_per_second (float | None): maximum request rate.
+            None means unlimited.
+        burst (int): number of requests that can be made at once before
+            the rate limit kicks in.
+    """
+
+    max_connections: int | None = None
+    requests_per_second: float | None = None
+    burst: int = 1
+
+
+class TokenBucket:
+    """Token bucket rate limiter. Tokens are added at `rate` tokens per
+    second, up to `capacity` tokens. Each request consumes one token.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.timestamp = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rate)
+        self.timestamp = now
+
+    def delay(self, now: float | None = None) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill(time.monotonic() if now is None else now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now: float | None = None) -> bool:
+        """Consume a token if one is available. Returns True on success."""
+        if self.delay(now) > 0:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class HostLimiter:
+    """Thread-safe bookkeeping of the in-flight requests and request rate
+    for every host.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, int] = defaultdict(int)
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def try_acquire(self, host: str, limits: HostLimits) -> float:
+        """Try to reserve a request slot for `host`.
+
+        Returns:
+            float: 0 if the slot was reserved, otherwise the number of seconds
+            after which it is worth trying again.
+        """
+        with self._lock:
+            if limits.max_connections is not None and self._in_flight[host] >= limits.max_connections:
+                return POLL_INTERVAL
+
+            if limits.requests_per_second:
+                bucket = self._buckets.get(host)
+                if bucket is None or bucket.rate != limits.requests_per_second or bucket.capacity != limits.burst:
+                    bucket = TokenBucket(limits.requests_per_second, limits.burst)
+                    self._buckets[host] = bucket
+                if not bucket.consume():
+                    return max(bucket.delay(), 0.001)
+
+            self._in_flight[host] += 1
+            return 0.0
+
+    def release(self, host: str):
+        """Release a slot reserved with :any:`try_acquire`."""
+        with self._lock:
+            self._in_flight[host] -= 1
+            if self._in_flight[host] <= 0:
+                del self._in_flight[host]
+
+    def in_flight(self, host: str) -> int:
+        """Number of requests currently running for `host`."""
+        with self._lock:
+            return self._in_flight.get(host, 0)
+
+
+host_limiter = HostLimiter()
+
+
+def get_host(url: str) -> str:
+    """The host used to group urls for politeness purposes."""
+    return (urlparse(url).hostname or "").lower()
+
+
+class HostScheduler:
+    """Dispatches urls on a thread pool of `config`.`number_threads` workers,
+    enforcing the per-host limits from the configuration:
+    :any:`Configuration.max_connections_per_host`,
+    :any:`Configuration.requests_per_second_per_host` and
+    :any:`Configuration.host_limits`.
+
+    Hosts are served round-robin, so a long list of urls from a single host
+    does not starve the others. Every time the queue of a host changes, the
+    ``host_queue`` hooks are called with the keyword arguments ``host``,
+    ``queue_depth`` and ``in_flight``.
+    """
+
+    def __init__(self, config: Configuration, limiter: HostLimiter | None = None):
+        self.config = config
+        self.limiter = limiter or host_limiter
+
+    def limits_for(self, host: str) -> HostLimits:
+        """Returns the politeness limits that apply to `host`.
+
+        Raises:
+            ValueError: if the overrides of `host` in
+                :any:`Configuration.host_limits` are not :any:`HostLimits`
+                fields.
+        """
+        limits = HostLimits(
+            max_connections=self.config.max_connections_per_host,
+            requests_per_second=self.config.requests_per_second_per_host,
+        )
+        overrides = self.config.host_limits.get(host) or {}
+        unknown = set(overrides) - {field.name for field in fields(HostLimits)}
+        if unknown:
+            raise ValueError(f"Unknown host limits for {host}: {', '.join(sorted(unknown))}")
+        return replace(limits, **overrides)
+
+    def _report(self, host: str, url: str, queue: deque):
+        call_hooks(
+            HookableEvent.HOST_QUEUE.value,
+            url,
+            self.config,
+            host=host,
+            queue_depth=len(queue),
+            in_flight=self.limiter.in_flight(host),
+        )
+
+    def run(
+        self, fn: Callable[[str], Any], urls: list[str], max_in_flight: int | None = None
+    ) -> Iterator[tuple[int, Future]]:
+        """Call `fn(url)` for every url, and yield ``(index, future)`` tuples
+        in order of completion. `index` is the position of the url in `urls`.
+        No more than `max_in_flight` urls (default: the number of workers) are
+        running or completed but not yet consumed, so the results of a slow
+        consumer do not pile up in memory.
+        """
+        queues: OrderedDict[str, deque[tuple[int, str]]] = OrderedDict()
+        for idx, url in enumerate(urls):
+            queues.setdefault(get_host(url), deque()).append((idx, url))
+        for host, queue in queues.items():
+            self._report(host, queue[-1][1], queue)
+
+        done: deque[tuple[int, Future]] = deque()
+        cond = threading.Condition()
+        limits = {host: self.limits_for(host) for host in queues}
+        workers = max(self.config.number_threads, 1)
+        window = max(max_in_flight or workers, 1)
+        in_flight = 0
+
+        def on_done(host, idx, future):
+            self.limiter.release(host)
+            with cond:
+                done.append((idx, future))
+                cond.notify()
+
+        with ThreadPoolExecutor(max_workers=workers) as tpe:
+            while queues or in_flight:
+                wait: float | None = None
+                while queues and in_flight < window and in_flight - len(done) < workers:
+                    dispatched = False
+                    for host in list(queues):
+                        delay = self.limiter.try_acquire(host, limits[host])
+                        if delay > 0:
+                            wait = delay if wait is None else min(wait, delay)
+                            continue
+                        queue = queues[host]
+                        idx, url = queue.popleft()
+                        if queue:
+                            queues.move_to_end(host)
+                        else:
+                            del queues[host]
+                        future = tpe.submit(fn, url)
+                        in_flight += 1
+                        future.add_done_callback(partial(on_done, host, idx))
+                        self._report(host, url, queue)
+                        dispatched = True
+                        break
+                    if not dispatched:
+                        break
+
+                with cond:
+                    if not done:
+                        cond.wait(timeout=wait)
+                    finished = list(done)
+                    done.clear()
+
+                for item in finished:
+                    in_flight -= 1
+                    yield item
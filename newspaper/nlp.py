@@ -3,12 +3,20 @@
 
 """Functions needed for the NLP analysis of articles."""
 
+import gzip
+import heapq
+import itertools
+import json
 import math
 import os
 import re
 from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
 
-from newspaper.text import StopWords
+from newspaper.text import StopWords, get_stopwords
 
 from . import settings
 
@@ -37,13 +45,50 @@ def keywords(text: str, stopwords: StopWords, max_keywords: int | None = None):
 
     freq = Counter(tokenised_text)
 
+    return _frequency_scores(freq, num_words, max_keywords)
+
+
+def _frequency_scores(freq: Counter, num_words: int, max_keywords: int | None) -> dict[str, float]:
     keywords_ = freq.most_common(max_keywords)
     keywords_dict = {k: v * 1.5 / num_words + 1 for k, v in keywords_}
 
     return keywords_dict
 
 
-def summarize(title: str, text: str, stopwords: StopWords, max_sents: int = 5):
+def combine_keywords(
+    text_keywords: dict[str, float], title_keywords: dict[str, float], max_keywords: int | None = None
+) -> dict[str, float]:
+    """Combines the keywords of the article text and title, as in
+    :any:`Article.nlp()`: the score of a keyword found in both is the average
+    of its two scores.
+
+    Args:
+        text_keywords (dict[str, float]): the keywords of the text
+        title_keywords (dict[str, float]): the keywords of the title
+        max_keywords (int | None): the maximum number of keywords returned.
+            None returns all keywords.
+
+    Returns:
+        dict[str, float]: the keywords and their scores, by descending score
+    """
+    combined = dict(text_keywords)
+    for k, v in title_keywords.items():
+        if k in combined:
+            combined[k] += v
+            combined[k] /= 2
+        else:
+            combined[k] = v
+
+    return dict(sorted(combined.items(), key=lambda x: x[1], reverse=True)[:max_keywords])
+
+
+def summarize(
+    title: str,
+    text: str,
+    stopwords: StopWords,
+    max_sents: int = 5,
+    keyword_scores: dict[str, float] | None = None,
+):
     """Summarize an article into the most relevant sentences in the article.
 
     Args:
@@ -55,6 +100,9 @@ def summarize(title: str, text: str, stopwords: StopWords, max_sents: int = 5):
             using the following criteria: sentence position, frequency of
             keywords, title words found in the sentence, and sentence length.
             Defaults to 5.
+        keyword_scores (dict[str, float] | None): the keywords of the text,
+            as returned by :any:`keywords` with
+            ``settings.SUMMARIZE_KEYWORD_COUNT`` keywords. Computed if None.
 
     Returns:
         _type_: _description_
@@ -64,7 +112,9 @@ def summarize(title: str, text: str, stopwords: StopWords, max_sents: int = 5):
 
     summaries = []
     sentences = split_sentences(text)
-    keys = keywords(text, stopwords, settings.SUMMARIZE_KEYWORD_COUNT)
+    keys = keyword_scores
+    if keys is None:
+        keys = keywords(text, stopwords, settings.SUMMARIZE_KEYWORD_COUNT)
     title_words = list(stopwords.tokenizer(title))
 
     # Score sentences, and use the top 5 or max_sents sentences
@@ -87,13 +137,41 @@ def title_score(title_tokens, sentence_tokens, stopwords):
     return len(intersection) / len(title_tokens)
 
 
-def scored_sentences(sentences, title_words, keywords, stopwords):
-    """Score sentences based on different features"""
+# below this number of sentences, the numpy scorer is not faster
+NUMPY_MIN_SENTENCES = 20
+# the ranges of sentence_position_score: a sentence at the relative position
+# (_POSITION_BOUNDS[j], _POSITION_BOUNDS[j + 1]] gets _POSITION_SCORES[j]
+_POSITION_BOUNDS = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+_POSITION_SCORES = [0.17, 0.23, 0.14, 0.08, 0.05, 0.04, 0.06, 0.04, 0.04, 0.15]
+
+
+def scored_sentences(sentences, title_words, keywords, stopwords, use_numpy: bool | None = None):
+    """Score sentences based on different features
+
+    Args:
+        sentences (list[str]): the sentences of the article
+        title_words (list[str]): the tokens of the article title
+        keywords (dict[str, float]): the article keywords and their scores
+        stopwords (StopWords): stopwords object for the language of the text
+        use_numpy (bool | None): score the sentences with
+            :any:`scored_sentences_numpy`. By default (None), it is used if
+            numpy is installed and the article has at least
+            ``NUMPY_MIN_SENTENCES`` sentences.
+
+    Returns:
+        list[tuple[int, str, float]]: the index, text and score of each
+        sentence, by descending score.
+    """
+    if use_numpy is None:
+        use_numpy = len(sentences) >= NUMPY_MIN_SENTENCES and _numpy_available()
+    if use_numpy:
+        return scored_sentences_numpy(sentences, title_words, keywords, stopwords)
+
     sentence_count = len(sentences)
     ranks = []
 
-    for i, s in enumerate(sentences):
-        sentence = list(stopwords.tokenizer(s))
+    tokenized = stopwords.tokenize_batch(sentences)
+    for i, (s, sentence) in enumerate(zip(sentences, tokenized)):
         title_features = title_score(title_words, sentence, stopwords)
         sent_len = length_score(len(sentence))
         sent_pos = sentence_position_score(i + 1, sentence_count)
@@ -108,6 +186,94 @@ def scored_sentences(sentences, title_words, keywords, stopwords):
     return ranks
 
 
+@lru_cache(maxsize=1)
+def _numpy_available() -> bool:
+    return find_spec("numpy") is not None
+
+
+def scored_sentences_numpy(sentences, title_words, keywords, stopwords):
+    """Same as :any:`scored_sentences`, with the features of all the
+    sentences computed as numpy array operations on the tokens of the whole
+    article: the tokens are mapped once to the ids of the keywords and title
+    words, and the features are summed up per sentence. Requires numpy
+    (``pip install newspaper4k[numpy]``).
+
+    The scores are equal to those of the python implementation, up to float
+    rounding, and the sentences are ranked the same way.
+    """
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError(
+            "You must install numpy before using the numpy sentence scorer. \n"
+            "Try pip install numpy\n"
+            "or pip install newspaper4k[numpy]\n"
+        ) from e
+
+    sentence_count = len(sentences)
+    if not sentence_count:
+        return []
+
+    tokenized = stopwords.tokenize_batch(sentences)
+    tokens = list(itertools.chain.from_iterable(tokenized))
+    lengths = np.fromiter(map(len, tokenized), dtype=np.int64, count=sentence_count)
+    sentence_ids = np.repeat(np.arange(sentence_count), lengths)
+
+    # only the keywords and the title words are scored: they get ids from
+    # 1, all the other words have the id 0
+    title_tokens = [w for w in title_words if w not in stopwords.stop_words]
+    word_ids = {w: i for i, w in enumerate(dict.fromkeys(itertools.chain(keywords, title_tokens)), 1)}
+    token_ids = np.fromiter(map(word_ids.get, tokens, itertools.repeat(0)), dtype=np.int64, count=len(tokens))
+    scores = np.zeros(len(word_ids) + 1)
+    is_keyword = np.zeros(len(word_ids) + 1, dtype=bool)
+    in_title = np.zeros(len(word_ids) + 1)
+    for word, value in keywords.items():
+        scores[word_ids[word]] = value
+        is_keyword[word_ids[word]] = True
+    for word in title_tokens:
+        in_title[word_ids[word]] = 1.0
+
+    # title_score: the share of the title words found in the sentence
+    if title_tokens:
+        # not in place: bincount returns integers if no sentence has a token
+        title_counts = np.bincount(sentence_ids, weights=in_title[token_ids], minlength=sentence_count)
+        title_features = title_counts / len(title_tokens)
+    else:
+        title_features = np.zeros(sentence_count)
+
+    sent_len = 1 - np.abs(settings.MEAN_SENTENCE_LEN - lengths) / settings.MEAN_SENTENCE_LEN
+    normalized = np.arange(1, sentence_count + 1) / sentence_count
+    sent_pos = np.array(_POSITION_SCORES)[np.searchsorted(_POSITION_BOUNDS, normalized) - 1]
+
+    # sbs: the mean keyword score of the sentence words
+    token_scores = scores[token_ids]
+    sums = np.bincount(sentence_ids, weights=token_scores, minlength=sentence_count)
+    sbs_feature = np.divide(sums, lengths, out=np.zeros(sentence_count), where=lengths > 0) / 10.0
+
+    # dbs: the products of the scores of consecutive keywords in the
+    # sentence, divided by their squared distance
+    is_keyword = is_keyword[token_ids]
+    keyword_sentences = sentence_ids[is_keyword]
+    keyword_positions = (np.arange(len(tokens)) - np.repeat(np.cumsum(lengths) - lengths, lengths))[is_keyword]
+    keyword_values = token_scores[is_keyword]
+    pairs = keyword_sentences[:-1] == keyword_sentences[1:]
+    distances = (keyword_positions[1:] - keyword_positions[:-1])[pairs]
+    products = (keyword_values[:-1] * keyword_values[1:])[pairs] / distances.astype(np.float64) ** 2
+    summ = np.bincount(keyword_sentences[:-1][pairs], weights=products, minlength=sentence_count)
+    # the number of distinct keywords in the sentence
+    distinct = np.unique(keyword_sentences * len(scores) + token_ids[is_keyword]) // len(scores)
+    k = np.bincount(distinct, minlength=sentence_count) + 1
+    dbs_feature = np.where(k > 1, summ / (k * (k + 1.0)), 0.0)
+
+    frequency = (sbs_feature + dbs_feature) / 2.0 * 10.0
+    # Weighted average of scores from four categories
+    total_scores = (title_features * 1.5 + frequency * 2.0 + sent_len * 1.0 + sent_pos * 1.0) / 4.0
+
+    ranks = list(zip(range(sentence_count), sentences, total_scores.tolist()))
+    ranks.sort(key=lambda x: x[2], reverse=True)
+    return ranks
+
+
 def length_score(sentence_len):
     return 1 - math.fabs(settings.MEAN_SENTENCE_LEN - sentence_len) / settings.MEAN_SENTENCE_LEN
 
@@ -210,3 +376,231 @@ def split_sentences(text: str) -> list[str]:
     sentences = tokenizer.tokenize(text)
     sentences = [re.sub(r"[\n ]+", " ", x) for x in sentences if len(x) > 10]
     return sentences
+
+
+class DocumentFrequencies:
+    """The number of documents (article texts) of a corpus that contain each
+    word, for the TF-IDF keywords of :any:`batch_keywords` and
+    :any:`batch_nlp`. The statistics are updated with every batch of
+    articles, and can be stored on disk (:any:`DocumentFrequencies.save`)
+    and loaded again for the next batches.
+
+    Attributes:
+        document_count (int): the number of documents of the corpus
+        frequencies (Counter[str]): the number of documents containing each
+            word. The stopwords are not counted.
+    """
+
+    def __init__(self):
+        self.document_count = 0
+        self.frequencies: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return len(self.frequencies)
+
+    def add_document(self, words: Iterable[str]):
+        """Adds a document to the corpus.
+
+        Args:
+            words (Iterable[str]): the words of the document, stopwords
+                excluded. Repeated words are counted once.
+        """
+        self.frequencies.update(set(words))
+        self.document_count += 1
+
+    def update(self, other: "DocumentFrequencies"):
+        """Adds the documents of `other` to the corpus."""
+        self.frequencies.update(other.frequencies)
+        self.document_count += other.document_count
+
+    def idf(self, word: str) -> float:
+        """The (smoothed) inverse document frequency of `word`:
+        ``log((1 + N) / (1 + df)) + 1``, where ``N`` is the number of
+        documents and ``df`` the number of documents containing the word.
+        """
+        return math.log((1 + self.document_count) / (1 + self.frequencies[word])) + 1
+
+    def save(self, path: str | Path):
+        """Writes the statistics to `path`, as gzip compressed json. The file
+        is replaced atomically.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"document_count": self.document_count, "frequencies": self.frequencies}
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "DocumentFrequencies":
+        """Reads the statistics written by :any:`DocumentFrequencies.save`.
+        If `path` does not exist, the returned statistics are empty.
+        """
+        document_frequencies = cls()
+        if not Path(path).exists():
+            return document_frequencies
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        document_frequencies.document_count = data["document_count"]
+        document_frequencies.frequencies = Counter(data["frequencies"])
+        return document_frequencies
+
+
+def _word_counts(tokens: list[str], stopwords: StopWords) -> tuple[Counter, int]:
+    # the word counts without the stopwords, and the number of words before
+    # removing them (see keywords)
+    return Counter(itertools.filterfalse(stopwords.stop_words.__contains__, tokens)), len(tokens) or 1
+
+
+def tfidf_keywords(
+    freq: Counter, num_words: int, document_frequencies: DocumentFrequencies, max_keywords: int | None = None
+) -> dict[str, float]:
+    """The TF-IDF scores of the words of a document: the share of the
+    document words that are the word, multiplied by its inverse document
+    frequency in the corpus (:any:`DocumentFrequencies.idf`).
+
+    Args:
+        freq (Counter): the word counts of the document, without stopwords
+        num_words (int): the number of words of the document, with stopwords
+        document_frequencies (DocumentFrequencies): the corpus statistics
+        max_keywords (int | None): the maximum number of keywords returned.
+            None returns all keywords.
+
+    Returns:
+        dict[str, float]: the keywords and their scores, by descending score
+    """
+    scores = ((word, count / num_words * document_frequencies.idf(word)) for word, count in freq.items())
+    if max_keywords is None:
+        return dict(sorted(scores, key=lambda x: x[1], reverse=True))
+    return dict(heapq.nlargest(max_keywords, scores, key=lambda x: x[1]))
+
+
+def batch_keywords(
+    texts: list[str],
+    stopwords: StopWords,
+    document_frequencies: DocumentFrequencies | None = None,
+    max_keywords: int | None = None,
+) -> list[dict[str, float]]:
+    """The TF-IDF keywords of a batch of texts. Unlike :any:`keywords`, the
+    words that are frequent in all the texts get lower scores. The texts are
+    tokenized in one batch, and added to `document_frequencies` before they
+    are scored.
+
+    Args:
+        texts (list[str]): the texts of the documents
+        stopwords (StopWords): stopwords object for the language of the texts
+        document_frequencies (DocumentFrequencies | None): the statistics of
+            the previous batches, updated with this batch. If None, the
+            texts are scored against themselves only.
+        max_keywords (int | None): the maximum number of keywords returned
+            per text. None returns all keywords.
+
+    Returns:
+        list[dict[str, float]]: the keywords of each text and their scores
+    """
+    if document_frequencies is None:
+        document_frequencies = DocumentFrequencies()
+    counts = [_word_counts(tokens, stopwords) for tokens in stopwords.tokenize_batch(texts)]
+    for text, (freq, _) in zip(texts, counts):
+        if text:
+            document_frequencies.add_document(freq)
+    return [tfidf_keywords(freq, num_words, document_frequencies, max_keywords) for freq, num_words in counts]
+
+
+def _analyze_article(item: tuple[str, str, str, int]) -> tuple[Counter, int, Counter, int, list[str]]:
+    # the part of batch_nlp that does not need the corpus statistics, run in
+    # the worker processes
+    text, title, language, max_sents = item
+    stopwords = get_stopwords(language)
+    text_tokens, title_tokens = stopwords.tokenize_batch([text, title])
+    text_freq, text_words = _word_counts(text_tokens, stopwords)
+    title_freq, title_words = _word_counts(title_tokens, stopwords)
+    summary = []
+    if text and max_sents > 0:
+        keyword_scores = _frequency_scores(text_freq, text_words, settings.SUMMARIZE_KEYWORD_COUNT)
+        summary = summarize(title, text, stopwords, max_sents, keyword_scores=keyword_scores)
+    return text_freq, text_words, title_freq, title_words, summary
+
+
+def batch_nlp(
+    articles: list,
+    document_frequencies: DocumentFrequencies | str | Path | None = None,
+    processes: int | None = None,
+    summaries: bool = True,
+) -> DocumentFrequencies:
+    """Extracts the keywords and the summary of many articles, e.g. all the
+    :any:`Source.articles`, like :any:`Article.nlp()` but with TF-IDF keywords
+    scored against the whole corpus. The articles are tokenized and
+    summarized in parallel worker processes, then the document frequencies
+    are updated and the keywords are scored in the calling process.
+
+    The summaries are the same as those of :any:`Article.nlp()`. The
+    articles must be downloaded and parsed.
+
+    Args:
+        articles (list[Article]): the articles. Their ``keywords``,
+            ``keyword_scores`` and ``summary`` attributes are set.
+        document_frequencies (DocumentFrequencies | str | Path | None): the
+            statistics of the previous batches, or the path of the file
+            where they are stored (see :any:`DocumentFrequencies.save`). They
+            are updated with the texts of the articles, and the file is
+            written again. If None, the articles are scored against each
+            other only.
+        processes (int | None): the number of worker processes. Defaults to
+            the number of CPUs. With 1, everything runs in the calling process.
+        summaries (bool): if False, only the keywords are extracted.
+
+    Raises:
+        ArticleException: if one of the articles is not downloaded or not
+            parsed
+
+    Returns:
+        DocumentFrequencies: the updated corpus statistics
+    """
+    path = None
+    if document_frequencies is None:
+        document_frequencies = DocumentFrequencies()
+    elif not isinstance(document_frequencies, DocumentFrequencies):
+        path = document_frequencies
+        document_frequencies = DocumentFrequencies.load(path)
+
+    items = []
+    for article in articles:
+        article.throw_if_not_downloaded_verbose()
+        article.throw_if_not_parsed_verbose()
+        # reading the text first: the language can come from the metadata
+        text, title = article.text, article.title
+        max_sents = article.config.max_summary_sent if summaries else 0
+        items.append((text, title, article.language, max_sents))
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes > 1 and len(items) > 1:
+        from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+        processes = min(processes, len(items))
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_analyze_article, items, chunksize=max(1, len(items) // (processes * 4))))
+    else:
+        results = [_analyze_article(item) for item in items]
+
+    for (text, *_), (text_freq, *_) in zip(items, results):
+        if text:
+            document_frequencies.add_document(text_freq)
+
+    for article, (text_freq, text_words, title_freq, title_words, summary) in zip(articles, results):
+        max_keywords = article.config.max_keywords
+        keywords_ = combine_keywords(
+            tfidf_keywords(text_freq, text_words, document_frequencies, max_keywords),
+            tfidf_keywords(title_freq, title_words, document_frequencies, max_keywords),
+            max_keywords,
+        )
+        article.keywords = list(keywords_)
+        article.keyword_scores = keywords_
+        if summaries:
+            article.summary = "\n".join(summary)
+
+    if path is not None:
+        document_frequencies.save(path)
+    return document_frequencies
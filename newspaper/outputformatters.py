@@ -7,7 +7,6 @@
 
 import logging
 import re
-from copy import deepcopy
 from statistics import mean, stdev
 from typing import Any
 
@@ -30,12 +29,39 @@ class OutputFormatter:
     if `config.clean_article_html` is True, then the article's html is
     cleaned as well. Only `settings.CLEAN_ARTICLE_TAGS` are allowed to
     remain in the html.
+
+    The formatter keeps no state between calls, one instance can be shared
+    by several threads.
     """
 
     def __init__(self, config=None):
         self.config = config or Configuration()
+        # the cleaners are not modified by clean_html(), they can be reused
+        self._text_cleaner = Cleaner(
+            javascript=True,
+            style=True,
+            remove_unknown_tags=False,
+            meta=True,
+            embedded=True,
+            frames=True,
+            allow_tags=settings.BLOCK_LEVEL_TAGS + ["br"],
+        )
+        self._html_cleaner = Cleaner(
+            javascript=True,
+            style=True,
+            remove_unknown_tags=False,
+            meta=True,
+            embedded=True,
+            allow_tags=settings.CLEAN_ARTICLE_TAGS,
+        )
 
-    def get_formatted(self, top_node: HtmlElement, article_title: str | None = None) -> tuple[str, str]:
+    def get_formatted(
+        self,
+        top_node: HtmlElement,
+        article_title: str | None = None,
+        scores: parsers.ScoreTable | None = None,
+        language: str | None = None,
+    ) -> tuple[str, str]:
         """Returns the body text of an article, and also the cleaned html body
         article of the article.
 
@@ -43,6 +69,10 @@ def get_formatted(self, top_node: HtmlElement, article_title: str | None = None)
             top_node {HtmlElement} -- The top node element of the article
             article_title {str} -- The title of the article, if available, to
                 be removed from the text (and max 1 paragraph before it)
+            scores {ScoreTable} -- The gravity scores computed by the article
+                body extractor for the top node
+            language {str} -- The language of the article, defaults to
+                `config.language`
 
         Returns:
             Tuple[str, str] -- The body text of the article, and the cleaned
@@ -52,24 +82,27 @@ def get_formatted(self, top_node: HtmlElement, article_title: str | None = None)
         if top_node is None:
             return (text, html)
 
-        node_cleaned = deepcopy(top_node)
+        if scores is None:
+            scores = parsers.ScoreTable()
+        language = language or self.config.language
+        node_cleaned = scores.copy(top_node)
 
-        self._remove_negativescores_nodes(node_cleaned)
+        self._remove_negativescores_nodes(node_cleaned, scores)
 
         if not self.config.clean_article_html:
             # We deliver the HTML untouched (only the negative nodes are removed)
             html = parsers.node_to_string(node_cleaned)
 
-        self._remove_advertisement_nodes(node_cleaned)
+        self._remove_advertisement_nodes(node_cleaned, scores, language)
 
-        self._remove_unlikely_nodes(node_cleaned)
+        self._remove_unlikely_nodes(node_cleaned, scores)
 
         self._remove_empty_tags(node_cleaned)
 
         # removes some same level tags that might
         # contain non-content like menus, gallery,  etc.
         # this can misfire on some sites
-        self._remove_trailing_media_div(node_cleaned)
+        self._remove_trailing_media_div(node_cleaned, scores, language)
 
         if self.config.clean_article_html:
             html = self._create_clean_html(node_cleaned)
@@ -79,17 +112,7 @@ def get_formatted(self, top_node: HtmlElement, article_title: str | None = None)
         return (text, html)
 
     def _convert_to_text(self, top_node: HtmlElement, article_title: str | None = None) -> str:
-        article_cleaner = Cleaner(
-            javascript=True,
-            style=True,
-            remove_unknown_tags=False,
-            meta=True,
-            embedded=True,
-            frames=True,
-            allow_tags=settings.BLOCK_LEVEL_TAGS + ["br"],
-        )
-
-        cleaned_node = article_cleaner.clean_html(top_node)
+        cleaned_node = self._text_cleaner.clean_html(top_node)
         # TODO: do not remove newlines in <pre> tags
 
         txts = [re.sub(r"[\s\t\xa0\uFEFF]+", " ", value, flags=re.UNICODE) for value in cleaned_node.itertext()]
@@ -114,16 +137,7 @@ def normalize_string(s: str) -> str:
         return "\n\n".join(txts)
 
     def _create_clean_html(self, top_node: HtmlElement):
-        article_cleaner = Cleaner(
-            javascript=True,
-            style=True,
-            remove_unknown_tags=False,
-            meta=True,
-            embedded=True,
-            allow_tags=settings.CLEAN_ARTICLE_TAGS,
-        )
-
-        cleaned_node = article_cleaner.clean_html(top_node)
+        cleaned_node = self._html_cleaner.clean_html(top_node)
         return parsers.node_to_string(cleaned_node)
 
     def _add_newline_to_br(self, top_node: HtmlElement):
@@ -132,15 +146,13 @@ def _add_newline_to_br(self, top_node: HtmlElement):
         for br in br_tags:
             br.tail = "\n" + br.tail if br.tail else "\n"
 
-    def _remove_negativescores_nodes(self, top_node: HtmlElement):
+    def _remove_negativescores_nodes(self, top_node: HtmlElement, scores: parsers.ScoreTable):
         """If there are elements inside our top node that have a
         negative gravity score, let's give em the boot.
         """
-        gravity_items = top_node.xpath(".//*[@gravityScore]")
+        gravity_items = [item for item in top_node.iterdescendants() if scores.has_gravity_score(item)]
         for item in gravity_items:
-            score = item.attrib.get("gravityScore", "0")
-            score = float(score)
-            if score < 1:
+            if scores.gravity_score(item) < 1:
                 item.getparent().remove(item)
 
     def _remove_empty_tags(self, top_node: HtmlElement):
@@ -170,7 +182,7 @@ def _get_top_level_nodes(self, top_node: HtmlElement):
 
         return top_level_nodes
 
-    def _remove_trailing_media_div(self, top_node: HtmlElement):
+    def _remove_trailing_media_div(self, top_node: HtmlElement, scores: parsers.ScoreTable, language: str):
         """Punish the *last top level* node in the top_node if it's
         DOM depth is too deep or has a a lot of links. Many media non-content
         links are eliminated: "related", "loading gallery", etc. It skips
@@ -189,22 +201,22 @@ def _remove_trailing_media_div(self, top_node: HtmlElement):
         if last_node_class in NON_MEDIA_CLASSES:
             return
         if last_node.tag != "p" and len(parsers.get_tags(last_node, "p")) > 0:
-            if parsers.get_node_gravity_score(last_node) > 15:
+            if scores.gravity_score(last_node) > 15:
                 return
 
         if parsers.get_node_depth(last_node) >= 2:
             parsers.remove(last_node)
-        elif parsers.is_highlink_density(last_node, self.config.language):
+        elif parsers.is_highlink_density(last_node, language):
             parsers.remove(last_node)
 
-    def _top_nodes_stats(self, top_node: HtmlElement):
+    def _top_nodes_stats(self, top_node: HtmlElement, scores: parsers.ScoreTable):
         """Returns a list of top nodes and stats about them"""
         top_nodes = self._get_top_level_nodes(top_node)
         node_stats: dict[str, dict[str, Any]] = {}
         for el in top_nodes:
             node_stats[el.tag] = node_stats.setdefault(el.tag, {"count": 0, "gravity": [], "depth": []})
             node_stats[el.tag]["count"] += 1
-            node_stats[el.tag]["gravity"].append(parsers.get_node_gravity_score(el))
+            node_stats[el.tag]["gravity"].append(scores.gravity_score(el))
             node_stats[el.tag]["depth"].append(parsers.get_node_depth(el))
 
         node_stats = {
@@ -220,11 +232,11 @@ def _top_nodes_stats(self, top_node: HtmlElement):
 
         return node_stats
 
-    def _remove_unlikely_nodes(self, top_node: HtmlElement):
+    def _remove_unlikely_nodes(self, top_node: HtmlElement, scores: parsers.ScoreTable):
         """Remove unlikely top level nodes from the top node
         based on statistical analysis based on depth and gravity score
         """
-        stats = self._top_nodes_stats(top_node)
+        stats = self._top_nodes_stats(top_node, scores)
         top_nodes = self._get_top_level_nodes(top_node)
 
         # has p and divs. Analyse if divs are not boilerplate or ads
@@ -232,7 +244,7 @@ def _remove_unlikely_nodes(self, top_node: HtmlElement):
             for node in top_nodes:
                 if node.tag != "div":
                     continue
-                gravity = parsers.get_node_gravity_score(node)
+                gravity = scores.gravity_score(node)
                 depth = parsers.get_node_depth(node)
 
                 if (
@@ -243,16 +255,16 @@ def _remove_unlikely_nodes(self, top_node: HtmlElement):
                 ):
                     parsers.remove(node)
 
-    def _remove_advertisement_nodes(self, top_node: HtmlElement):
+    def _remove_advertisement_nodes(self, top_node: HtmlElement, scores: parsers.ScoreTable, language: str):
         """Remove nodes that may contain advertisement content."""
         divs = top_node.xpath(".//div")
-        stats = self._top_nodes_stats(top_node)
+        stats = self._top_nodes_stats(top_node, scores)
 
         for el in divs:
             # Does it contain p tags?
             if len(parsers.get_tags(el, "p")):
-                if parsers.is_highlink_density(el, self.config.language):
-                    gravity = parsers.get_node_gravity_score(el)
+                if parsers.is_highlink_density(el, language):
+                    gravity = scores.gravity_score(el)
                     if len(stats):
                         limit = max([stats[x]["gravity_mean"] - 2 * stats[x]["gravity_std"] for x in stats])
                     else:
@@ -263,7 +275,7 @@ def _remove_advertisement_nodes(self, top_node: HtmlElement):
 
                 continue
 
-            if parsers.is_highlink_density(el, self.config.language):
+            if parsers.is_highlink_density(el, language):
                 parsers.remove(el)
                 continue
             attrs = el.get("class", "") + " " + el.get("id", "")
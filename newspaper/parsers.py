@@ -6,20 +6,39 @@
 import logging
 import re
 import string
-from collections import deque
+from collections import defaultdict, deque
+from collections.abc import Collection, Iterator
 from copy import deepcopy
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from html import unescape
 from math import exp
+from warnings import warn
 
 import lxml.etree
 import lxml.html
-from bs4.dammit import UnicodeDammit
 from lxml.html import HtmlElement
 
 from . import text as txt
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
 log = logging.getLogger(__name__)
 
+REGEX_NAMESPACE = {"re": "http://exslt.org/regular-expressions"}
+
+# Elements whose text is not part of the text of their parents (get_text)
+TEXT_EXCLUDED_TAGS = ("script", "style", "select", "option", "textarea")
+LINK_TAGS = ("a", "button")
+# JSON-LD scripts longer than this (in characters) are not parsed
+LD_JSON_MAX_SIZE = 1_000_000
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_XML_WHITESPACE = re.compile(r"[ \t\r\n]+")
+
 
 def drop_tags(nodes: HtmlElement | list[HtmlElement]):
     """Remove the tag(s), but not its children or text.
@@ -36,6 +55,8 @@ def get_unicode_html(html):
         return html
     if not html:
         return html
+    from bs4.dammit import UnicodeDammit  # pylint: disable=import-outside-toplevel
+
     converted = UnicodeDammit(html, is_html=True)
     if not converted.unicode_markup:
         raise ValueError(
@@ -68,6 +89,47 @@ def node_to_string(node):
     return lxml.etree.tostring(node, method="html").decode()
 
 
+@lru_cache(maxsize=1024)
+def compile_xpath(selector: str, regex: bool = False) -> lxml.etree.XPath:
+    """Compiles an xpath expression. The compiled expressions are cached, so
+    the selectors built by :any:`get_tags`, :any:`get_tags_regex` and
+    :any:`get_metatags` are compiled only once per process.
+    ``compile_xpath.cache_info().misses`` is the number of compilations
+    (see :any:`xpath_compilations`).
+
+    Args:
+        selector (str): the xpath expression.
+        regex (bool): if True, the EXSLT regular expression functions are
+            available under the ``re`` prefix.
+
+    Returns:
+        lxml.etree.XPath: the compiled expression.
+    """
+    return lxml.etree.XPath(selector, namespaces=REGEX_NAMESPACE if regex else None)
+
+
+def xpath(node: HtmlElement, selector: str, regex: bool = False) -> list:
+    """Evaluates `selector` on `node`, using the compiled expression cache.
+
+    Args:
+        node (HtmlElement): the context node.
+        selector (str): the xpath expression.
+        regex (bool): if True, the EXSLT regular expression functions are
+            available under the ``re`` prefix.
+
+    Returns:
+        list: the result of the expression.
+    """
+    return compile_xpath(selector, regex)(node)
+
+
+def xpath_compilations() -> int:
+    """Returns how many xpath expressions were compiled by
+    :any:`compile_xpath` (the cache misses).
+    """
+    return compile_xpath.cache_info().misses
+
+
 def get_tags_regex(
     node: HtmlElement,
     tag: str | None = None,
@@ -89,7 +151,6 @@ def get_tags_regex(
     if not attribs:
         return get_tags(node, tag=tag)
 
-    namespace = {"re": "http://exslt.org/regular-expressions"}
     sel_list = []
 
     for k, v in attribs.items():
@@ -97,8 +158,7 @@ def get_tags_regex(
         sel_list.append(selector)
 
     selector = ".//{}[{}]".format(tag or "*", " and ".join(sel_list))
-    elems = node.xpath(selector, namespaces=namespace)
-    return elems
+    return xpath(node, selector, regex=True)
 
 
 def get_tags(
@@ -133,9 +193,7 @@ def get_tags(
     if attribs_match not in ["exact", "substring", "word"]:
         raise ValueError("attribs_match must be one of 'exact', 'substring' or 'word'")
     if not attribs:
-        selector = f".//{(tag or '*')}"
-        elems = node.xpath(selector)
-        return elems
+        return xpath(node, f".//{(tag or '*')}")
 
     sel_list = []
     for k, v in attribs.items():
@@ -153,8 +211,7 @@ def get_tags(
 
         sel_list.append(selector)
     selector = ".//{}[{}]".format(tag or "*", " and ".join(sel_list))
-    elems = node.xpath(selector)
-    return elems
+    return xpath(node, selector)
 
 
 def get_elements_by_attribs(
@@ -198,8 +255,7 @@ def get_metatags(node: HtmlElement, value: str | None = None) -> list[HtmlElemen
 
     sel_list = [f"@name='{value}'", f"@property='{value}'", f"@itemprop='{value}'"]
     selector = "//meta[{}]".format(" or ".join(sel_list))
-    elems = node.xpath(selector)
-    return elems
+    return xpath(node, selector)
 
 
 def get_elements_by_tagslist(node: HtmlElement, tag_list: list[str]):
@@ -213,8 +269,7 @@ def get_elements_by_tagslist(node: HtmlElement, tag_list: list[str]):
         list[HtmlElement]: Elements matching the tags
     """
     selector = " | ".join([f".//{tag}" for tag in tag_list])
-    elems = node.xpath(selector)
-    return elems
+    return xpath(node, selector)
 
 
 def create_element(tag, text=None, tail=None):
@@ -261,11 +316,66 @@ def remove(
         parent.remove(node)
 
 
-def get_text(node):
-    node_copy = deepcopy(node)
-    lxml.etree.strip_elements(node_copy, lxml.etree.Comment, "script", "style", "select", "option", "textarea")
-    txts = list(node_copy.itertext())
-    return txt.inner_trim(" ".join(txts).strip())
+def iter_text(node: HtmlElement, exclude: Collection[str] = TEXT_EXCLUDED_TAGS) -> Iterator[str]:
+    """Iterates over the text of `node` and its descendants, like
+    ``node.itertext()``, but skips comments and the descendants with a tag
+    in `exclude` (together with their tails). The tree is not copied.
+
+    Args:
+        node (HtmlElement): the root of the subtree.
+        exclude (Collection[str]): tags whose text is skipped.
+
+    Yields:
+        str: the text pieces, in document order.
+    """
+    if node.text:
+        yield node.text
+    stack = [(iter(node), None)]
+    while stack:
+        children, parent = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if parent is not None and parent.tail:
+                yield parent.tail
+            continue
+        if not isinstance(child.tag, str):
+            # comments are skipped together with their tail
+            if child.tag is not lxml.etree.Comment and child.tail:
+                yield child.tail
+            continue
+        if child.tag in exclude:
+            continue
+        if child.text:
+            yield child.text
+        stack.append((iter(child), child))
+
+
+def get_text(
+    node: HtmlElement,
+    memo: dict[HtmlElement, str] | None = None,
+    exclude: Collection[str] = TEXT_EXCLUDED_TAGS,
+) -> str:
+    """Returns the text of `node`, with whitespace normalized. The text of
+    comments and of the descendants with a tag in `exclude` (scripts, styles,
+    etc.) is not included.
+
+    Args:
+        node (HtmlElement): the node.
+        memo (dict[HtmlElement, str] | None): optional cache of the results,
+            for when the text of the same nodes is needed several times. It
+            must not be kept after the tree is modified.
+        exclude (Collection[str]): tags whose text is skipped.
+
+    Returns:
+        str: the text of the node.
+    """
+    if memo is not None and node in memo:
+        return memo[node]
+    text = txt.inner_trim(" ".join(iter_text(node, exclude)).strip())
+    if memo is not None:
+        memo[node] = text
+    return text
 
 
 def get_attribute(node: HtmlElement, attr: str, *, type_=None, default=None) -> str | None:
@@ -298,21 +408,43 @@ def outer_html(node):
     return node_to_string(e0)
 
 
-def get_ld_json_object(node):
-    """Get the JSON-LD object from the node"""
+def load_json(text: str):
+    """Decodes a JSON document, like ``json.loads``. Uses orjson if it is
+    installed (``pip install newspaper4k[orjson]``), it is several times faster.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # the standard library also accepts NaN, Infinity and big integers
+            pass
+    return json.loads(text)
+
+
+def get_ld_json_object(node, max_size: int | None = LD_JSON_MAX_SIZE):
+    """Get the JSON-LD object from the node. Scripts longer than
+    `max_size` characters are skipped (None for no limit).
+    """
     # yoast seo structured data
     json_ld = get_tags(node, tag="script", attribs={"type": "application/ld+json"})
-    res = []
-    if json_ld:
-        for script_tag in json_ld:
-            try:
-                schema_json = json.loads(script_tag.text)
-            except Exception:
-                continue
-            if isinstance(schema_json, list):
-                res.extend(item for item in schema_json if isinstance(item, dict))
-            else:
-                res.append(schema_json)
+    return _parse_ld_json(json_ld, max_size)
+
+
+def _parse_ld_json(scripts: list[HtmlElement], max_size: int | None) -> list:
+    res: list = []
+    for script_tag in scripts:
+        text = script_tag.text
+        if text and max_size is not None and len(text) > max_size:
+            log.debug("Skipped a JSON-LD script of %d characters", len(text))
+            continue
+        try:
+            schema_json = load_json(text)
+        except Exception:
+            continue
+        if isinstance(schema_json, list):
+            res.extend(item for item in schema_json if isinstance(item, dict))
+        else:
+            res.append(schema_json)
 
     return res
 
@@ -382,10 +514,10 @@ def is_highlink_density(e, language=None):
         return False
 
     text = get_text(e)
+    stopwords = txt.get_stopwords(language) if language else None
 
     def get_word_count(text):
-        if language:
-            stopwords = txt.StopWords(language)
+        if stopwords is not None:
             words = list(stopwords.tokenizer(text))
         else:
             words = [word for word in text.split() if word.isalnum()]
@@ -393,13 +525,17 @@ def get_word_count(text):
         return len(words)
 
     total_words = get_word_count(text)
-    if total_words == 0:
-        return len(links) > 0
-
     link_words_counts = [get_word_count(get_text(link)) for link in links]
     link_words_counts = [w if w else 1 for w in link_words_counts]  # Penalize empty links.
-    num_link_words = sum(link_words_counts)
-    num_links = len(links)
+
+    return _is_highlink_density(total_words, sum(link_words_counts), len(links))
+
+
+def _is_highlink_density(total_words: int, num_link_words: int, num_links: int) -> bool:
+    if not num_links:
+        return False
+    if total_words == 0:
+        return True
 
     proportion = num_link_words * 100 / total_words
 
@@ -417,6 +553,413 @@ def get_word_count(text):
     # return True if score > 1.0 else False
 
 
-def get_node_gravity_score(node):
+@dataclass
+class NodeFeatures:
+    """Text statistics of a node, the same that :any:`get_text` and
+    :any:`is_highlink_density` would compute for it.
+
+    Attributes:
+        level (int): level of the node in the tree (see :any:`get_level`).
+        position (int): position of the node in document order.
+        text_length (int): length of the node text.
+        word_count (int): number of tokens in the node text.
+        stop_word_count (int): number of stopwords in the node text.
+        link_count (int): number of ``a`` and ``button`` descendants.
+        link_word_count (int): number of tokens in the text of these
+            descendants. Empty links count as one word.
+    """
+
+    level: int = 0
+    position: int = 0
+    text_length: int = 0
+    word_count: int = 0
+    stop_word_count: int = 0
+    link_count: int = 0
+    link_word_count: int = 0
+
+    @property
+    def is_highlink_density(self) -> bool:
+        """Same result as :any:`is_highlink_density` for the node."""
+        return _is_highlink_density(self.word_count, self.link_word_count, self.link_count)
+
+
+class DocumentFeatures:
+    """The :any:`NodeFeatures` of every element of a document, computed in
+    one bottom-up traversal. Calling :any:`get_text` and
+    :any:`is_highlink_density` for each node copies and tokenizes the whole
+    subtree of the node again.
+
+    With the default (latin) tokenizer, the statistics of a node are the sum
+    of the statistics of its text, its children and their tails, so every
+    piece of text is tokenized only once. The language specific tokenizers
+    can split the joined text differently, so for these the text of each node
+    is kept and tokenized the first time the node is looked up. The same is
+    done for the elements that :any:`get_text` removes (scripts, styles, etc.),
+    as their text is only needed if they are looked up themselves.
+
+    Args:
+        doc (HtmlElement): the root of the annotated tree.
+        stopwords (StopWords): the tokenizer and stopwords of the document
+            language.
+    """
+
+    def __init__(self, doc: HtmlElement, stopwords: txt.StopWords):
+        self.stopwords = stopwords
+        self.additive = stopwords.tokenizer is txt.default_tokenizer and stopwords.find_stopwords is None
+        self._features: dict[HtmlElement, NodeFeatures] = {}
+        # nodes whose words are counted on first lookup, with their text
+        # (or None if it must be computed with get_text)
+        self._pending: dict[HtmlElement, str | None] = {}
+        self._texts: dict[HtmlElement, str] = {}
+        self._annotate(doc)
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def __contains__(self, node) -> bool:
+        return node in self._features
+
+    def __getitem__(self, node: HtmlElement) -> NodeFeatures:
+        features = self._features[node]
+        if node in self._pending:
+            self._count_words(node, features, self._pending.pop(node))
+        return features
+
+    def get(self, node: HtmlElement, default: NodeFeatures | None = None) -> NodeFeatures | None:
+        """Returns the features of `node`, or `default` if the node is not
+        part of the annotated tree.
+        """
+        if node not in self._features:
+            return default
+        return self[node]
+
+    def _annotate(self, doc: HtmlElement):
+        levels = [get_level(doc) - 1]
+        positions: list[int] = []
+        # the text parts of each node in get_text order: strings (trimmed)
+        # and child elements. The strings are tokenized in one batch.
+        node_parts: dict[HtmlElement, list] = {}
+        for event, node in lxml.etree.iterwalk(doc, events=("start", "end")):
+            if event == "start":
+                levels.append(levels[-1] + 1)
+                positions.append(len(self._features) + len(positions))
+                continue
+
+            features = NodeFeatures(level=levels.pop(), position=positions.pop())
+            parts = [node.text]
+            for child in node:
+                if not isinstance(child.tag, str):
+                    # comments are removed together with their tail
+                    if child.tag is not lxml.etree.Comment:
+                        parts.append(child.tail)
+                    continue
+                features.link_count += self._features[child].link_count
+                if child.tag in LINK_TAGS:
+                    features.link_count += 1
+                if child.tag not in TEXT_EXCLUDED_TAGS:
+                    parts.append(child)
+                    parts.append(child.tail)
+
+            if not self.additive:
+                texts = [txt.inner_trim(p) if isinstance(p, str) else self._texts[p] for p in parts if p is not None]
+                text = " ".join([t for t in texts if t])
+                features.text_length = len(text)
+                self._texts[node] = self._pending[node] = text
+            elif node.tag in TEXT_EXCLUDED_TAGS:
+                self._pending[node] = None
+            else:
+                trimmed = [txt.inner_trim(p) if isinstance(p, str) else p for p in parts if p is not None]
+                node_parts[node] = [p for p in trimmed if p != ""]
+            self._features[node] = features
+        self._texts.clear()
+
+        if self.additive:
+            self._add_word_counts(node_parts)
+
+    def _add_word_counts(self, node_parts: dict[HtmlElement, list]):
+        texts = [p for parts in node_parts.values() for p in parts if isinstance(p, str)]
+        word_stats = iter(self.stopwords.get_stopword_counts(texts))
+        # the nodes are in document post-order: children before their parent
+        for node, features in self._features.items():
+            for child in node:
+                if not isinstance(child.tag, str):
+                    continue
+                child_features = self._features[child]
+                features.link_word_count += child_features.link_word_count
+                if child.tag in LINK_TAGS:
+                    features.link_word_count += child_features.word_count or 1
+
+            lengths = []
+            for part in node_parts.get(node, ()):
+                if isinstance(part, str):
+                    stats = next(word_stats)
+                    features.word_count += stats.word_count
+                    features.stop_word_count += stats.stop_word_count
+                    lengths.append(len(part))
+                    continue
+                child_features = self._features[part]
+                if not child_features.text_length:
+                    continue
+                features.word_count += child_features.word_count
+                features.stop_word_count += child_features.stop_word_count
+                lengths.append(child_features.text_length)
+            # the parts are joined with one space
+            features.text_length = sum(lengths) + len(lengths) - 1 if lengths else 0
+
+    def _count_words(self, node: HtmlElement, features: NodeFeatures, text: str | None):
+        if text is None:
+            text = get_text(node)
+        stats = self.stopwords.get_stopword_count(text)
+        features.text_length = len(text)
+        features.word_count = stats.word_count
+        features.stop_word_count = stats.stop_word_count
+        if not self.additive:
+            features.link_word_count = sum(self[link].word_count or 1 for link in node.iterdescendants(*LINK_TAGS))
+
+
+@dataclass
+class NodeScore:
+    """The scores of a node, see :any:`ScoreTable`.
+
+    Attributes:
+        gravity_score (float | None): how likely the node is the article
+            body container. None if the node was never scored.
+        gravity_nodes (float): number of candidate nodes that added to
+            the gravity score.
+        stop_words (int): number of stopwords in the node text, without the
+            stopwords of the candidate descendants.
+        word_count (int): number of words in the node text, without the
+            words of the candidate descendants.
+        node_level (int): level of the node in the tree.
+    """
+
+    gravity_score: float | None = None
+    gravity_nodes: float = 0.0
+    stop_words: int = 0
+    word_count: int = 0
+    node_level: int = 0
+
+
+class ScoreTable:
+    """The scores computed while searching for the article body, keyed by
+    element. The scores are kept here, as numbers, instead of attributes
+    of the elements, so the document is not modified. One table is used for
+    each parse.
+    """
+
+    def __init__(self):
+        self._scores: dict[HtmlElement, NodeScore] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, node) -> bool:
+        return node in self._scores
+
+    def get(self, node: HtmlElement) -> NodeScore | None:
+        """Returns the scores of `node`, or None if it has no scores."""
+        return self._scores.get(node)
+
+    def node(self, node: HtmlElement) -> NodeScore:
+        """Returns the scores of `node`, adding an empty entry if needed."""
+        score = self._scores.get(node)
+        if score is None:
+            score = self._scores[node] = NodeScore()
+        return score
+
+    def gravity_score(self, node: HtmlElement) -> float:
+        """Returns the gravity score of `node` (0 if it has none)."""
+        score = self._scores.get(node)
+        if score is None or score.gravity_score is None:
+            return 0.0
+        return score.gravity_score
+
+    def has_gravity_score(self, node: HtmlElement) -> bool:
+        """Returns True if `node` has a gravity score."""
+        score = self._scores.get(node)
+        return score is not None and score.gravity_score is not None
+
+    def stop_words(self, node: HtmlElement) -> int:
+        """Returns the stopword count of `node` (0 if it has none)."""
+        score = self._scores.get(node)
+        return 0 if score is None else score.stop_words
+
+    def copy(self, node: HtmlElement) -> HtmlElement:
+        """Returns a deep copy of `node`. The scores of the subtree are
+        copied to the new elements.
+        """
+        node_copy = deepcopy(node)
+        if self._scores:
+            for original, copied in zip(node.iter(), node_copy.iter(), strict=True):
+                score = self._scores.get(original)
+                if score is not None:
+                    self._scores[copied] = replace(score)
+        return node_copy
+
+
+def get_node_gravity_score(node: HtmlElement, scores: ScoreTable | None = None) -> float:
+    """Returns the gravity score of `node`.
+
+    .. deprecated:: 0.9.5
+        The scores are no longer stored as attributes of the elements, use
+        :any:`ScoreTable.gravity_score` on the table of the parse
+        (``article.extractor.scores``).
+    """
+    warn(
+        "`get_node_gravity_score` is deprecated, use `ScoreTable.gravity_score` instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    if scores is not None:
+        return scores.gravity_score(node)
     gravity_score = node.get("gravityScore")
     return 0.0 if gravity_score is None else float(gravity_score)
+
+
+def _attribute_matches(
+    value: str | None,
+    query: str,
+    attribs_match: str = "exact",
+    ignore_dashes: bool = False,
+) -> bool:
+    """Python version of the attribute tests made by :any:`get_tags`"""
+    value = (value or "").translate(_ASCII_LOWER)
+    if ignore_dashes:
+        value = value.replace("-", " ").replace("_", " ")
+    query = query.lower()
+    if attribs_match == "exact":
+        return value == query
+    if attribs_match == "substring":
+        return query in value
+    return f" {query} " in f" {_XML_WHITESPACE.sub(' ', value).strip(' ')} "
+
+
+class DocumentIndex:
+    """The elements of a document by tag and by attribute value, plus the
+    parsed JSON-LD objects. Everything is collected the first time it is
+    needed, with one pass over the tree, and then shared by all the
+    extractors instead of each of them searching the tree again.
+
+    The methods give the same results as the functions of this module with
+    the same name, called on the root of the document. The index is not
+    updated if the tree changes after it was built.
+
+    Args:
+        doc (HtmlElement): the root of the document.
+        max_ld_json_size (int | None): JSON-LD scripts longer than this
+            (in characters) are skipped. None for no limit.
+    """
+
+    def __init__(self, doc: HtmlElement, max_ld_json_size: int | None = LD_JSON_MAX_SIZE):
+        self.doc = doc
+        self.max_ld_json_size = max_ld_json_size
+        self._elements: list[HtmlElement] | None = None
+        self._tags: dict[str, list[HtmlElement]] = {}
+        self._attributes: dict[str, dict[str, list[HtmlElement]]] = {}
+        self._metatags: dict[str, list[HtmlElement]] | None = None
+        self._ld_json: list | None = None
+
+    def _build(self) -> list[HtmlElement]:
+        elements = []
+        tags = defaultdict(list)
+        for node in self.doc.iterdescendants():
+            if isinstance(node.tag, str):
+                elements.append(node)
+                tags[node.tag].append(node)
+        self._elements = elements
+        self._tags = dict(tags)
+        return elements
+
+    @property
+    def elements(self) -> list[HtmlElement]:
+        """All the elements below the root, in document order."""
+        if self._elements is None:
+            return self._build()
+        return self._elements
+
+    def tags(self, tag: str | None = None) -> list[HtmlElement]:
+        """The elements with tag `tag` (all the elements if None)."""
+        elements = self.elements
+        if tag is None:
+            return elements
+        return self._tags.get(tag, [])
+
+    def _attribute_values(self, attr: str) -> dict[str, list[HtmlElement]]:
+        """The elements that have `attr`, by lowercase attribute value."""
+        values = self._attributes.get(attr)
+        if values is None:
+            values = defaultdict(list)
+            for node in self.elements:
+                value = node.get(attr)
+                if value is not None:
+                    values[value.translate(_ASCII_LOWER)].append(node)
+            values = self._attributes[attr] = dict(values)
+        return values
+
+    def get_tags(
+        self,
+        tag: str | None = None,
+        attribs: dict[str, str] | None = None,
+        attribs_match: str = "exact",
+        ignore_dashes: bool = False,
+    ) -> list[HtmlElement]:
+        """Same as :any:`get_tags` on the document root."""
+        if attribs_match not in ["exact", "substring", "word"]:
+            raise ValueError("attribs_match must be one of 'exact', 'substring' or 'word'")
+        if not attribs:
+            return list(self.tags(tag))
+
+        attribs = dict(attribs)
+        candidates = None
+        if attribs_match == "exact" and not ignore_dashes:
+            # exact matches are looked up, the other attributes are checked
+            attr, value = next(((k, v) for k, v in attribs.items() if v), (None, None))
+            if attr is not None and value:
+                candidates = self._attribute_values(attr).get(value.lower(), [])
+                del attribs[attr]
+                if tag is not None:
+                    candidates = [node for node in candidates if node.tag == tag]
+        if candidates is None:
+            candidates = self.tags(tag)
+
+        return [
+            node
+            for node in candidates
+            if all(_attribute_matches(node.get(k), v, attribs_match, ignore_dashes) for k, v in attribs.items())
+        ]
+
+    def get_tags_regex(self, tag: str | None = None, attribs: dict[str, str] | None = None) -> list[HtmlElement]:
+        """Same as :any:`get_tags_regex` on the document root."""
+        if not attribs:
+            return list(self.tags(tag))
+        patterns = {k: re.compile(v, re.IGNORECASE) for k, v in attribs.items()}
+        return [
+            node for node in self.tags(tag) if all(pattern.search(node.get(k) or "") for k, pattern in patterns.items())
+        ]
+
+    def get_elements_by_attribs(self, attribs: dict[str, str], attribs_match: str = "exact") -> list[HtmlElement]:
+        """Same as :any:`get_elements_by_attribs` on the document root."""
+        return self.get_tags(attribs=attribs, attribs_match=attribs_match)
+
+    def get_metatags(self, value: str | None = None) -> list[HtmlElement]:
+        """Same as :any:`get_metatags` on the document root."""
+        if value is None:
+            return list(self.tags("meta"))
+        if self._metatags is None:
+            metatags = defaultdict(list)
+            for node in self.tags("meta"):
+                for key in dict.fromkeys((node.get("name"), node.get("property"), node.get("itemprop"))):
+                    if key is not None:
+                        metatags[key].append(node)
+            self._metatags = dict(metatags)
+        return list(self._metatags.get(value, []))
+
+    def get_ld_json_object(self) -> list:
+        """Same as :any:`get_ld_json_object` on the document root. The
+        scripts are parsed only once, do not modify the returned objects.
+        """
+        if self._ld_json is None:
+            self._ld_json = _parse_ld_json(
+                self.get_tags(tag="script", attribs={"type": "application/ld+json"}), self.max_ld_json_size
+            )
+        return self._ld_json
@@ -21,6 +21,7 @@
 POPULAR_URLS = PARENT_DIRECTORY / "resources/misc/popular_sources.txt"
 USERAGENTS = PARENT_DIRECTORY / "resources/misc/useragents.txt"
 STOPWORDS_DIR = PARENT_DIRECTORY / "resources/text"
+PUNCTUATION_FILE = PARENT_DIRECTORY / "resources/misc/punctuation.txt"
 
 DATA_DIRECTORY = ".newspaper_scraper"
 
@@ -134,7 +135,16 @@
 # category cache
 CACHE_DIRECTORY = TOP_DIRECTORY / "category_cache"
 
-TRENDING_URL = "https://trends.google.com/trending/rss"
+# host capability cache (range support, binary urls, redirects, robots.txt)
+HOST_CACHE_FILE = TOP_DIRECTORY / "host_capabilities.json"
+HOST_CACHE_MAX_ENTRIES = 10000
+HOST_CACHE_TTL = 86400  # seconds
+HOST_CACHE_SAVE_INTERVAL = 60  # seconds
+
+# responses cached for conditional requests (ETag / Last-Modified)
+HTTP_CACHE_DIRECTORY = TOP_DIRECTORY / "http_cache"
 
-for path in (TOP_DIRECTORY, MEMO_DIR, CACHE_DIRECTORY):
-    path.mkdir(parents=True, exist_ok=True)
+# default location of the record / replay http archive
+HTTP_ARCHIVE_DIRECTORY = TOP_DIRECTORY / "http_archive"
+
+TRENDING_URL = "https://trends.google.com/trending/rss"
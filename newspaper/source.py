@@ -7,19 +7,22 @@
 Source provdides basic crawling + parsing logic for a news source homepage.
 """
 
+import asyncio
 import logging
 import re
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import wraps
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
 from lxml.html import HtmlElement
-from tldextract import tldextract
+from requests import RequestException, Response
 
 import newspaper.parsers as parsers
 from newspaper.exceptions import RobotsException
+from newspaper.network_cache import HostCapabilityCache
 from newspaper.network_hooks import add_hook
 
 from . import network, urls, utils
@@ -168,7 +171,7 @@ def __init__(
 
         self.logo_url = ""
         self.favicon = ""
-        self.brand = tldextract.extract(self.url).domain
+        self.brand = urls.extract_tld(self.url).domain
         self.description = ""
         self.read_more_link = read_more_link
 
@@ -313,14 +316,18 @@ def _init_robots_parser(self):
             return
 
         robot_url = urlunsplit([self.scheme, self.domain, "robots.txt", "", ""])
-        try:
-            response = network.do_request(robot_url, self.config)
-            response.raise_for_status()
-        except Exception as e:
-            log.warning(f"Failed to fetch robots.txt from {robot_url}: {e}")
-            self._robots = None
-            self._robots_init_done = True
-            return
+        robots_txt = network.host_cache.get(HostCapabilityCache.ROBOTS, robot_url)
+        if robots_txt is None:
+            try:
+                response = network.do_request(robot_url, self.config)
+                response.raise_for_status()
+            except Exception as e:
+                log.warning(f"Failed to fetch robots.txt from {robot_url}: {e}")
+                self._robots = None
+                self._robots_init_done = True
+                return
+            robots_txt = response.text
+            network.host_cache.set(HostCapabilityCache.ROBOTS, robot_url, robots_txt)
         try:
             from protego import Protego
         except ImportError as e:
@@ -331,7 +338,6 @@ def _init_robots_parser(self):
                 "or pip install newspaper4k[all]\n"
             ) from e
 
-        robots_txt = response.text
         self._robots = Protego.parse(robots_txt)
 
         def check_robots_hook(url, config):
@@ -404,6 +410,7 @@ def parse(self):
         if self.doc is None:
             log.warning("Source %s parse error.", self.url)
             return
+        self.extractor.index_document(self.doc)
         self.set_description()
 
     def parse_categories(self):
@@ -584,10 +591,64 @@ def download_articles(self) -> list[Article]:
                 "Using %s+ threads on a single source may result in rate limiting!",
                 NUM_THREADS_PER_SOURCE_WARN_LIMIT,
             )
-        responses = network.multithread_request(url_list, self.config)
-        # Note that the responses are returned in original order
+        positions: defaultdict[str, deque[int]] = defaultdict(deque)
+        for idx, url in enumerate(url_list):
+            positions[url].append(idx)
+
+        # The responses arrive in completion order: the articles are processed
+        # while the other downloads are still running
         with ThreadPoolExecutor(max_workers=threads) as tpe:
-            futures = []
+            futures: list[Future | None] = [None] * len(url_list)
+            for url, result in network.multithread_request_iter(url_list, self.config):
+                idx = positions[url].popleft()
+                article = self.articles[idx]
+                response: Response | None = None
+                if isinstance(result, (RequestException, RobotsException)):
+                    log.warning("download_articles(): Http download error %s on URL: %s", result, url)
+                elif isinstance(result, Exception):
+                    raise result
+                else:
+                    response = result
+                if response is not None and response.status_code < 400:
+                    html = network.get_html(article.url, response=response)
+                else:
+                    html = ""
+                    failed_articles.append(article.url)
+
+                futures[idx] = tpe.submit(article.download, input_html=html)
+
+            self.articles = [future.result() for future in futures if future is not None]
+
+        self.is_downloaded = True
+
+        if len(failed_articles) > 0:
+            log.warning(
+                "There were %d articles that failed to download: %s",
+                len(failed_articles),
+                ", ".join(failed_articles),
+            )
+        return self.articles
+
+    @init_robots
+    async def adownload_articles(self) -> list[Article]:
+        """Asyncio version of :any:`Source.download_articles()`. All the
+        articles in :any:`Source.articles` are downloaded concurrently on the
+        running event loop, using a single ``aiohttp`` session. The number of
+        simultaneous connections is bounded by
+        :any:`Configuration.async_max_connections`.
+        Requires the ``aiohttp`` package.
+
+        Returns:
+            list[:any:`Article`]: A list of downloaded articles.
+        """
+        url_list = self.article_urls()
+
+        failed_articles = []
+
+        async with network.async_session(self.config):
+            responses = await network.amultithread_request(url_list, self.config)
+            # Note that the responses are returned in original order
+            coroutines = []
             for response, article in zip(responses, self.articles, strict=False):
                 if response and response.status_code < 400:
                     html = network.get_html(article.url, response=response)
@@ -595,9 +656,9 @@ def download_articles(self) -> list[Article]:
                     html = ""
                     failed_articles.append(article.url)
 
-                futures.append(tpe.submit(article.download, input_html=html))
+                coroutines.append(article.adownload(input_html=html))
 
-            self.articles = [future.result() for future in futures]
+            self.articles = list(await asyncio.gather(*coroutines))
 
         self.is_downloaded = True
 
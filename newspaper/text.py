@@ -5,37 +5,92 @@
 import re
 import string
 import sys
+import threading
+import unicodedata
 from dataclasses import dataclass, field
 from pathlib import Path
-from unicodedata import category
 
 from newspaper import settings
 from newspaper.languages import normalize_language_code
 
-punctuation_set = {c for i in range(sys.maxunicode + 1) if category(c := chr(i)).startswith("P")}
-punctuation_set.update(string.punctuation)
 # remove characters used in contractions
 contraction_separators = set("-'`ʹʻʼʽʾʿˈˊ‘’‛′‵Ꞌꞌ")
-punctuation_set -= contraction_separators
-punctuation: str = "".join(list(punctuation_set))
-try:
-    from nltk.tokenize import WhitespaceTokenizer
-
-    whitespace_tokenizer = WhitespaceTokenizer()
-except ImportError:
-    import warnings
-
-    warnings.warn(
-        "nltk is not installed. Some NLP features will be unavailable. Install it with: pip install 'newspaper4k[nlp]'",
-        UserWarning,
-        stacklevel=2,
-    )
 
-    class _FallbackWhitespaceTokenizer:
-        def tokenize(self, text):
-            return re.split(r"\s+", text.strip())
 
-    whitespace_tokenizer = _FallbackWhitespaceTokenizer()  # type: ignore[assignment]
+def compute_punctuation() -> str:
+    """Returns all the unicode punctuation characters (category P*) and
+    ``string.punctuation``, except the contraction separators. It checks all
+    the code points, so it is slow: the result is shipped in
+    ``settings.PUNCTUATION_FILE``, regenerate it with
+    :any:`write_punctuation_file` when the unicode version changes.
+    """
+    chars = {c for i in range(sys.maxunicode + 1) if unicodedata.category(c := chr(i)).startswith("P")}
+    chars.update(string.punctuation)
+    chars -= contraction_separators
+    return "".join(sorted(chars))
+
+
+def write_punctuation_file(path: Path | str = settings.PUNCTUATION_FILE):
+    """Writes the result of :any:`compute_punctuation` to `path`"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"# unicode {unicodedata.unidata_version} punctuation, see newspaper.text.compute_punctuation\n")
+        f.write(compute_punctuation() + "\n")
+
+
+def _load_punctuation() -> str:
+    try:
+        with open(settings.PUNCTUATION_FILE, encoding="utf-8") as f:
+            return f.read().splitlines()[1]
+    except (OSError, IndexError):
+        return compute_punctuation()
+
+
+punctuation: str = _load_punctuation()
+punctuation_set = set(punctuation)
+# translation table replacing the punctuation with spaces
+punctuation_table = str.maketrans(punctuation, " " * len(punctuation))
+
+# str.translate looks up every character of a non ascii string in the table,
+# which is slow for long texts. _replace_punctuation does the same with a
+# bytes table for the ascii punctuation and regexes for the rest. The regex
+# character sets are only fast if all the characters are below U+10000.
+_ascii_punctuation = "".join(c for c in punctuation if c.isascii())
+_ascii_punctuation_table = bytes.maketrans(_ascii_punctuation.encode(), b" " * len(_ascii_punctuation))
+_bmp_punctuation = "".join(c for c in punctuation if not c.isascii() and c <= "\uffff")
+_bmp_punctuation_re = re.compile(f"[{re.escape(_bmp_punctuation)}]")
+_astral_re = re.compile("[\U00010000-\U0010ffff]")
+
+
+def _replace_astral_punctuation(match: re.Match) -> str:
+    return " " if match.group() in punctuation_set else match.group()
+
+
+def _replace_punctuation(text: str) -> str:
+    """Same as ``text.translate(punctuation_table)``"""
+    text = text.encode("utf-8", "surrogatepass").translate(_ascii_punctuation_table).decode("utf-8", "surrogatepass")
+    if text.isascii():
+        return text
+    text = _bmp_punctuation_re.sub(" ", text)
+    return _astral_re.sub(_replace_astral_punctuation, text)
+
+
+class _WhitespaceTokenizer:
+    """Splits the text on whitespace, same as nltk's WhitespaceTokenizer"""
+
+    # the unicode White_Space characters: unlike nltk's, the \s of the
+    # standard re module also matches the separators \x1c-\x1f
+    _whitespace_re = re.compile(r"[^\S\x1c-\x1f]+")
+
+    _separators_re = re.compile(r"[\x1c-\x1f]")
+
+    def tokenize(self, text: str) -> list[str]:
+        if self._separators_re.search(text) is None:
+            # str.split splits on the same characters, except the separators
+            return text.split()
+        return [token for token in self._whitespace_re.split(text) if token]
+
+
+whitespace_tokenizer = _WhitespaceTokenizer()
 
 
 def inner_trim(value):
@@ -57,6 +112,39 @@ def inner_trim(value):
     return value.strip()
 
 
+# separates the texts of a batch, see default_batch_tokenizer. It is not
+# punctuation, whitespace or a word character, and lxml never returns it.
+_BATCH_SEPARATOR = "\x00"
+
+
+def _contraction_pattern(separator: str = "") -> re.Pattern:
+    """The regex matching the contraction separators at the start or the
+    end of a word, at the start or the end of the text, and the repeated
+    separators. All the alternatives start with a separator, so that the
+    regex engine can skip to the next separator quickly. If `separator` is
+    given, the regex handles it the same as the start and the end of the
+    text.
+    """
+    seps = f"[{re.escape(''.join(sorted(contraction_separators)))}]"
+    separator = re.escape(separator)
+    if not separator:
+        return re.compile(rf"{seps}(?:(?<=\W.)|(?=\W)|(?<=\A.){seps}*|{seps}*$|{seps}+)")
+    return re.compile(
+        rf"{seps}(?:(?<=[^\w{separator}].)|(?=[^\w{separator}])|"
+        rf"(?:(?<=\A.)|(?<={separator}.)){seps}*|{seps}*(?=\n?(?:{separator}|\Z))|{seps}+)"
+    )
+
+
+_contraction_re = _contraction_pattern()
+_batch_contraction_re = _contraction_pattern(_BATCH_SEPARATOR)
+
+
+def _decode(text):
+    if isinstance(text, bytes):
+        return text.decode("utf-8", "replace")
+    return text
+
+
 def default_tokenizer(text):
     """Tokenizes the given text using the default latin language tokenizer.
     Will split tokens on words and punctuation. Use this tokenizer for
@@ -70,25 +158,49 @@ def default_tokenizer(text):
         list: A list of tokens.
 
     """
-    if isinstance(text, bytes):
-        text = text.decode("utf-8", "replace")
     # Remove punctuation
-    text = text.translate(
-        str.maketrans(
-            punctuation,
-            " " * len(punctuation),
-        )
-    )
+    text = _replace_punctuation(_decode(text))
     # remove multiple contraction separators
-    regex_str = re.escape("".join(contraction_separators))
-    text = re.sub(
-        rf"(?<=\W)[{regex_str}]|[{regex_str}](?=\W)|" f"^[{regex_str}]*|[{regex_str}]*$|[{regex_str}]{{2,}}",
-        " ",
-        text,
-    )
+    text = _contraction_re.sub(" ", text)
     return whitespace_tokenizer.tokenize(text.lower())
 
 
+def _tokenize_joined(texts: list[str]) -> list[list[str]]:
+    joined = _BATCH_SEPARATOR.join(texts)
+    if joined.count(_BATCH_SEPARATOR) != len(texts) - 1:
+        # some text contains the separator
+        return [default_tokenizer(t) for t in texts]
+    joined = _batch_contraction_re.sub(" ", _replace_punctuation(joined)).lower()
+    tokenize = whitespace_tokenizer.tokenize
+    return [tokenize(t) for t in joined.split(_BATCH_SEPARATOR)]
+
+
+def default_batch_tokenizer(texts):
+    """Tokenizes a list of texts with :any:`default_tokenizer`. The texts
+    are processed together, which is faster than tokenizing them one by one
+    when there are many short texts (node texts, sentences).
+
+    Args:
+        texts (Iterable[str]): The texts to be tokenized.
+
+    Returns:
+        list[list[str]]: The tokens of each text.
+    """
+    texts = [_decode(t) for t in texts]
+    # the ascii texts are processed separately: one non ascii character
+    # slows down all the string operations on the joined text
+    ascii_indices = [i for i, t in enumerate(texts) if t.isascii()]
+    if not ascii_indices or len(ascii_indices) == len(texts):
+        return _tokenize_joined(texts) if texts else []
+
+    other_indices = [i for i, t in enumerate(texts) if not t.isascii()]
+    result: list[list[str]] = [[] for _ in texts]
+    for indices in (ascii_indices, other_indices):
+        for i, tokens in zip(indices, _tokenize_joined([texts[i] for i in indices])):
+            result[i] = tokens
+    return result
+
+
 @dataclass
 class WordStats:
     """Holds the number of stop words and total words in an article"""
@@ -181,3 +293,76 @@ def get_stopword_count(self, content: str) -> WordStats:
             word_count=len(tokens),
             stop_words=intersection,
         )
+
+    def tokenize_batch(self, texts: list[str]) -> list[list[str]]:
+        """Tokenizes each of the texts with the language tokenizer. The
+        default tokenizer processes the whole list at once
+        (see :any:`default_batch_tokenizer`).
+
+        Args:
+            texts (list[str]): The texts to tokenize.
+
+        Returns:
+            list[list[str]]: The tokens of each text.
+        """
+        if self.tokenizer is default_tokenizer:
+            return default_batch_tokenizer(texts)
+        return [list(self.tokenizer(text)) for text in texts]
+
+    def get_stopword_counts(self, contents: list[str]) -> list[WordStats]:
+        """Same as :any:`get_stopword_count` for each of the contents, with
+        the contents tokenized in one batch.
+
+        Args:
+            contents (list[str]): The contents to analyze.
+
+        Returns:
+            list[WordStats]: The statistics of each content.
+        """
+        tokenized = iter(self.tokenize_batch([content for content in contents if content]))
+        results = []
+        for content in contents:
+            if not content:
+                results.append(WordStats())
+                continue
+            tokens = next(tokenized)
+            if self.find_stopwords:
+                intersection = self.find_stopwords(tokens, self.stop_words)
+            else:
+                intersection = [w for w in tokens if w in self.stop_words]
+            results.append(
+                WordStats(
+                    stop_word_count=len(intersection),
+                    word_count=len(tokens),
+                    stop_words=intersection,
+                )
+            )
+        return results
+
+
+_stopwords_registry: dict[str, StopWords] = {}
+_stopwords_lock = threading.Lock()
+
+
+def get_stopwords(language: str = "en") -> StopWords:
+    """Returns the :any:`StopWords` instance of `language`, shared by the
+    whole process. It is created (with the language tokenizer loaded) on
+    the first call for the language. Do not modify it.
+
+    Args:
+        language (str): The language code. Defaults to "en" (English).
+
+    Raises:
+        FileNotFoundError: if there are no stopwords for the language
+
+    Returns:
+        StopWords: the stop words and tokenizer for the language
+    """
+    stopwords = _stopwords_registry.get(language)
+    if stopwords is None:
+        with _stopwords_lock:
+            stopwords = _stopwords_registry.get(language)
+            if stopwords is None:
+                stopwords = StopWords(language)
+                _stopwords_registry[language] = stopwords
+    return stopwords
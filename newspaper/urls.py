@@ -10,8 +10,6 @@
 import re
 from urllib.parse import parse_qs, urljoin, urlparse
 
-from tldextract import tldextract
-
 log = logging.getLogger(__name__)
 
 
@@ -98,6 +96,22 @@
 ]
 
 
+def extract_tld(url: str):
+    """Splits the url host in subdomain, domain and suffix with
+    ``tldextract.extract``. tldextract is slow to import, so it is only
+    imported on first use.
+
+    Args:
+        url (str): the url
+
+    Returns:
+        tldextract.ExtractResult: the parts of the host
+    """
+    import tldextract  # pylint: disable=import-outside-toplevel
+
+    return tldextract.extract(url)
+
+
 def redirect_back(url: str, source_domain: str) -> str:
     """Some sites like Pinterest have api's that cause news
     args to direct to their site with the real news url as a
@@ -238,7 +252,7 @@ def valid_url(url: str, test: bool = False) -> bool:
         path_chunks.remove("index")
 
     # extract the tld (top level domain)
-    tld_dat = tldextract.extract(url)
+    tld_dat = extract_tld(url)
     subd = tld_dat.subdomain
     tld = tld_dat.domain.lower()
 
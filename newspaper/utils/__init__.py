@@ -10,8 +10,6 @@
 import sys
 import time
 
-from bs4 import BeautifulSoup
-
 from newspaper import settings
 from newspaper.languages import get_available_languages, valid_languages
 
@@ -42,6 +40,8 @@ def extract_meta_refresh(html):
         ct=ga&cd=CAAYATIaYTc4ZTgzYjAwOTAwY2M4Yjpjb206ZW46VVM&
         usg=AFQjCNF7zAl6JPuEsV4PbEzBomJTUpX4Lg
     """
+    from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
+
     soup = BeautifulSoup(html, "html.parser")
     element = soup.find("meta", attrs={"http-equiv": "refresh"})
     if element:
@@ -106,6 +106,7 @@ def memorize_articles(source, articles):
         valid_urls = valid_urls[: source.config.max_file_memo]
         log.warning("Source %s: memorization file overflow, truncating", source.domain)
 
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
     with open(cache_file, "w", encoding="utf-8") as f:
         f.writelines([x + "\n" for x in valid_urls if x])
 
@@ -160,16 +161,17 @@ def show(j):
     print("\n", flush=True, file=out)
 
 
-def print_node_tree(node, header="", last=True, with_gravity=True):
+def print_node_tree(node, header="", last=True, with_gravity=True, scores=None):
     """Prints out the html node tree for nodes with gravity scores
-    debugging method
+    debugging method. `scores` is the :any:`ScoreTable` of the parse
+    (e.g. ``article.extractor.scores``).
     """
     elbow = "└──"
     pipe = "│  "
     tee = "├──"
-    if not with_gravity or node.get("gravityScore"):
+    if not with_gravity or (scores is not None and scores.has_gravity_score(node)):
         node_attribs = {k: node.attrib.get(k) for k in ["class", "id"] if node.attrib.get(k)}
-        score = float(node.get("gravityScore", 0))
+        score = scores.gravity_score(node) if scores is not None else 0.0
         print(header + (elbow if last else tee) + node.tag + f"({score:0.1f}) {node_attribs}")
         blank = "   "
     else:
@@ -177,7 +179,13 @@ def print_node_tree(node, header="", last=True, with_gravity=True):
 
     children = list(node.iterchildren())
     for i, c in enumerate(children):
-        print_node_tree(c, header=header + (blank if last else pipe), last=i == len(children) - 1)
+        print_node_tree(
+            c,
+            header=header + (blank if last else pipe),
+            last=i == len(children) - 1,
+            with_gravity=with_gravity,
+            scores=scores,
+        )
 
 
 __all__ = [
@@ -76,6 +76,7 @@ def inner_function(*args, **kwargs):
             # call the decorated function...
             result = target_function(*args, **kwargs)
             # ... and save the cached object for next time
+            filepath.parent.mkdir(parents=True, exist_ok=True)
             with open(filepath, "wb") as f:
                 pickle.dump(result, f)
 
@@ -7,7 +7,8 @@
 
 class TestNetwork:
     def test_detect_cloudflair(self, cloudflair_sites):
-        network.session = requests.Session()
+        network.session_pool.factory = requests.Session
+        network.reset_session()
         for exc, url in cloudflair_sites:
             with pytest.raises(ArticleException) as e:
                 _ = article(url)
@@ -1,3 +1,6 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
 from tests import conftest
@@ -155,3 +158,47 @@ def mock_request_func(url, text, status_code):
         return mocker.patch("newspaper.network.do_request", return_value=MockResponse(url, text, status_code))
 
     return mock_request_func
+
+
+@pytest.fixture
+def http_server():
+    """Local http server for tests that need real sockets.
+    Register responses with ``server.routes[path] = (status, headers, body)``,
+    and build urls with ``server.url(path)``. The requests received are
+    logged in ``server.requests`` as (method, path, headers) tuples.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            server.requests.append((self.command, self.path, dict(self.headers)))
+            route = server.routes.get(self.path)
+            if callable(route):
+                route = route(self)
+            status, headers, body = route or (404, {"Content-Type": "text/html"}, b"<html>Not found</html>")
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        do_GET = _respond
+        do_HEAD = _respond
+        do_POST = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.routes = {}
+    server.requests = []
+    server.url = lambda path: f"http://127.0.0.1:{server.server_address[1]}{path}"
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -3,13 +3,14 @@
 import pickle
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 from dateutil.parser import parse as date_parser
 
 import newspaper
 from newspaper import urls
-from newspaper.article import Article, ArticleDownloadState, ArticleException
+from newspaper.article import EXTRACTION_FIELDS, Article, ArticleDownloadState, ArticleException, extraction_steps
 from newspaper.configuration import Configuration
 
 
@@ -189,3 +190,109 @@ def test_pickle(self, cnn_article):
 
         article_ = pickle.load(bytes_io)
         assert article == article_
+
+    def test_parse_selected_fields(self, cnn_article):
+        full = newspaper.Article(cnn_article["url"], fetch_images=False)
+        full.download(input_html=cnn_article["html_content"])
+        full.parse()
+
+        triage = newspaper.Article(cnn_article["url"], fetch_images=False)
+        triage.download(input_html=cnn_article["html_content"])
+        triage.parse(fields=["title", "publish_date", "canonical_link"])
+        assert triage.is_parsed
+        assert triage.title == full.title
+        assert triage.publish_date == full.publish_date
+        assert triage.canonical_link == full.canonical_link
+        assert triage.authors == []
+        assert triage.top_node is None
+        assert triage.text == ""
+
+        config = Configuration()
+        config.fetch_images = False
+        config.extract_fields = ["text"]
+        text_only = newspaper.Article(cnn_article["url"], config=config)
+        text_only.download(input_html=cnn_article["html_content"])
+        text_only.parse()
+        assert text_only.text == full.text
+        assert text_only.article_html == full.article_html
+        assert text_only.authors == []
+        assert text_only.movies == []
+
+        with pytest.raises(ValueError, match="nonexistent"):
+            text_only.parse(fields=["title", "nonexistent"])
+
+    def test_extraction_steps(self):
+        config = Configuration()
+        assert extraction_steps(None, config) == set(EXTRACTION_FIELDS.values())
+        assert extraction_steps(["canonical_link"], config) == {"metadata"}
+        assert extraction_steps("text", config) == {"text", "title", "body", "metadata"}
+        assert extraction_steps(["meta_img"], config) == {"images", "body", "metadata"}
+        config.fetch_images = False
+        config.language = "en"
+        assert extraction_steps(["meta_img"], config) == {"images"}
+        assert extraction_steps(["movies"], config) == {"videos", "body"}
+
+    def test_lazy_parse(self, cnn_article):
+        full = newspaper.Article(cnn_article["url"], fetch_images=False)
+        full.download(input_html=cnn_article["html_content"])
+        full.parse()
+
+        lazy = newspaper.Article(cnn_article["url"], fetch_images=False, lazy_parse=True)
+        lazy.download(input_html=cnn_article["html_content"])
+        lazy.parse()
+        assert lazy.is_parsed
+        assert lazy.doc is not None
+        assert lazy._pending_steps == set(EXTRACTION_FIELDS.values())
+
+        assert lazy.publish_date == full.publish_date
+        assert lazy._pending_steps == set(EXTRACTION_FIELDS.values()) - {"publish_date"}
+        assert lazy.text == full.text
+        assert "authors" in lazy._pending_steps
+        assert lazy.authors == full.authors
+        assert lazy.movies == full.movies
+        assert lazy.to_json(as_string=False) == full.to_json(as_string=False)
+        assert not lazy._pending_steps
+
+        # pickling extracts the pending attributes
+        lazy = newspaper.Article(cnn_article["url"], fetch_images=False)
+        lazy.download(input_html=cnn_article["html_content"])
+        lazy.parse(lazy=True)
+        assert pickle.loads(pickle.dumps(lazy)) == full
+
+        with pytest.raises(AttributeError):
+            lazy.nonexistent  # noqa: B018
+
+    def test_parse_after_lazy_parse(self, cnn_article, monkeypatch):
+        article = newspaper.Article(cnn_article["url"], fetch_images=False)
+        article.download(input_html=cnn_article["html_content"])
+        article.parse(lazy=True)
+        article.parse(fields=["title"])
+        assert article.title
+        assert article.authors == []
+        assert article.publish_date is None
+        assert article.top_image == ""
+        assert article.movies == []
+
+        # a failed step stays pending
+        article.parse(lazy=True)
+        monkeypatch.setattr(article.extractor, "get_authors", Mock(side_effect=ValueError))
+        with pytest.raises(ValueError):
+            article.authors  # noqa: B018
+        assert "authors" in article._pending_steps
+        monkeypatch.undo()
+        assert article.authors
+
+    def test_parse_does_not_modify_the_dom(self, cnn_article):
+        config = Configuration()
+        config.fetch_images = False
+        config.clean_article_html = False
+        article = newspaper.article(cnn_article["url"], input_html=cnn_article["html_content"], config=config)
+
+        scoring_attributes = ["gravityScore", "gravityNodes", "stop_words", "word_count", "node_level"]
+        for attr in scoring_attributes:
+            assert not article.doc.xpath(f"//*[@{attr}]")
+            assert attr not in article.article_html
+
+        scores = article.extractor.scores
+        assert scores.gravity_score(article.top_node) > 0
+        assert scores.get(article.top_node).gravity_nodes > 0
@@ -1,9 +1,14 @@
+import copy
+from pathlib import Path
+
 import pytest
+from lxml import etree
 
 import newspaper
 from newspaper import parsers
 from newspaper.cleaners import DocumentCleaner
 from newspaper.outputformatters import OutputFormatter
+from tests.conftest import get_data
 
 
 @pytest.fixture
@@ -182,3 +187,36 @@ def test_remove_captions(self, get_cleaner):
         assert "A victim injured in the attack" not in text, "DocCleaner failed to remove caption"
         assert "Naif Rahma/Reuters" not in text, "DocCleaner failed to remove caption"
         assert text == "his is a test his is a test his is a test his is a test"
+
+    @pytest.mark.parametrize(
+        "filename", sorted(p.stem for p in (Path(__file__).parent.parent / "data" / "html").glob("*.html"))
+    )
+    def test_clean_matches_stepwise(self, get_cleaner, filename):
+        doc = parsers.fromstring(get_data(filename, "html"))
+        expected = get_cleaner.clean_stepwise(copy.deepcopy(doc))
+        cleaned = get_cleaner.clean(copy.deepcopy(doc))
+
+        assert etree.tostring(cleaned) == etree.tostring(expected)
+
+    def test_clean_keeps_article_containers(self, get_cleaner):
+        html = """
+            <html>
+            <body class="footer">
+                <div class="footer"><div id="comments"><article><p>Kept</p></article></div></div>
+                <div class="footer"><div id="comments" itemprop="articleBody"><p>Gone</p></div></div>
+                <div id="sidebar-tools"><p>Also gone</p></div>
+                <p><em class="byline">Dropped</em> tag, <span><span>nested</span></span></p>
+                <figure><img src="a.jpg"><figcaption>Caption</figcaption></figure>
+            </body>
+            </html>
+        """
+        doc = parsers.fromstring(html)
+        expected = get_cleaner.clean_stepwise(copy.deepcopy(doc))
+        cleaned = get_cleaner.clean(doc)
+
+        assert etree.tostring(cleaned) == etree.tostring(expected)
+        text = parsers.get_text(cleaned)
+        assert "Kept" in text
+        assert "Gone" not in text
+        assert "Dropped tag" in text
+        assert len(cleaned.xpath("//img")) == 1
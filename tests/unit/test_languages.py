@@ -5,7 +5,7 @@
 from newspaper.configuration import Configuration
 from newspaper.extractors.metadata_extractor import MetadataExtractor
 from newspaper.languages import ISO639_3_TO_1, normalize_language_code
-from newspaper.text import StopWords
+from newspaper.text import StopWords, default_batch_tokenizer, default_tokenizer, get_stopwords
 from tests import conftest
 
 
@@ -89,6 +89,44 @@ def test_stopwords_with_kurdish_iso639_3_codes(self):
         assert stopwords_ku.stop_words == stopwords_kmr.stop_words
         assert len(stopwords_ku.stop_words) > 0
 
+    def test_shared_stopwords(self):
+        stopwords = get_stopwords("en")
+        assert get_stopwords("en") is stopwords
+        assert get_stopwords("ja") is not stopwords
+        assert get_stopwords("ckb").stop_words == StopWords("ku").stop_words
+        assert get_stopwords().stop_words == StopWords("en").stop_words
+        with pytest.raises(FileNotFoundError):
+            get_stopwords("zz")
+
+    def test_highlink_density_reuses_stopwords(self, monkeypatch):
+        get_stopwords("en")
+        monkeypatch.setattr("newspaper.text.StopWords", None)
+        node = parsers.fromstring("<div>Some text <a href='/a'>a link</a> and <a href='/b'>another</a></div>")
+        assert not parsers.is_highlink_density(node, "en")
+
+    def test_batch_tokenizer(self):
+        texts = [
+            "'Don't' stop -- the rock'n'roll!",
+            "",
+            "‘quoted’ words, ʼtwo'' seps",
+            b"bytes text",
+            "Contains the \x00 batch separator",
+            "trailing dash-\n",
+        ]
+        expected = [default_tokenizer(text) for text in texts]
+        assert default_batch_tokenizer(texts) == expected
+        assert default_batch_tokenizer(texts[:4]) == expected[:4]
+        assert default_batch_tokenizer([]) == []
+
+        stopwords = get_stopwords("en")
+        assert stopwords.tokenize_batch(texts) == expected
+        assert stopwords.get_stopword_counts(texts) == [stopwords.get_stopword_count(text) for text in texts]
+        ja = get_stopwords("ja")
+        assert ja.get_stopword_counts(["", "日本語の文章です"]) == [
+            ja.get_stopword_count(""),
+            ja.get_stopword_count("日本語の文章です"),
+        ]
+
     def test_metadata_extractor_kurdish_language_detection(self):
         """Test that MetadataExtractor correctly detects Kurdish ISO 639-3 codes"""
         config = Configuration()
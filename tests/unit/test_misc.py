@@ -1,4 +1,9 @@
+import subprocess
+import sys
+import unicodedata
+
 import newspaper
+from newspaper import settings, text
 
 
 def test_popular_urls():
@@ -9,3 +14,19 @@ def test_popular_urls():
 def test_languages():
     language_list = newspaper.valid_languages()
     assert len(language_list) > 20
+
+
+def test_heavy_dependencies_are_imported_lazily():
+    lazy_modules = ["nltk", "PIL", "bs4", "feedparser", "tldextract", "dateutil", "numpy"]
+    code = f"import sys, newspaper; print([m for m in {lazy_modules!r} if m in sys.modules])"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_punctuation_table():
+    assert "!" in text.punctuation
+    assert "。" in text.punctuation  # ideographic full stop
+    assert "'" not in text.punctuation
+    assert "word, other.".translate(text.punctuation_table) == "word  other "
+    if unicodedata.unidata_version in settings.PUNCTUATION_FILE.read_text(encoding="utf-8").splitlines()[0]:
+        assert text.compute_punctuation() == text.punctuation
@@ -2,13 +2,15 @@
 
 """
 
+import logging
 from unittest.mock import Mock, patch
 
 import pytest
 
+from newspaper.article import Article, ArticleDownloadState
 from newspaper.configuration import Configuration
-from newspaper.exceptions import ArticleException
-from newspaper.network import get_html
+from newspaper.exceptions import ArticleBinaryDataException, ArticleException
+from newspaper.network import do_request, get_html, is_truncated
 
 
 class TestNetwork:
@@ -76,3 +78,102 @@ def test_get_html_exception_different_status_codes(self):
                 assert str(status_code) in exception_message, (
                     f"Expected '{status_code}' to be in exception message, but got: {exception_message}"
                 )
+
+    def test_article_download_logs_bad_status(self, http_server, caplog):
+        http_server.routes["/gone"] = (410, {"Content-Type": "text/html"}, "<html>Gone</html>")
+        article = Article(http_server.url("/gone"), fetch_images=False)
+
+        with caplog.at_level(logging.WARNING, logger="newspaper.network"):
+            article.download()
+
+        assert "bad status code 410" in caplog.text
+        assert article.download_state == ArticleDownloadState.FAILED_RESPONSE
+
+
+class TestBinarySniffing:
+    """do_request detects binary content in the same round trip as the download."""
+
+    def test_single_request_for_html(self, http_server):
+        body = "<html><body>" + "<p>text</p>" * 1000 + "</body></html>"
+        http_server.routes["/article.html"] = (200, {"Content-Type": "text/html"}, body)
+
+        response = do_request(http_server.url("/article.html"), Configuration())
+
+        assert response.text == body
+        assert [(method, path) for method, path, _ in http_server.requests] == [("GET", "/article.html")]
+
+    def test_binary_content_type(self, http_server):
+        http_server.routes["/movie.mp4"] = (200, {"Content-Type": "video/mp4"}, b"\x00" * 5000)
+
+        with pytest.raises(ArticleBinaryDataException):
+            do_request(http_server.url("/movie.mp4"), Configuration())
+        assert len(http_server.requests) == 1
+
+    def test_binary_content_sniffed(self, http_server):
+        http_server.routes["/file"] = (200, {"Content-Type": "text/plain"}, bytes(range(256)) * 20)
+
+        with pytest.raises(ArticleBinaryDataException):
+            do_request(http_server.url("/file"), Configuration())
+
+        config = Configuration()
+        config.allow_binary_content = True
+        response = do_request(http_server.url("/file"), config)
+        assert response.content == bytes(range(256)) * 20
+
+    def test_error_status_is_not_sniffed(self, http_server):
+        http_server.routes["/missing"] = (404, {"Content-Type": "text/plain"}, bytes(range(256)))
+
+        response = do_request(http_server.url("/missing"), Configuration())
+        assert response.status_code == 404
+        assert response.content == bytes(range(256))
+
+    def test_ignored_content_type(self, http_server):
+        http_server.routes["/feed.json"] = (200, {"Content-Type": "application/json"}, '{"a": 1}')
+
+        config = Configuration()
+        config.ignored_content_types_defaults = {"application/json": "ignored"}
+        html = get_html(http_server.url("/feed.json"), config)
+        assert html == "ignored"
+
+
+class TestMaxContentBytes:
+    """Downloads stop at Configuration.max_content_bytes."""
+
+    BODY = "<html><head><title>Live blog</title></head><body>" + "<p>An update on the live blog.</p>" * 5000
+
+    def test_body_is_truncated(self, http_server):
+        http_server.routes["/live"] = (200, {"Content-Type": "text/html"}, self.BODY)
+        config = Configuration()
+        config.max_content_bytes = 10_000
+
+        response = do_request(http_server.url("/live"), config)
+
+        assert is_truncated(response)
+        assert response.content == self.BODY.encode("utf-8")[:10_000]
+
+    def test_small_body_is_not_truncated(self, http_server):
+        http_server.routes["/live"] = (200, {"Content-Type": "text/html"}, self.BODY)
+        config = Configuration()
+        config.max_content_bytes = len(self.BODY)
+        config.allow_binary_content = True
+
+        response = do_request(http_server.url("/live"), config)
+
+        assert not is_truncated(response)
+        assert response.text == self.BODY
+
+    def test_article_is_marked_truncated(self, http_server):
+        http_server.routes["/live"] = (200, {"Content-Type": "text/html"}, self.BODY)
+        article = Article(http_server.url("/live"), max_content_bytes=10_000, fetch_images=False)
+
+        article.download()
+        article.parse()
+
+        assert article.is_truncated
+        assert article.downloaded_bytes == 10_000
+        assert article.title == "Live blog"
+
+        article = Article(http_server.url("/live"), fetch_images=False)
+        article.download()
+        assert not article.is_truncated
+        assert article.downloaded_bytes == len(self.BODY)
@@ -0,0 +1,130 @@
+"""Unit tests for the record / replay http archive."""
+
+import pytest
+
+from newspaper import network
+from newspaper.article import Article, ArticleDownloadState
+from newspaper.configuration import Configuration
+from newspaper.exceptions import ArchiveMissException
+from newspaper.network_archive import HttpArchive, get_archive
+from newspaper.source import Source
+
+HTML_HEADERS = {"Content-Type": "text/html; charset=utf-8"}
+
+HOMEPAGE = """<html><head><title>Local news</title></head><body>
+<a href="/2024/01/02/first-story.html">A first story about something important</a>
+<a href="/2024/01/03/second-story.html">A second story about something else</a>
+</body></html>"""
+
+ARTICLE = """<html><head><title>A first story</title></head><body><article>
+<h1>A first story</h1>
+<p>This is the body of the first story. It is long enough to be the article body,
+it has several sentences and some words. The archive should give it back as is.</p>
+</article></body></html>"""
+
+
+@pytest.fixture
+def news_server(http_server):
+    http_server.routes["/"] = (200, HTML_HEADERS, HOMEPAGE)
+    http_server.routes["/2024/01/02/first-story.html"] = (200, HTML_HEADERS, ARTICLE)
+    http_server.routes["/old-story"] = (301, {"Location": "/2024/01/02/first-story.html"}, b"")
+    return http_server
+
+
+def make_config(path, mode):
+    config = Configuration()
+    config.http_archive_mode = mode
+    config.http_archive_path = str(path)
+    config.disable_category_cache = True
+    config.memoize_articles = False
+    config.fetch_images = False
+    return config
+
+
+class TestHttpArchive:
+    def test_record_and_load(self, tmp_path, news_server):
+        archive = HttpArchive(tmp_path)
+        response = network.do_request(news_server.url("/old-story"), Configuration())
+        archive.record(news_server.url("/old-story"), response)
+        archive.close()
+
+        reopened = HttpArchive(tmp_path)
+        assert len(reopened) == 1
+        record = reopened.load(news_server.url("/old-story"))
+        assert record["status"] == 200
+        assert record["final_url"] == news_server.url("/2024/01/02/first-story.html")
+        assert record["body"] == ARTICLE.encode("utf-8")
+        assert record["history"][0]["status"] == 301
+        assert reopened.load(news_server.url("/old-story"), method="post") is None
+
+    def test_last_record_wins(self, tmp_path, news_server):
+        archive = HttpArchive(tmp_path)
+        url = news_server.url("/")
+        archive.record(url, network.do_request(url, Configuration()))
+        news_server.routes["/"] = (200, HTML_HEADERS, "<html>changed</html>")
+        archive.record(url, network.do_request(url, Configuration()))
+
+        assert len(archive) == 1
+        assert HttpArchive(tmp_path).load(url)["body"] == b"<html>changed</html>"
+
+    def test_post_data_is_part_of_the_key(self):
+        assert HttpArchive.make_key("http://a.com/", "post", "a=1") != HttpArchive.make_key(
+            "http://a.com/", "post", "a=2"
+        )
+
+    def test_unknown_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            get_archive(make_config(tmp_path, "rewind"))
+
+
+class TestRecordReplay:
+    def test_do_request(self, tmp_path, news_server):
+        url = news_server.url("/old-story")
+        recorded = network.do_request(url, make_config(tmp_path, "record"))
+        requests_made = len(news_server.requests)
+
+        replayed = network.do_request(url, make_config(tmp_path, "replay"))
+
+        assert len(news_server.requests) == requests_made
+        assert replayed.status_code == recorded.status_code
+        assert replayed.url == recorded.url
+        assert replayed.text == recorded.text
+        assert [r.url for r in replayed.history] == [r.url for r in recorded.history]
+
+    def test_replay_miss(self, tmp_path, news_server):
+        with pytest.raises(ArchiveMissException):
+            network.do_request(news_server.url("/"), make_config(tmp_path, "replay"))
+        assert not news_server.requests
+
+        article = Article(news_server.url("/"), config=make_config(tmp_path, "replay"))
+        article.download()
+        assert article.download_state == ArticleDownloadState.FAILED_RESPONSE
+
+    def test_article_download(self, tmp_path, news_server):
+        url = news_server.url("/2024/01/02/first-story.html")
+        recorded = Article(url, config=make_config(tmp_path, "record"))
+        recorded.download()
+        recorded.parse()
+        requests_made = len(news_server.requests)
+
+        replayed = Article(url, config=make_config(tmp_path, "replay"))
+        replayed.download()
+        replayed.parse()
+
+        assert len(news_server.requests) == requests_made
+        assert replayed.html == recorded.html
+        assert replayed.text == recorded.text
+
+    def test_source_build(self, tmp_path, news_server):
+        recorded = Source(news_server.url("/"), config=make_config(tmp_path, "record"))
+        recorded.build()
+        requests_made = len(news_server.requests)
+        assert requests_made > 1
+
+        replayed = Source(news_server.url("/"), config=make_config(tmp_path, "replay"))
+        replayed.build()
+
+        assert len(news_server.requests) == requests_made
+        assert replayed.html == recorded.html
+        assert recorded.articles
+        assert [a.url for a in replayed.articles] == [a.url for a in recorded.articles]
@@ -0,0 +1,125 @@
+"""Unit tests for the asyncio download engine."""
+
+import asyncio
+
+import pytest
+
+from newspaper import network
+from newspaper.article import Article, ArticleDownloadState
+from newspaper.configuration import Configuration
+from newspaper.exceptions import ArticleBinaryDataException
+from newspaper.network_hooks import local_hook
+from newspaper.source import Source
+from tests import conftest
+
+pytest.importorskip("aiohttp")
+
+HTML_HEADERS = {"Content-Type": "text/html; charset=utf-8"}
+
+
+@pytest.fixture
+def article_server(http_server):
+    html = conftest.get_data("cnn_article", "html")
+    http_server.routes["/article.html"] = (200, HTML_HEADERS, html)
+    http_server.routes["/redirect"] = (302, {"Location": "/article.html"}, b"")
+    http_server.routes["/missing.html"] = (404, HTML_HEADERS, "<html><body>gone</body></html>")
+    http_server.routes["/file.bin"] = (200, {"Content-Type": "application/octet-stream"}, bytes(range(256)) * 8)
+    return http_server
+
+
+class TestAsyncNetwork:
+    def test_ado_request(self, article_server):
+        config = Configuration()
+        response = asyncio.run(network.ado_request(article_server.url("/article.html"), config))
+        assert response.status_code == 200
+        assert response.headers["content-type"] == HTML_HEADERS["Content-Type"]
+        assert response.text == conftest.get_data("cnn_article", "html")
+
+    def test_ado_request_redirect_history(self, article_server):
+        response = asyncio.run(network.ado_request(article_server.url("/redirect"), Configuration()))
+        assert response.status_code == 200
+        assert response.url == article_server.url("/article.html")
+        assert [r.url for r in response.history] == [article_server.url("/redirect")]
+
+    def test_ado_request_binary(self, article_server):
+        with pytest.raises(ArticleBinaryDataException):
+            asyncio.run(network.ado_request(article_server.url("/file.bin"), Configuration()))
+
+        config = Configuration()
+        config.allow_binary_content = True
+        response = asyncio.run(network.ado_request(article_server.url("/file.bin"), config))
+        assert len(response.content) == 256 * 8
+
+    def test_ado_request_hooks(self, article_server):
+        events = []
+
+        def before(url, config, *args, **kwargs):
+            events.append(("before", url))
+            return True
+
+        def after(url, config, *args, **kwargs):
+            events.append(("after", url))
+
+        url = article_server.url("/article.html")
+        with local_hook("before_request", before), local_hook("after_response", after):
+            asyncio.run(network.ado_request(url, Configuration()))
+
+        assert events == [("before", url), ("after", url)]
+
+    def test_ado_request_hook_cancels(self, article_server):
+        with local_hook("before_request", lambda url, config, *args, **kwargs: False):
+            response = asyncio.run(network.ado_request(article_server.url("/article.html"), Configuration()))
+        assert response is None
+        assert not article_server.requests
+
+    def test_amultithread_request(self, article_server):
+        urls = [
+            article_server.url("/article.html"),
+            article_server.url("/missing.html"),
+            "http://127.0.0.1:1/unreachable",
+        ]
+        responses = asyncio.run(network.amultithread_request(urls, Configuration()))
+        assert responses[0].status_code == 200
+        assert responses[1].status_code == 404
+        assert responses[2] is None
+
+
+class TestAsyncArticle:
+    def test_adownload_same_as_download(self, article_server):
+        url = article_server.url("/redirect")
+        sync_article = Article(url, fetch_images=False)
+        sync_article.download()
+        async_article = Article(url, fetch_images=False)
+        asyncio.run(async_article.adownload())
+
+        assert async_article.download_state == ArticleDownloadState.SUCCESS
+        assert async_article.html == sync_article.html
+        assert async_article.history == sync_article.history
+
+        sync_article.parse()
+        async_article.parse()
+        assert async_article == sync_article
+
+    def test_adownload_failed(self, article_server):
+        article = Article(article_server.url("/missing.html"))
+        asyncio.run(article.adownload())
+        assert article.download_state == ArticleDownloadState.FAILED_RESPONSE
+        assert "404" in article.download_exception_msg
+
+    def test_source_adownload_articles(self, article_server):
+        source = Source(article_server.url("/"))
+        source.articles = [
+            Article(url=article_server.url("/article.html")),
+            Article(url=article_server.url("/missing.html")),
+        ]
+        asyncio.run(source.adownload_articles())
+
+        assert source.is_downloaded
+        assert source.articles[0].html == conftest.get_data("cnn_article", "html")
+        assert source.articles[1].html == ""
+
+    def test_adownload_max_content_bytes(self, article_server):
+        article = Article(article_server.url("/article.html"), max_content_bytes=5000)
+        asyncio.run(article.adownload())
+        assert article.is_truncated
+        assert article.downloaded_bytes == 5000
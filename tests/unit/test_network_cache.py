@@ -0,0 +1,196 @@
+"""Unit tests for the host capability cache."""
+
+import threading
+import time
+
+import pytest
+
+from newspaper import network
+from newspaper.configuration import Configuration
+from newspaper.exceptions import ArticleBinaryDataException
+from newspaper.network_cache import ConditionalRequestCache, HostCapabilityCache, get_host_key
+
+
+@pytest.fixture
+def clean_host_cache():
+    network.host_cache.clear()
+    yield network.host_cache
+    network.host_cache.clear()
+
+
+class TestHostCapabilityCache:
+    def test_get_set(self):
+        cache = HostCapabilityCache()
+        assert cache.get(HostCapabilityCache.RANGES, "cnn.com") is None
+        cache.set(HostCapabilityCache.RANGES, "cnn.com", True)
+        assert cache.get(HostCapabilityCache.RANGES, "cnn.com") is True
+        assert cache.get(HostCapabilityCache.BINARY, "cnn.com") is None
+
+    def test_lru_bound(self):
+        cache = HostCapabilityCache(max_entries=2)
+        cache.set("kind", "a", 1)
+        cache.set("kind", "b", 2)
+        cache.get("kind", "a")
+        cache.set("kind", "c", 3)
+        assert len(cache) == 2
+        assert cache.get("kind", "a") == 1
+        assert cache.get("kind", "b") is None
+
+    def test_ttl(self):
+        cache = HostCapabilityCache(ttl=0.05)
+        cache.set("kind", "a", 1)
+        cache.set("kind", "b", 2, ttl=60)
+        time.sleep(0.1)
+        assert cache.get("kind", "a") is None
+        assert cache.get("kind", "b") == 2
+
+    def test_get_or_set(self):
+        cache = HostCapabilityCache()
+        calls = []
+        for _ in range(3):
+            assert cache.get_or_set("kind", "a", lambda: calls.append(1) or False) is False
+        assert len(calls) == 1
+
+    def test_concurrent_access(self):
+        cache = HostCapabilityCache(max_entries=50)
+
+        def worker(n):
+            for i in range(200):
+                cache.set("kind", f"{n}-{i}", i)
+                cache.get("kind", f"{n}-{i - 1}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(cache) == 50
+
+    def test_persistence(self, tmp_path):
+        path = tmp_path / "hosts.json"
+        cache = HostCapabilityCache(path=path)
+        cache.set(HostCapabilityCache.RANGES, "cnn.com", True)
+        cache.set(HostCapabilityCache.ROBOTS, "http://cnn.com/robots.txt", "User-agent: *")
+        cache.set("kind", "expired", 1, ttl=-1)
+        cache.save()
+
+        restored = HostCapabilityCache(path=path)
+        assert restored.get(HostCapabilityCache.RANGES, "cnn.com") is True
+        assert restored.get(HostCapabilityCache.ROBOTS, "http://cnn.com/robots.txt") == "User-agent: *"
+        assert restored.get("kind", "expired") is None
+
+    def test_host_key(self):
+        assert get_host_key("https://edition.cnn.com/world") == "cnn.com"
+        assert get_host_key("http://www.bbc.co.uk/news") == "bbc.co.uk"
+
+
+class TestNetworkUsesHostCache:
+    def test_binary_url_is_remembered(self, http_server, clean_host_cache):
+        http_server.routes["/movie.mp4"] = (200, {"Content-Type": "video/mp4"}, b"\x00" * 100)
+        url = http_server.url("/movie.mp4")
+
+        for _ in range(2):
+            with pytest.raises(ArticleBinaryDataException):
+                network.do_request(url, Configuration())
+
+        assert len(http_server.requests) == 1
+        assert network.is_binary_url(url)
+
+    def test_redirect_is_remembered(self, http_server, clean_host_cache):
+        http_server.routes["/old"] = (301, {"Location": "/new"}, b"")
+        http_server.routes["/new"] = (200, {"Content-Type": "text/html"}, "<html></html>")
+
+        network.do_request(http_server.url("/old"), Configuration())
+
+        assert clean_host_cache.get(HostCapabilityCache.REDIRECT, http_server.url("/old")) == http_server.url("/new")
+
+    def test_has_get_ranges_probes_once_per_domain(self, http_server, clean_host_cache):
+        http_server.routes["/a"] = (200, {"Accept-Ranges": "bytes"}, "")
+        http_server.routes["/b"] = (200, {"Accept-Ranges": "bytes"}, "")
+
+        assert network.has_get_ranges(http_server.url("/a"))
+        assert network.has_get_ranges(http_server.url("/b"))
+        assert len(http_server.requests) == 1
+
+    def test_deprecated_do_cache(self, clean_host_cache):
+        calls = []
+
+        def probe(url):
+            calls.append(url)
+            return len(calls)
+
+        with pytest.deprecated_call():
+            cached_probe = network.do_cache(probe)
+
+        assert cached_probe("https://www.cnn.com/a") == 1
+        assert cached_probe(url="https://edition.cnn.com/b") == 1
+        assert cached_probe("https://www.bbc.com/") == 2
+        assert clean_host_cache.get("probe", get_host_key("https://www.cnn.com/")) == 1
+
+
+@pytest.fixture
+def conditional_cache(tmp_path, monkeypatch):
+    cache = ConditionalRequestCache(tmp_path / "http_cache")
+    monkeypatch.setattr(network, "conditional_cache", cache)
+    return cache
+
+
+class TestConditionalRequests:
+    @staticmethod
+    def etag_route(body):
+        def route(handler):
+            if handler.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+            return 200, {"Content-Type": "text/html", "ETag": '"v1"'}, body
+
+        return route
+
+    def test_not_modified_uses_cache(self, http_server, clean_host_cache, conditional_cache):
+        body = "<html><body>unchanged</body></html>"
+        http_server.routes["/page"] = self.etag_route(body)
+        config = Configuration()
+        config.conditional_requests = True
+
+        first = network.do_request(http_server.url("/page"), config)
+        second = network.do_request(http_server.url("/page"), config)
+
+        assert second.status_code == 200
+        assert second.text == first.text == body
+        assert second.url == http_server.url("/page")
+        assert http_server.requests[1][2].get("If-None-Match") == '"v1"'
+        assert conditional_cache.stats() == {"hits": 1, "misses": 1, "bytes_saved": len(body)}
+
+    def test_last_modified(self, http_server, clean_host_cache, conditional_cache):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+        def route(handler):
+            if handler.headers.get("If-Modified-Since") == last_modified:
+                return 304, {}, b""
+            return 200, {"Content-Type": "text/html", "Last-Modified": last_modified}, "<html></html>"
+
+        http_server.routes["/page"] = route
+        config = Configuration()
+        config.conditional_requests = True
+
+        for _ in range(3):
+            assert network.get_html(http_server.url("/page"), config) == "<html></html>"
+        assert conditional_cache.stats()["hits"] == 2
+
+    def test_disabled_by_default(self, http_server, clean_host_cache, conditional_cache):
+        http_server.routes["/page"] = self.etag_route("<html></html>")
+
+        network.do_request(http_server.url("/page"), Configuration())
+        network.do_request(http_server.url("/page"), Configuration())
+
+        assert "If-None-Match" not in http_server.requests[1][2]
+        assert conditional_cache.stats()["misses"] == 0
+
+    def test_no_validators_not_stored(self, tmp_path):
+        cache = ConditionalRequestCache(tmp_path)
+        cache.store("http://a.com/", "http://a.com/", {"Content-Type": "text/html"}, b"<html></html>")
+        assert cache.load("http://a.com/") is None
+
+        cache.store("http://a.com/", "http://a.com/", {"ETag": "x", "Content-Encoding": "gzip"}, b"<html></html>")
+        entry = cache.load("http://a.com/")
+        assert cache.validators(entry) == {"If-None-Match": "x"}
+        assert "Content-Encoding" not in entry["headers"]
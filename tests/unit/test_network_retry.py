@@ -0,0 +1,233 @@
+"""Unit tests for the retry policy and the circuit breaker."""
+
+import asyncio
+import os
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from newspaper import network
+from newspaper.configuration import Configuration
+from newspaper.exceptions import CircuitOpenException
+from newspaper.network_retry import CircuitBreaker, RetryPolicy, circuit_breaker, parse_retry_after
+
+UNREACHABLE_URL = "http://127.0.0.1:1/article.html"
+
+
+@pytest.fixture(autouse=True)
+def clean_circuit_breaker():
+    circuit_breaker.reset()
+    yield circuit_breaker
+    circuit_breaker.reset()
+
+
+def flaky_route(failures, status=503, headers=None):
+    """Route that fails `failures` times before returning a page"""
+    calls = []
+
+    def route(handler):
+        calls.append(1)
+        if len(calls) <= failures:
+            return status, headers or {}, "<html>try again</html>"
+        return 200, {"Content-Type": "text/html"}, "<html>ok</html>"
+
+    return route
+
+
+def dropped_body_route(failures):
+    """Route that closes the connection in the middle of the body `failures` times"""
+    calls = []
+
+    def route(handler):
+        calls.append(1)
+        if len(calls) <= failures:
+            handler.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nContent-Length: 1000\r\n\r\n<html>")
+            handler.wfile = open(os.devnull, "wb")  # noqa: SIM115
+            handler.close_connection = True
+        return 200, {"Content-Type": "text/html"}, "<html>ok</html>"
+
+    return route
+
+
+def redirect_loop_route(handler):
+    return 302, {"Location": "/loop"}, ""
+
+
+def retry_config(max_retries=2, **kwargs):
+    config = Configuration()
+    config.retry_settings = {"max_retries": max_retries, "backoff_factor": 0.01, **kwargs}
+    return config
+
+
+class TestRetryPolicy:
+    def test_should_retry(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry(0)
+        assert policy.should_retry(1, 503)
+        assert not policy.should_retry(1, 404)
+        assert not policy.should_retry(2, 503)
+
+    def test_backoff_with_jitter(self):
+        policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+        for attempt in range(5):
+            assert 0 <= policy.delay(attempt) <= min(2**attempt, 5)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(backoff_max=10)
+        assert policy.delay(0, "3") == 3
+        assert policy.delay(0, "120") == 10
+        assert parse_retry_after(formatdate(time.time() + 5, usegmt=True)) == pytest.approx(5, abs=1.5)
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
+
+    def test_from_config(self):
+        policy = RetryPolicy.from_config(retry_config(max_retries=5, status_codes=[503]))
+        assert policy.max_retries == 5
+        assert policy.status_codes == {503}
+        assert policy.backoff_max == 30
+
+
+class TestRetries:
+    def test_status_is_retried(self, http_server):
+        http_server.routes["/page"] = flaky_route(2)
+
+        response = network.do_request(http_server.url("/page"), retry_config())
+
+        assert response.status_code == 200
+        assert response.text == "<html>ok</html>"
+        assert len(http_server.requests) == 3
+
+    def test_gives_up_after_max_retries(self, http_server):
+        http_server.routes["/page"] = flaky_route(5)
+
+        response = network.do_request(http_server.url("/page"), retry_config())
+
+        assert response.status_code == 503
+        assert len(http_server.requests) == 3
+
+    def test_no_retries_by_default(self, http_server):
+        http_server.routes["/page"] = flaky_route(1)
+
+        assert network.do_request(http_server.url("/page"), Configuration()).status_code == 503
+        assert len(http_server.requests) == 1
+
+    def test_retry_after_is_honored(self, http_server):
+        http_server.routes["/page"] = flaky_route(1, status=429, headers={"Retry-After": "1"})
+
+        start = time.monotonic()
+        response = network.do_request(http_server.url("/page"), retry_config(backoff_max=0.2))
+
+        assert response.status_code == 200
+        assert 0.2 <= time.monotonic() - start < 1
+
+    def test_dropped_body_is_retried(self, http_server):
+        http_server.routes["/page"] = dropped_body_route(1)
+
+        response = network.do_request(http_server.url("/page"), retry_config())
+
+        assert response.status_code == 200
+        assert response.text == "<html>ok</html>"
+        assert len(http_server.requests) == 2
+
+    def test_async_dropped_body_is_retried(self, http_server):
+        pytest.importorskip("aiohttp")
+        http_server.routes["/page"] = dropped_body_route(1)
+
+        response = asyncio.run(network.ado_request(http_server.url("/page"), retry_config()))
+
+        assert response.text == "<html>ok</html>"
+        assert len(http_server.requests) == 2
+
+    def test_async_status_is_retried(self, http_server):
+        pytest.importorskip("aiohttp")
+        http_server.routes["/page"] = flaky_route(2)
+
+        response = asyncio.run(network.ado_request(http_server.url("/page"), retry_config()))
+
+        assert response.status_code == 200
+        assert len(http_server.requests) == 3
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        config = Configuration()
+        config.circuit_breaker_settings = {"failure_threshold": 2, "reset_timeout": 60}
+
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                network.do_request(UNREACHABLE_URL, config)
+
+        with pytest.raises(CircuitOpenException):
+            network.do_request(UNREACHABLE_URL, config)
+        assert network.multithread_request([UNREACHABLE_URL] * 3, config) == [None] * 3
+
+    def test_success_resets_the_count(self):
+        breaker = CircuitBreaker()
+        config = Configuration()
+        config.circuit_breaker_settings = {"failure_threshold": 2}
+
+        breaker.record_failure("a.com", config)
+        breaker.record_success("a.com")
+        breaker.record_failure("a.com", config)
+        breaker.check("a.com", config)
+        breaker.record_failure("a.com", config)
+        with pytest.raises(CircuitOpenException):
+            breaker.check("a.com", config)
+
+    def test_half_open_after_reset_timeout(self):
+        breaker = CircuitBreaker()
+        config = Configuration()
+        config.circuit_breaker_settings = {"failure_threshold": 1, "reset_timeout": 0.05}
+        breaker.record_failure("a.com", config)
+        time.sleep(0.06)
+
+        breaker.check("a.com", config)  # the trial request
+        with pytest.raises(CircuitOpenException):
+            breaker.check("a.com", config)
+
+        breaker.record_failure("a.com", config)
+        assert breaker.is_open("a.com")
+        time.sleep(0.06)
+        breaker.check("a.com", config)
+        breaker.record_success("a.com")
+        assert not breaker.is_open("a.com")
+        breaker.check("a.com", config)
+
+    def test_disabled_by_default(self):
+        for _ in range(3):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                network.do_request(UNREACHABLE_URL, Configuration())
+
+    def test_failed_trial_releases_the_circuit(self, http_server):
+        http_server.routes["/loop"] = redirect_loop_route
+        url = http_server.url("/loop")
+        config = Configuration()
+        config.circuit_breaker_settings = {"failure_threshold": 1, "reset_timeout": 0.05}
+        circuit_breaker.record_failure(network.get_host_key(url), config)
+
+        for _ in range(2):
+            time.sleep(0.06)
+            with pytest.raises(requests.exceptions.TooManyRedirects):
+                network.do_request(url, config)  # the trial request
+            assert circuit_breaker.is_open(network.get_host_key(url))
+
+        http_server.routes["/loop"] = (200, {"Content-Type": "text/html"}, "<html>ok</html>")
+        time.sleep(0.06)
+        assert network.do_request(url, config).status_code == 200
+        assert not circuit_breaker.is_open(network.get_host_key(url))
+
+    def test_async_failed_trial_releases_the_circuit(self, http_server):
+        pytest.importorskip("aiohttp")
+        http_server.routes["/loop"] = redirect_loop_route
+        url = http_server.url("/loop")
+        config = Configuration()
+        config.circuit_breaker_settings = {"failure_threshold": 1, "reset_timeout": 0.05}
+        circuit_breaker.record_failure(network.get_host_key(url), config)
+
+        for _ in range(2):
+            time.sleep(0.06)
+            with pytest.raises(requests.exceptions.TooManyRedirects):
+                asyncio.run(network.ado_request(url, config))
+            assert circuit_breaker.is_open(network.get_host_key(url))
@@ -0,0 +1,185 @@
+"""Unit tests for the per-host politeness scheduler."""
+
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+import requests
+
+from newspaper import network
+from newspaper.article import Article
+from newspaper.configuration import Configuration
+from newspaper.network_hooks import local_hook
+from newspaper.network_scheduler import HostLimiter, HostLimits, HostScheduler, TokenBucket
+from newspaper.source import Source
+
+
+def make_urls(hosts, count):
+    return [f"http://{host}/article{i}.html" for i in range(count) for host in hosts]
+
+
+class ConcurrencyProbe:
+    """Callable that records the maximum number of simultaneous calls per host"""
+
+    def __init__(self, duration=0.02):
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.current = defaultdict(int)
+        self.maximum = defaultdict(int)
+        self.calls = []
+
+    def __call__(self, url):
+        host = url.split("/")[2]
+        with self.lock:
+            self.current[host] += 1
+            self.maximum[host] = max(self.maximum[host], self.current[host])
+            self.calls.append((time.monotonic(), host))
+        time.sleep(self.duration)
+        with self.lock:
+            self.current[host] -= 1
+        return url
+
+
+class TestTokenBucket:
+    def test_consume_and_refill(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        now = bucket.timestamp
+        assert bucket.consume(now)
+        assert bucket.consume(now)
+        assert not bucket.consume(now)
+        assert abs(bucket.delay(now) - 0.1) < 1e-6
+        assert bucket.consume(now + 0.11)
+
+
+class TestHostScheduler:
+    def test_all_urls_are_processed(self):
+        config = Configuration()
+        urls = make_urls(["a.com", "b.com", "c.com"], 5)
+        results = {idx: future.result() for idx, future in HostScheduler(config, HostLimiter()).run(str, urls)}
+        assert [results[i] for i in range(len(urls))] == urls
+
+    def test_max_connections_per_host(self):
+        config = Configuration()
+        config.number_threads = 8
+        config.max_connections_per_host = 2
+        config.host_limits = {"b.com": {"max_connections": 1}}
+        probe = ConcurrencyProbe()
+        urls = make_urls(["a.com", "b.com"], 6)
+
+        list(HostScheduler(config, HostLimiter()).run(probe, urls))
+
+        assert probe.maximum["a.com"] == 2
+        assert probe.maximum["b.com"] == 1
+
+    def test_unknown_host_limit(self):
+        config = Configuration()
+        config.host_limits = {"b.com": {"max_conections": 1}}
+        scheduler = HostScheduler(config, HostLimiter())
+
+        assert scheduler.limits_for("a.com") == HostLimits(
+            config.max_connections_per_host, config.requests_per_second_per_host
+        )
+        with pytest.raises(ValueError, match="max_conections"):
+            scheduler.limits_for("b.com")
+
+    def test_other_hosts_keep_the_pool_busy(self):
+        config = Configuration()
+        config.number_threads = 4
+        config.max_connections_per_host = 1
+        probe = ConcurrencyProbe()
+        # one slow host with many urls, and some other hosts
+        urls = make_urls(["slow.com"], 8) + make_urls(["a.com", "b.com", "c.com"], 2)
+
+        list(HostScheduler(config, HostLimiter()).run(probe, urls))
+
+        first_batch = {host for _, host in probe.calls[:4]}
+        assert first_batch == {"slow.com", "a.com", "b.com", "c.com"}
+
+    def test_requests_per_second(self):
+        config = Configuration()
+        config.requests_per_second_per_host = 20
+        probe = ConcurrencyProbe(duration=0)
+        urls = make_urls(["a.com"], 5)
+
+        start = time.monotonic()
+        list(HostScheduler(config, HostLimiter()).run(probe, urls))
+        elapsed = time.monotonic() - start
+
+        # first request is immediate, the next 4 are spaced by 1/20 s
+        assert elapsed >= 0.19
+
+    def test_queue_depth_hook(self):
+        config = Configuration()
+        depths = defaultdict(list)
+
+        def hook(url, config, host=None, queue_depth=None, in_flight=None):
+            depths[host].append(queue_depth)
+
+        with local_hook("host_queue", hook):
+            list(HostScheduler(config, HostLimiter()).run(str, make_urls(["a.com", "b.com"], 3)))
+
+        assert depths["a.com"] == [3, 2, 1, 0]
+        assert depths["b.com"] == [3, 2, 1, 0]
+
+
+def test_multithread_request_keeps_order(mocker):
+    def fake_request(url, config):
+        time.sleep(0.05 if "slow" in url else 0)
+        return url
+
+    mocker.patch("newspaper.network.do_request", side_effect=fake_request)
+    urls = ["http://slow.com/1", "http://fast.com/1", "http://fast.com/2"]
+
+    assert network.multithread_request(urls, Configuration()) == urls
+
+
+def test_multithread_request_iter_completion_order(mocker):
+    def fake_request(url, config):
+        time.sleep(0.2 if "slow" in url else 0)
+        if "error" in url:
+            raise requests.exceptions.ConnectionError("refused")
+        return url
+
+    mocker.patch("newspaper.network.do_request", side_effect=fake_request)
+    urls = ["http://slow.com/1", "http://fast.com/1", "http://error.com/1", "http://fast.com/2"]
+
+    results = list(network.multithread_request_iter(urls, Configuration()))
+
+    assert results[-1] == ("http://slow.com/1", "http://slow.com/1")
+    assert {url for url, _ in results} == set(urls)
+    errors = [result for url, result in results if url == "http://error.com/1"]
+    assert isinstance(errors[0], requests.exceptions.ConnectionError)
+
+
+def test_max_in_flight_window():
+    config = Configuration()
+    config.number_threads = 8
+    started = []
+    urls = make_urls(["a.com", "b.com", "c.com", "d.com"], 4)
+
+    def fn(url):
+        started.append(url)
+        return url
+
+    results = HostScheduler(config, HostLimiter()).run(fn, urls, max_in_flight=2)
+    next(results)
+    time.sleep(0.05)
+    # nothing else is started until the consumer asks for the next result
+    assert len(started) == 2
+    assert len(list(results)) == len(urls) - 1
+
+
+def test_source_download_articles_in_completion_order(http_server):
+    http_server.routes["/slow.html"] = lambda handler: time.sleep(0.2) or (200, {}, "<html>slow</html>")
+    http_server.routes["/fast.html"] = (200, {}, "<html>fast</html>")
+    source = Source(http_server.url("/"), number_threads=2)
+    source.articles = [
+        Article(http_server.url("/slow.html")),
+        Article(http_server.url("/fast.html")),
+        Article(http_server.url("/missing.html")),
+    ]
+
+    articles = source.download_articles()
+
+    assert [a.html for a in articles] == ["<html>slow</html>", "<html>fast</html>", ""]
@@ -0,0 +1,59 @@
+"""Unit tests for the http session pool."""
+
+import threading
+
+import requests
+
+from newspaper import network
+from newspaper.configuration import Configuration
+from newspaper.network import SessionPool
+
+
+def make_config(**kwargs):
+    config = Configuration()
+    for key, value in kwargs.items():
+        setattr(config, key, value)
+    return config
+
+
+class TestSessionPool:
+    def test_sessions_are_shared_by_pool_size(self):
+        pool = SessionPool(requests.Session)
+        assert pool.get(make_config()) is pool.get(make_config())
+        assert pool.get(make_config()) is pool.get()
+        assert pool.get(make_config(number_threads=50)) is not pool.get()
+
+    def test_pool_scales_with_threads(self):
+        pool = SessionPool(requests.Session)
+        adapter = pool.get(make_config(number_threads=50)).get_adapter("https://cnn.com")
+        assert adapter._pool_maxsize == 50
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 50
+
+        adapter = pool.get(make_config(number_threads=50, max_connections_per_host=4)).get_adapter("http://cnn.com")
+        assert adapter._pool_maxsize == 4
+
+    def test_clear(self):
+        pool = SessionPool(requests.Session)
+        sess = pool.get()
+        pool.clear()
+        assert pool.get() is not sess
+
+
+def test_headers_are_sent_per_request(http_server):
+    configs = [Configuration() for _ in range(8)]
+    for i, config in enumerate(configs):
+        config.requests_params["headers"] = {"User-Agent": f"agent-{i}"}
+        http_server.routes[f"/page{i}"] = (200, {"Content-Type": "text/html"}, "<html></html>")
+
+    threads = [
+        threading.Thread(target=network.do_request, args=(http_server.url(f"/page{i}"), config))
+        for i, config in enumerate(configs)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    received = {path: headers["User-Agent"] for _, path, headers in http_server.requests}
+    assert received == {f"/page{i}": f"agent-{i}" for i in range(8)}
+    assert not network.session.headers["User-Agent"].startswith("agent-")
@@ -1,6 +1,8 @@
+import pytest
+
 import newspaper
 from newspaper import nlp
-from newspaper.text import StopWords
+from newspaper.text import StopWords, default_tokenizer
 
 
 class TestNLP:
@@ -32,3 +34,93 @@ def test_summarize(self, cnn_article_with_nlp):
         summary = nlp.summarize(title, text, stopwords)
 
         assert summary == cnn_article_with_nlp.get("summary")
+
+    def test_scored_sentences(self, cnn_article_with_nlp):
+        text = cnn_article_with_nlp.get("text_content")
+        sentences = [s.strip() for s in text.split(".") if s.strip()]
+        stopwords = StopWords("en")
+        title_words = stopwords.tokenizer(cnn_article_with_nlp.get("title"))
+        keywords = nlp.keywords(text, stopwords, 10)
+
+        ranks = nlp.scored_sentences(sentences, title_words, keywords, stopwords)
+        assert sorted(i for i, _, _ in ranks) == list(range(len(sentences)))
+
+        # the same scores with the sentences tokenized one by one (the
+        # batch tokenizer is only used for default_tokenizer itself)
+        unbatched = StopWords("en")
+        unbatched.tokenizer = lambda s: default_tokenizer(s)
+        assert nlp.scored_sentences(sentences, title_words, keywords, unbatched) == ranks
+
+    def test_scored_sentences_numpy(self, cnn_article_with_nlp):
+        pytest.importorskip("numpy")
+        text = cnn_article_with_nlp.get("text_content")
+        # a long article, with repeated (equally scored) sentences
+        sentences = [s.strip() for s in text.split(".") if s.strip()] * 3 + ["", "..."]
+        stopwords = StopWords("en")
+        title_words = stopwords.tokenizer(cnn_article_with_nlp.get("title"))
+        keywords = nlp.keywords(text, stopwords, 10)
+
+        expected = nlp.scored_sentences(sentences, title_words, keywords, stopwords, use_numpy=False)
+        ranks = nlp.scored_sentences_numpy(sentences, title_words, keywords, stopwords)
+        assert [r[:2] for r in ranks] == [r[:2] for r in expected]
+        assert [r[2] for r in ranks] == pytest.approx([r[2] for r in expected])
+        assert nlp.scored_sentences(sentences, title_words, keywords, stopwords) == ranks
+
+        assert nlp.scored_sentences_numpy([], title_words, keywords, stopwords) == []
+        assert nlp.scored_sentences_numpy(sentences[:2], [], {}, stopwords) == nlp.scored_sentences(
+            sentences[:2], [], {}, stopwords
+        )
+        # no sentence has a token
+        no_tokens = ["\u2014"] * 25
+        assert nlp.scored_sentences_numpy(no_tokens, ["cat"], {"cat": 1.0}, stopwords) == pytest.approx(
+            nlp.scored_sentences(no_tokens, ["cat"], {"cat": 1.0}, stopwords, use_numpy=False)
+        )
+
+    def test_batch_keywords(self, tmp_path):
+        stopwords = StopWords("en")
+        texts = [
+            "The storm hit the coast. The storm moved north.",
+            "The election results came in. The storm delayed the count.",
+            "The market rallied after the election.",
+            "",
+        ]
+        document_frequencies = nlp.DocumentFrequencies()
+        keywords = nlp.batch_keywords(texts, stopwords, document_frequencies, max_keywords=3)
+        assert document_frequencies.document_count == 3
+        assert document_frequencies.frequencies["storm"] == 2
+        assert list(keywords[0]) == ["storm", "hit", "coast"]
+        # "election" is in two texts, "market" in one
+        assert keywords[2]["market"] > keywords[2]["election"]
+        assert keywords[3] == {}
+
+        path = tmp_path / "df" / "frequencies.json.gz"
+        document_frequencies.save(path)
+        loaded = nlp.DocumentFrequencies.load(path)
+        assert loaded.document_count == 3
+        assert loaded.frequencies == document_frequencies.frequencies
+        assert nlp.DocumentFrequencies.load(tmp_path / "missing.json.gz").document_count == 0
+
+        # the statistics are incremental
+        nlp.batch_keywords(texts[:1], stopwords, loaded)
+        assert loaded.document_count == 4
+        assert loaded.idf("storm") < document_frequencies.idf("storm")
+
+    def test_batch_nlp(self, cnn_article, tmp_path):
+        paragraph = "The market rallied after the election results. " * 20
+        htmls = [cnn_article["html_content"], f"<html><body><article><p>{paragraph}</p></article></body></html>"]
+        articles = [newspaper.article(cnn_article["url"], input_html=html, fetch_images=False) for html in htmls]
+
+        path = tmp_path / "frequencies.json.gz"
+        document_frequencies = nlp.batch_nlp(articles, path, processes=1, summaries=False)
+        assert document_frequencies.document_count == 2
+        assert nlp.DocumentFrequencies.load(path).document_count == 2
+        keywords = [article.keywords for article in articles]
+        assert all(keywords)
+        assert articles[0].keyword_scores[keywords[0][0]] >= articles[0].keyword_scores[keywords[0][-1]]
+        assert len(keywords[0]) == articles[0].config.max_keywords
+
+        nlp.batch_nlp(articles, processes=2, summaries=False)
+        assert [article.keywords for article in articles] == keywords
+
+        with pytest.raises(newspaper.ArticleException):
+            nlp.batch_nlp([newspaper.Article(cnn_article["url"])])
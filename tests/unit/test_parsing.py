@@ -1,10 +1,17 @@
+import copy
+import pickle
 import re
+from concurrent.futures import ThreadPoolExecutor
 
+import pytest
+
+import newspaper
 from newspaper import parsers
 from newspaper.configuration import Configuration
-from newspaper.extractors import ContentExtractor
+from newspaper.extractors import ContentExtractor, ExtractorPool
+from newspaper.text import StopWords
 from newspaper.urls import STRICT_DATE_REGEX, prepare_url
-from tests.conftest import get_url_filecontent
+from tests.conftest import get_data, get_url_filecontent
 
 
 class TestExtractor:
@@ -29,8 +36,8 @@ def test_meta_image_extraction(self, meta_image_fixture):
 
         for html, expected in meta_image_fixture:
             doc = parsers.fromstring(html)
-            extractor.image_extractor.parse(doc, None, "http://www.test.com")
-            assert extractor.image_extractor.meta_image == expected
+            images = extractor.image_extractor.parse(doc, None, "http://www.test.com")
+            assert images.meta_image == expected
 
     def test_pubdate(self):
         # not a real test... we test the regex??
@@ -42,3 +49,274 @@ def test_pubdate(self):
     def test_prepare_url(self):
         for real, url, source in get_url_filecontent("test_prepare_urls.txt"):
             assert real == prepare_url(url, source)
+
+
+class TestDocumentFeatures:
+    HTML = """<html><body><div id="main">
+        <p>This is the <b>first</b> paragraph of the article, with some words.</p>
+        <!-- comment text --> tail of the comment
+        <script>var notText = "it is not text";</script>
+        <p>Read <a href="/a">the other story</a> and <a href="/b"></a> or <button>this</button>.</p>
+        <select><option>an option</option></select>
+        <ul><li><a href="/1">Link one</a></li><li><a href="/2">Link two</a></li></ul>
+    </div></body></html>"""
+
+    def check_document(self, doc, language):
+        stopwords = StopWords(language)
+        features = parsers.DocumentFeatures(doc, stopwords)
+        for node in doc.iter():
+            if not isinstance(node.tag, str):
+                continue
+            text = parsers.get_text(node)
+            word_stats = stopwords.get_stopword_count(text)
+            node_features = features[node]
+            assert node_features.level == parsers.get_level(node)
+            assert node_features.text_length == len(text)
+            assert node_features.word_count == word_stats.word_count
+            assert node_features.stop_word_count == word_stats.stop_word_count
+            assert node_features.is_highlink_density == parsers.is_highlink_density(node, language)
+
+    def test_same_as_get_text(self):
+        self.check_document(parsers.fromstring(self.HTML), "en")
+
+    def test_test_data(self):
+        for filename, language in [("cnn_article", "en"), ("spanish_article", "es"), ("japanese_article", "ja")]:
+            self.check_document(parsers.fromstring(get_data(filename, "html")), language)
+
+    def test_link_counts(self):
+        doc = parsers.fromstring(self.HTML)
+        features = parsers.DocumentFeatures(doc, StopWords("en"))
+        paragraph = doc.xpath("//p")[1]
+        assert features[paragraph].link_count == 3
+        # the empty link counts as one word
+        assert features[paragraph].link_word_count == 5
+        assert features[doc.xpath("//ul")[0]].is_highlink_density
+        assert features.get(parsers.fromstring("<p>detached</p>")) is None
+
+
+class TestGetText:
+    HTML = """<div>Some <b>bold</b> text<!-- a comment --> comment tail
+        <script>var x = 1;</script> script tail <time>today</time> time tail
+        <select><option>option</option></select><p>last  paragraph</p></div>"""
+
+    def test_excluded_elements(self):
+        node = parsers.fromstring(self.HTML)
+        assert parsers.get_text(node) == "Some bold text today time tail last paragraph"
+        assert list(parsers.iter_text(node))[:3] == ["Some ", "bold", " text"]
+        # the tree is not modified
+        assert len(node.xpath("//script")) == 1
+
+    def test_custom_exclude(self):
+        node = parsers.fromstring(self.HTML)
+        exclude = (*parsers.TEXT_EXCLUDED_TAGS, "time")
+        assert parsers.get_text(node, exclude=exclude) == "Some bold text last paragraph"
+
+    def test_root_is_not_excluded(self):
+        node = parsers.fromstring(self.HTML).xpath("//script")[0]
+        assert parsers.get_text(node) == "var x = 1;"
+
+    def test_memo(self):
+        node = parsers.fromstring(self.HTML)
+        memo = {}
+        text = parsers.get_text(node, memo=memo)
+        assert memo == {node: text}
+        memo[node] = "cached"
+        assert parsers.get_text(node, memo=memo) == "cached"
+
+
+class TestScoreTable:
+    def test_scores(self):
+        doc = parsers.fromstring("<div><p>one</p><p>two</p></div>")
+        first, second = doc.xpath("//p")
+        scores = parsers.ScoreTable()
+        scores.node(first).gravity_score = 0.0
+        scores.node(first).stop_words = 3
+
+        assert scores.has_gravity_score(first)
+        assert not scores.has_gravity_score(second)
+        assert scores.gravity_score(second) == 0.0
+        assert scores.stop_words(first) == 3
+        assert scores.get(second) is None
+        assert not doc.xpath("//*[@gravityScore]")
+
+    def test_copy(self):
+        doc = parsers.fromstring("<div><p>one<!-- comment --></p><p>two</p></div>")
+        scores = parsers.ScoreTable()
+        scores.node(doc).gravity_score = 5.0
+        scores.node(doc.xpath("//p")[1]).gravity_score = 2.5
+
+        doc_copy = scores.copy(doc)
+        assert doc_copy is not doc
+        assert scores.gravity_score(doc_copy) == 5.0
+        assert scores.gravity_score(doc_copy.xpath("//p")[1]) == 2.5
+        assert not scores.has_gravity_score(doc_copy.xpath("//p")[0])
+
+        scores.node(doc_copy).gravity_score = 1.0
+        assert scores.gravity_score(doc) == 5.0
+
+    def test_deprecated_get_node_gravity_score(self):
+        doc = parsers.fromstring("<div><p>one</p><p>two</p></div>")
+        first, second = doc.xpath("//p")
+        first.set("gravityScore", "3.5")
+        scores = parsers.ScoreTable()
+        scores.node(second).gravity_score = 2.0
+
+        with pytest.deprecated_call():
+            assert parsers.get_node_gravity_score(first) == 3.5
+        with pytest.deprecated_call():
+            assert parsers.get_node_gravity_score(second, scores) == 2.0
+
+
+class TestXPathCache:
+    HTML = """<html><head><meta name="author" content="Jane Doe"></head>
+        <body><div class="Article-Body">text</div><div id="story_1">story</div></body></html>"""
+
+    def test_selectors_are_compiled_once(self):
+        doc = parsers.fromstring(self.HTML)
+
+        def query():
+            return (
+                parsers.get_tags(
+                    doc, tag="div", attribs={"class": "article"}, attribs_match="word", ignore_dashes=True
+                ),
+                parsers.get_tags_regex(doc, tag="div", attribs={"id": "story_[0-9]"}),
+                parsers.get_metatags(doc, value="author"),
+            )
+
+        first = query()
+        compilations = parsers.xpath_compilations()
+        assert query() == first
+        assert parsers.xpath_compilations() == compilations
+        assert [len(result) for result in first] == [1, 1, 1]
+
+
+class TestDocumentIndex:
+    HTML = """<html><head>
+        <meta name="author" content="Jane Doe"><meta property="og:title" content="Title">
+        <meta name="Description" property="og:description" content="Desc">
+        <link rel="Shortcut Icon" href="/favicon.ico"><link rel="image_src" href="/a.jpg">
+        <script type="application/LD+json">{"@type": "NewsArticle", "author": {"name": "Jane Doe"}}</script>
+        <script type="application/ld+json">[{"@type": "VideoObject"}, "not a dict"]</script>
+        <script type="application/ld+json">not json</script>
+        </head>
+        <body><div class="Article-Body">text</div><div id="story_1" class="byline">story</div>
+        <span itemprop="AUTHOR">John Smith</span><img src="a.jpg"><img src="b.jpg"></body></html>"""
+
+    def check_same_results(self, doc):
+        index = parsers.DocumentIndex(doc)
+        queries = [
+            {"tag": "div"},
+            {"tag": "img"},
+            {"attribs": {"itemprop": "author"}},
+            {"attribs": {"class": "byline"}},
+            {"tag": "meta", "attribs": {"name": "description"}},
+            {"tag": "link", "attribs": {"rel": "icon"}, "attribs_match": "substring"},
+            {"tag": "div", "attribs": {"class": "article"}, "attribs_match": "word", "ignore_dashes": True},
+            {"tag": "div", "attribs": {"id": "story"}, "attribs_match": "word", "ignore_dashes": True},
+            {"tag": "script", "attribs": {"type": "application/ld+json"}},
+        ]
+        for query in queries:
+            assert index.get_tags(**query) == parsers.get_tags(doc, **query), query
+        for query in [
+            {"tag": "div", "attribs": {"class": "paragraph"}},
+            {"tag": "link", "attribs": {"rel": "image_src|img_src"}},
+        ]:
+            assert index.get_tags_regex(**query) == parsers.get_tags_regex(doc, **query), query
+        for value in ["author", "og:title", "Description", "og:description", "description", None]:
+            assert index.get_metatags(value) == parsers.get_metatags(doc, value), value
+        assert index.get_ld_json_object() == parsers.get_ld_json_object(doc)
+
+    def test_same_as_functions(self):
+        self.check_same_results(parsers.fromstring(self.HTML))
+
+    def test_test_data(self):
+        for filename in ["cnn_article", "spanish_article", "japanese_article", "wired_main_site"]:
+            self.check_same_results(parsers.fromstring(get_data(filename, "html")))
+
+    def test_ld_json_is_parsed_once(self):
+        index = parsers.DocumentIndex(parsers.fromstring(self.HTML))
+        ld_json = index.get_ld_json_object()
+        assert [item["@type"] for item in ld_json] == ["NewsArticle", "VideoObject"]
+        assert index.get_ld_json_object() is ld_json
+
+    def test_shared_by_the_extractors(self):
+        doc = parsers.fromstring(self.HTML)
+        extractor = ContentExtractor(Configuration())
+        index = extractor.index_document(doc)
+        assert extractor._get_index(doc) is index
+        assert extractor._get_index(parsers.fromstring(self.HTML)) is not index
+        assert extractor.get_authors(doc) == ["Jane Doe", "John Smith"]
+
+    def test_ld_json_size_limit(self):
+        doc = parsers.fromstring(self.HTML)
+        assert parsers.DocumentIndex(doc, max_ld_json_size=50).get_ld_json_object() == [{"@type": "VideoObject"}]
+        assert len(parsers.DocumentIndex(doc, max_ld_json_size=None).get_ld_json_object()) == 2
+        assert parsers.get_ld_json_object(doc, max_size=10) == []
+
+
+class TestExtractorPool:
+    def test_one_pool_per_configuration(self):
+        config = Configuration()
+        pool = ContentExtractor(config).pool
+        assert ExtractorPool.get(config) is pool
+        assert ContentExtractor(config).title_extractor is pool.title_extractor
+        assert ContentExtractor(Configuration()).pool is not pool
+        assert ExtractorPool.get(copy.copy(config)) is not pool
+        assert pickle.loads(pickle.dumps(config))._extractor_pool is None
+
+    def test_results_are_not_shared(self):
+        extractor = ContentExtractor(Configuration())
+        first = extractor.get_metadata("http://www.example.com", parsers.fromstring(TestDocumentIndex.HTML))
+        second = extractor.get_metadata("http://www.example.com", parsers.fromstring("<html></html>"))
+        assert first["description"] == "Desc"
+        assert second["description"] == ""
+
+    def test_parse_from_threads(self):
+        config = Configuration()
+        config.language = "en"
+        config.fetch_images = False
+        pages = [get_data(name, "html") for name in ["cnn_article", "wired_main_site"]]
+
+        def parse(html):
+            article = newspaper.Article("http://www.example.com/article.html", config=config)
+            article.download(input_html=html)
+            article.parse()
+            return article.title, article.text, article.authors, article.top_image
+
+        expected = [parse(html) for html in pages]
+        with ThreadPoolExecutor(4) as executor:
+            assert list(executor.map(parse, pages * 4)) == expected * 4
+
+    def test_mixed_languages_from_threads(self):
+        pages = [
+            get_data(name, "html")
+            for name in ["spanish_article", "japanese_article", "arabic_article", "thai_article", "cnn_article"]
+        ]
+
+        def new_config():
+            config = Configuration()
+            config.fetch_images = False
+            return config
+
+        def parse(html, config):
+            article = newspaper.Article("http://www.example.com/article.html", config=config)
+            article.download(input_html=html)
+            article.parse()
+            return article.language, article.title, article.text
+
+        # each article with its own configuration, then all of them sharing one
+        expected = [parse(html, new_config()) for html in pages]
+        assert [result[0] for result in expected] == ["es", "ja", "ar", "th", "en"]
+        config = new_config()
+        with ThreadPoolExecutor(4) as executor:
+            assert list(executor.map(parse, pages * 4, [config] * 20)) == expected * 4
+        assert config.use_meta_language
+        assert config.language == "en"
+
+
+def test_load_json():
+    assert parsers.load_json('{"a": [1, 2.5, "x", null]}') == {"a": [1, 2.5, "x", None]}
+    # accepted by the standard library, even if orjson is installed
+    assert parsers.load_json('{"a": NaN, "b": 123456789012345678901234567890}')["b"] == 123456789012345678901234567890
+    with pytest.raises(ValueError):
+        parsers.load_json("not json")
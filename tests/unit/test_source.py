@@ -2,8 +2,10 @@
 from types import ModuleType
 
 import pytest
+import requests
 
 from newspaper import Article, Source
+from newspaper.exceptions import ArticleBinaryDataException
 from newspaper.source import Category, Feed, RobotsException
 
 
@@ -125,6 +127,19 @@ def test_source_download_articles(mocker, mock_request):
     assert mock_r.call_count == 2
 
 
+def test_source_download_articles_errors(mocker):
+    source = Source("http://example.com")
+    source.articles = [Article(url="http://example.com/article1")]
+
+    mocker.patch("newspaper.network.do_request", side_effect=requests.exceptions.ConnectionError("refused"))
+    source.download_articles()
+    assert source.articles[0].html == ""
+
+    mocker.patch("newspaper.network.do_request", side_effect=ArticleBinaryDataException("binary"))
+    with pytest.raises(ArticleBinaryDataException):
+        source.download_articles()
+
+
 def test_source_parse_articles(mocker):
     source = Source("http://example.com")
     article1 = Article(url="http://example.com/article1")